@@ -1,9 +1,11 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from trading_bots.api.routes import balance_routes
 from trading_bots.api.routes import signal_routes
 from trading_bots.api.routes import bot_routes
 from jwt_middleware import jwt_middleware
+from market_signal_service.infrastructure.metrics.metrics_registry import MetricsRegistry, get_metrics_registry
 
 
 app = FastAPI(
@@ -67,6 +69,10 @@ async def health_check():
         }
     }
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(get_metrics_registry().render(), media_type=MetricsRegistry.CONTENT_TYPE)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
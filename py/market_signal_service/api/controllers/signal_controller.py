@@ -1,7 +1,13 @@
 from fastapi import HTTPException
-from market_signal_service.api.schemas.signal_request import SignalRequest
-from market_signal_service.api.schemas.signal_response import SignalResponse
+from pydantic import ValidationError
+from typing import AsyncIterator, List
+from market_signal_service.api.schemas.signal_request import SignalRequest, BatchSignalItem, MultiTimeframeSignalRequest, ConsensusSignalRequest
+from market_signal_service.api.schemas.signal_response import SignalResponse, MultiTimeframeSignalResponse, ConsensusSignalResponse
 from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.domain.services.signal_stream_service import SignalStreamService
+from market_signal_service.core.serialization import json_dumps
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.metrics.pipeline_metrics import PipelineMetrics
 from market_signal_service.core.exceptions import NoDataError, ExchangeError, InvalidSymbolError
 from market_signal_service.infrastructure.logging.logger import get_logger
 
@@ -10,37 +16,201 @@ logger = get_logger(__name__)
 class SignalController:
     def __init__(self):
         self.signal_service = SignalService()
+        self.signal_stream_service = SignalStreamService(self.signal_service)
     
     async def get_signal(self, symbol: str, timeframe: str, exchange: str):
+        with PipelineMetrics.REQUEST.time():
+            try:
+                request = SignalRequest(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    exchange=exchange
+                )
+                
+                result = await self.signal_service.get_market_signal(
+                    symbol=request.symbol,
+                    timeframe=request.timeframe,
+                    exchange=request.exchange
+                )
+                
+                with PipelineMetrics.SERIALIZATION.time():
+                    payload = SignalResponse.payload(result)
+                
+                PipelineMetrics.REQUESTS.labels(endpoint='signal', status=200).inc()
+                return payload
+            
+            except Exception as e:
+                status_code, detail = self._error_response(e)
+                PipelineMetrics.REQUESTS.labels(endpoint='signal', status=status_code).inc()
+                raise HTTPException(status_code=status_code, detail=detail)
+    
+    async def get_signals_batch(self, items: List[BatchSignalItem]) -> dict:
+        results = [None] * len(items)
+        requests = []
+        positions = []
+        
+        for position, item in enumerate(items):
+            try:
+                request = SignalRequest(**item.dict())
+            except ValidationError as e:
+                results[position] = self._batch_error(item.symbol, item.timeframe, item.exchange, e)
+                continue
+            
+            requests.append({
+                'symbol': request.symbol,
+                'timeframe': request.timeframe,
+                'exchange': request.exchange,
+                'limit': request.limit
+            })
+            positions.append(position)
+        
+        outcomes = await self.signal_service.get_market_signals(requests)
+        
+        for position, request, outcome in zip(positions, requests, outcomes):
+            if isinstance(outcome, Exception):
+                results[position] = self._batch_error(request['symbol'], request['timeframe'], request['exchange'], outcome)
+            else:
+                results[position] = {
+                    'symbol': request['symbol'],
+                    'timeframe': request['timeframe'],
+                    'exchange': request['exchange'],
+                    'status': 200,
+                    'result': SignalResponse.payload(outcome)
+                }
+        
+        return {
+            'count': len(results),
+            'errors': sum(1 for result in results if result['status'] != 200),
+            'results': results
+        }
+    
+    async def get_multi_timeframe_signal(self, symbol: str, timeframes: str, exchange: str):
         try:
-            request = SignalRequest(
-                symbol=symbol,
-                timeframe=timeframe,
-                exchange=exchange
+            base_request = SignalRequest(symbol=symbol, exchange=exchange)
+            request = MultiTimeframeSignalRequest(
+                symbol=base_request.symbol,
+                timeframes=[timeframe.strip() for timeframe in timeframes.split(',') if timeframe.strip()],
+                exchange=base_request.exchange,
+                limit=base_request.limit
             )
             
-            result = await self.signal_service.get_market_signal(
+            result = await self.signal_service.get_multi_timeframe_signal(
                 symbol=request.symbol,
-                timeframe=request.timeframe,
-                exchange=request.exchange
+                timeframes=request.timeframes,
+                exchange=request.exchange,
+                limit=request.limit
             )
             
-            response = SignalResponse.from_signal_result(result)
+            return MultiTimeframeSignalResponse.payload(result)
+        
+        except Exception as e:
+            status_code, detail = self._error_response(e)
+            raise HTTPException(status_code=status_code, detail=detail)
+    
+    async def get_consensus_signal(self, symbol: str, timeframe: str, exchanges: str, mode: str):
+        try:
+            base_request = SignalRequest(symbol=symbol, timeframe=timeframe)
+            request = ConsensusSignalRequest(
+                symbol=base_request.symbol,
+                timeframe=base_request.timeframe,
+                exchanges=[exchange.strip() for exchange in exchanges.split(',') if exchange.strip()],
+                mode=mode,
+                limit=base_request.limit
+            )
             
-            return response.dict()
+            result = await self.signal_service.get_consensus_signal(
+                symbol=request.symbol,
+                timeframe=request.timeframe,
+                exchanges=request.exchanges,
+                limit=request.limit,
+                mode=request.mode
+            )
             
-        except InvalidSymbolError as e:
-            logger.error(f"Invalid symbol: {str(e)}")
-            raise HTTPException(status_code=400, detail=str(e))
-        except NoDataError as e:
-            logger.error(f"No data available: {str(e)}")
-            raise HTTPException(status_code=404, detail=str(e))
-        except ExchangeError as e:
-            logger.error(f"Exchange error: {str(e)}")
-            raise HTTPException(status_code=503, detail=str(e))
+            return ConsensusSignalResponse.payload(result)
+        
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
-            raise HTTPException(status_code=500, detail="Internal server error")
+            status_code, detail = self._error_response(e)
+            raise HTTPException(status_code=status_code, detail=detail)
+    
+    def open_signal_stream(self, subscriptions: str) -> AsyncIterator[bytes]:
+        try:
+            keys = self._parse_subscriptions(subscriptions)
+        except Exception as e:
+            status_code, detail = self._error_response(e)
+            raise HTTPException(status_code=status_code, detail=detail)
+        
+        max_subscriptions = get_settings().STREAM_MAX_SUBSCRIPTIONS
+        if len(keys) == 0:
+            raise HTTPException(status_code=400, detail="At least one subscription is required")
+        if len(keys) > max_subscriptions:
+            raise HTTPException(status_code=400, detail=f"Cannot subscribe to more than {max_subscriptions} signals")
+        
+        return self._signal_events(keys)
+    
+    def _parse_subscriptions(self, subscriptions: str) -> list:
+        keys = []
+        
+        for subscription in subscriptions.split(','):
+            if not subscription.strip():
+                continue
+            parts = subscription.strip().split(':')
+            request = SignalRequest(
+                symbol=parts[0],
+                timeframe=parts[1] if len(parts) > 1 else "1h",
+                exchange=parts[2] if len(parts) > 2 else "binance"
+            )
+            key = (request.exchange, request.symbol, request.timeframe, request.limit)
+            if key not in keys:
+                keys.append(key)
+        
+        return keys
+    
+    async def _signal_events(self, keys: list) -> AsyncIterator[bytes]:
+        heartbeat = get_settings().STREAM_HEARTBEAT_INTERVAL
+        
+        async for event in self.signal_stream_service.stream(keys, heartbeat=heartbeat):
+            if event is None:
+                yield b": keep-alive\n\n"
+                continue
+            
+            _, result = event
+            yield b"event: signal\ndata: " + json_dumps(SignalResponse.payload(result)) + b"\n\n"
+    
+    def _batch_error(self, symbol: str, timeframe: str, exchange: str, error: Exception) -> dict:
+        status_code, detail = self._error_response(error)
+        return {
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'exchange': exchange,
+            'status': status_code,
+            'error': detail
+        }
+    
+    def _error_response(self, error: Exception) -> tuple:
+        if isinstance(error, InvalidSymbolError):
+            logger.error(f"Invalid symbol: {str(error)}")
+            return 400, str(error)
+        if isinstance(error, ValidationError):
+            logger.error(f"Invalid request: {str(error)}")
+            return 400, str(error)
+        if isinstance(error, NoDataError):
+            logger.error(f"No data available: {str(error)}")
+            return 404, str(error)
+        if isinstance(error, ExchangeError):
+            logger.error(f"Exchange error: {str(error)}")
+            return 503, str(error)
+        logger.error(f"Unexpected error: {str(error)}")
+        return 500, "Internal server error"
+    
+    def start(self) -> None:
+        self.signal_service.start()
+    
+    def get_cache_stats(self) -> dict:
+        return self.signal_service.get_cache_stats()
+    
+    async def close(self) -> None:
+        await self.signal_stream_service.close()
+        await self.signal_service.close()
     
     async def get_signal_from_request(self, request_data: dict):
         return await self.get_signal(
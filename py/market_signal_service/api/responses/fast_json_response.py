@@ -0,0 +1,9 @@
+from typing import Any
+from fastapi.responses import JSONResponse
+from market_signal_service.core.serialization import json_dumps
+from market_signal_service.infrastructure.metrics.pipeline_metrics import PipelineMetrics
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        with PipelineMetrics.ENCODING.time():
+            return json_dumps(content)
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, validator
-from typing import Optional
+from typing import Optional, List
 from market_signal_service.core.timeframes import VALID_TIMEFRAMES
+from market_signal_service.infrastructure.config.settings import get_settings
 class SignalRequest(BaseModel):
     symbol: str
     timeframe: str = "1h"
@@ -31,3 +32,62 @@ class SignalRequest(BaseModel):
         if v is not None and (v < 50 or v > 1000):
             raise ValueError("Limit must be between 50 and 1000")
         return v
+
+class BatchSignalItem(BaseModel):
+    symbol: str
+    timeframe: str = "1h"
+    exchange: str = "binance"
+    limit: Optional[int] = 300
+
+class BatchSignalRequest(BaseModel):
+    items: List[BatchSignalItem]
+    
+    @validator('items')
+    def validate_items(cls, v):
+        if len(v) == 0:
+            raise ValueError("Items cannot be empty")
+        max_items = get_settings().BATCH_MAX_ITEMS
+        if len(v) > max_items:
+            raise ValueError(f"Batch cannot contain more than {max_items} items")
+        return v
+
+class MultiTimeframeSignalRequest(BaseModel):
+    symbol: str
+    timeframes: List[str]
+    exchange: str = "binance"
+    limit: Optional[int] = 300
+    
+    @validator('timeframes')
+    def validate_timeframes(cls, v):
+        if len(v) == 0:
+            raise ValueError("Timeframes cannot be empty")
+        invalid = [timeframe for timeframe in v if timeframe not in VALID_TIMEFRAMES]
+        if invalid:
+            raise ValueError(f"Invalid timeframes {invalid}. Must be one of: {VALID_TIMEFRAMES}")
+        return v
+
+class ConsensusSignalRequest(BaseModel):
+    symbol: str
+    timeframe: str = "1h"
+    exchanges: List[str]
+    mode: str = "exchanges"
+    limit: Optional[int] = 300
+    
+    @validator('exchanges')
+    def validate_exchanges(cls, v):
+        valid_exchanges = ["binance", "bybit", "kucoin"]
+        exchanges = list(dict.fromkeys(exchange.lower() for exchange in v))
+        if len(exchanges) == 0:
+            raise ValueError("Exchanges cannot be empty")
+        invalid = [exchange for exchange in exchanges if exchange not in valid_exchanges]
+        if invalid:
+            raise ValueError(f"Invalid exchanges {invalid}. Must be one of: {valid_exchanges}")
+        return exchanges
+    
+    @validator('mode')
+    def validate_mode(cls, v):
+        valid_modes = ["exchanges", "composite"]
+        if v not in valid_modes:
+            raise ValueError(f"Invalid mode. Must be one of: {valid_modes}")
+        return v
+
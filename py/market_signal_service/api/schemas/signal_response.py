@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 class SignalDetails(BaseModel):
@@ -19,6 +19,25 @@ class SignalResponse(BaseModel):
     exchange: str
     timestamp: datetime
     
+    @staticmethod
+    def payload(result) -> dict:
+        return {
+            'signal': result.signal,
+            'score': result.score,
+            'strength_percent': result.strength_percent,
+            'details': {
+                'trend': result.trend,
+                'momentum': result.momentum,
+                'strength': result.strength,
+                'structure': result.structure,
+                'indicators': result.indicators
+            },
+            'symbol': result.symbol,
+            'timeframe': result.timeframe,
+            'exchange': result.exchange,
+            'timestamp': result.timestamp
+        }
+    
     @classmethod
     def from_signal_result(cls, result):
         return cls(
@@ -37,3 +56,83 @@ class SignalResponse(BaseModel):
             exchange=result.exchange,
             timestamp=result.timestamp
         )
+
+class MultiTimeframeSignalResponse(BaseModel):
+    signal: str
+    score: float
+    strength_percent: int
+    symbol: str
+    exchange: str
+    timeframes: List[str]
+    weights: Dict[str, float]
+    results: Dict[str, SignalResponse]
+    timestamp: datetime
+    
+    @staticmethod
+    def payload(result) -> dict:
+        return {
+            'signal': result.signal,
+            'score': result.score,
+            'strength_percent': result.strength_percent,
+            'symbol': result.symbol,
+            'exchange': result.exchange,
+            'timeframes': result.timeframes,
+            'weights': result.weights,
+            'results': {
+                timeframe: SignalResponse.payload(signal_result)
+                for timeframe, signal_result in result.results.items()
+            },
+            'timestamp': result.timestamp
+        }
+    
+    @classmethod
+    def from_result(cls, result):
+        return cls(
+            signal=result.signal,
+            score=result.score,
+            strength_percent=result.strength_percent,
+            symbol=result.symbol,
+            exchange=result.exchange,
+            timeframes=result.timeframes,
+            weights=result.weights,
+            results={
+                timeframe: SignalResponse.from_signal_result(signal_result)
+                for timeframe, signal_result in result.results.items()
+            },
+            timestamp=result.timestamp
+        )
+
+class ConsensusSignalResponse(BaseModel):
+    signal: str
+    score: float
+    strength_percent: int
+    agreement: Optional[float]
+    mode: str
+    symbol: str
+    timeframe: str
+    exchanges: List[str]
+    weights: Dict[str, float]
+    results: Dict[str, SignalResponse]
+    errors: Dict[str, str]
+    timestamp: datetime
+    
+    @staticmethod
+    def payload(result) -> dict:
+        return {
+            'signal': result.signal,
+            'score': result.score,
+            'strength_percent': result.strength_percent,
+            'agreement': result.agreement,
+            'mode': result.mode,
+            'symbol': result.symbol,
+            'timeframe': result.timeframe,
+            'exchanges': result.exchanges,
+            'weights': result.weights,
+            'results': {
+                source: SignalResponse.payload(signal_result)
+                for source, signal_result in result.results.items()
+            },
+            'errors': result.errors,
+            'timestamp': result.timestamp
+        }
+
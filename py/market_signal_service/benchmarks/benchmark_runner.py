@@ -0,0 +1,104 @@
+import json
+import os
+import platform
+import statistics
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+import numpy as np
+import pandas as pd
+from market_signal_service.benchmarks.benchmark_suite import BenchmarkSuite
+from market_signal_service.benchmarks.synthetic_data import SyntheticData
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+class BenchmarkRunner:
+    BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+    
+    @staticmethod
+    def measure(func: Callable[[], object], repeat: int = 5, min_time: float = 0.05) -> dict:
+        func()
+        
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        number = max(1, int(min_time / elapsed)) if elapsed > 0 else 1000
+        
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            samples.append((time.perf_counter() - start) / number * 1000)
+        
+        return {
+            'median_ms': round(statistics.median(samples), 4),
+            'min_ms': round(min(samples), 4),
+            'loops': number * repeat
+        }
+    
+    @staticmethod
+    def run(
+        sizes: Iterable[int] = BenchmarkSuite.SIZES,
+        selected: Optional[List[str]] = None,
+        repeat: int = 5,
+        min_time: float = 0.05,
+        seed: int = 42
+    ) -> Dict[str, dict]:
+        cases = BenchmarkSuite.cases()
+        if selected:
+            cases = {name: case for name, case in cases.items() if any(name.startswith(prefix) for prefix in selected)}
+        
+        results = {}
+        for size in sizes:
+            data = SyntheticData.generate_ohlcv(size, seed)
+            for name, case in cases.items():
+                key = f"{name}[{size}]"
+                results[key] = BenchmarkRunner.measure(lambda: case(data), repeat, min_time)
+                logger.info(f"{key}: {results[key]['median_ms']:.3f} ms")
+        
+        return results
+    
+    @staticmethod
+    def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[dict]:
+        regressions = []
+        for key, result in results.items():
+            if key not in baseline:
+                continue
+            
+            expected = baseline[key]['min_ms']
+            ratio = result['min_ms'] / expected if expected > 0 else 1.0
+            if ratio > 1 + tolerance:
+                regressions.append({
+                    'benchmark': key,
+                    'baseline_ms': expected,
+                    'current_ms': result['min_ms'],
+                    'ratio': round(ratio, 3)
+                })
+        
+        return regressions
+    
+    @staticmethod
+    def environment() -> dict:
+        return {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+            'processor': platform.processor() or platform.machine()
+        }
+    
+    @staticmethod
+    def load_baseline(path: str) -> Dict[str, dict]:
+        with open(path) as f:
+            return json.load(f)['results']
+    
+    @staticmethod
+    def save_baseline(path: str, results: Dict[str, dict]) -> None:
+        with open(path, 'w') as f:
+            json.dump({
+                'created_at': datetime.utcnow().isoformat(),
+                'environment': BenchmarkRunner.environment(),
+                'results': results
+            }, f, indent=2, sort_keys=True)
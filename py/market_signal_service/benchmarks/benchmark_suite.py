@@ -0,0 +1,37 @@
+from typing import Callable, Dict
+from market_signal_service.domain.engine.indicators.ma_indicator import MAIndicator
+from market_signal_service.domain.engine.indicators.ema_indicator import EMAIndicator
+from market_signal_service.domain.engine.indicators.rsi_indicator import RSIIndicator
+from market_signal_service.domain.engine.indicators.macd_indicator import MACDIndicator
+from market_signal_service.domain.engine.indicators.stochastic_indicator import StochasticIndicator
+from market_signal_service.domain.engine.indicators.adx_indicator import ADXIndicator
+from market_signal_service.domain.engine.indicators.market_structure_indicator import MarketStructureIndicator
+from market_signal_service.domain.engine.detectors.trend_detector import TrendDetector
+from market_signal_service.domain.engine.detectors.momentum_detector import MomentumDetector
+from market_signal_service.domain.engine.detectors.strength_detector import StrengthDetector
+from market_signal_service.domain.engine.detectors.structure_detector import StructureDetector
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.models.ohlcv import OHLCV
+
+class BenchmarkSuite:
+    SIZES = (300, 1000, 10000, 100000)
+    
+    @staticmethod
+    def cases() -> Dict[str, Callable[[OHLCV], object]]:
+        decision_engine = DecisionEngine()
+        
+        return {
+            'indicator.ma50': lambda data: MAIndicator.calculate(data, 50),
+            'indicator.ma200': lambda data: MAIndicator.calculate(data, 200),
+            'indicator.ema20': lambda data: EMAIndicator.calculate(data, 20),
+            'indicator.rsi': lambda data: RSIIndicator.calculate(data),
+            'indicator.macd': lambda data: MACDIndicator.calculate(data),
+            'indicator.stochastic': lambda data: StochasticIndicator.calculate(data),
+            'indicator.adx': lambda data: ADXIndicator.calculate(data),
+            'indicator.swing_points': lambda data: MarketStructureIndicator.find_swing_points(data),
+            'detector.trend': lambda data: TrendDetector.detect(data),
+            'detector.momentum': lambda data: MomentumDetector.detect(data),
+            'detector.strength': lambda data: StrengthDetector.detect(data),
+            'detector.structure': lambda data: StructureDetector.detect(data),
+            'decision_engine.analyze': lambda data: decision_engine.analyze(data, 'BENCH', '1h', 'synthetic')
+        }
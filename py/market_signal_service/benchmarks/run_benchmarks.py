@@ -0,0 +1,49 @@
+import argparse
+import os
+import sys
+from market_signal_service.benchmarks.benchmark_runner import BenchmarkRunner
+from market_signal_service.benchmarks.benchmark_suite import BenchmarkSuite
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.logging.logger import setup_logger
+
+logger = setup_logger()
+
+def main() -> int:
+    settings = get_settings()
+    
+    parser = argparse.ArgumentParser(description="Benchmark indicators, detectors and DecisionEngine.analyze")
+    parser.add_argument('--baseline', default=settings.BENCHMARK_BASELINE_PATH or BenchmarkRunner.BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=settings.BENCHMARK_TOLERANCE, help="Allowed slowdown ratio before failing, e.g. 0.25 for 25%%")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(BenchmarkSuite.SIZES))
+    parser.add_argument('--only', nargs='+', help="Benchmark name prefixes to run, e.g. indicator.rsi detector")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.05, help="Minimum seconds per timing sample")
+    parser.add_argument('--update-baseline', action='store_true', help="Write results to the baseline instead of comparing")
+    args = parser.parse_args()
+    
+    if not args.update_baseline and not os.path.exists(args.baseline):
+        logger.error(f"Benchmark baseline {args.baseline} not found, run with --update-baseline to create it")
+        return 2
+    
+    results = BenchmarkRunner.run(args.sizes, args.only, args.repeat, args.min_time)
+    
+    if args.update_baseline:
+        BenchmarkRunner.save_baseline(args.baseline, results)
+        logger.info(f"Wrote {len(results)} benchmark results to {args.baseline}")
+        return 0
+    
+    regressions = BenchmarkRunner.compare(results, BenchmarkRunner.load_baseline(args.baseline), args.tolerance)
+    for regression in regressions:
+        logger.error(
+            f"Regression in {regression['benchmark']}: {regression['current_ms']:.3f} ms "
+            f"vs {regression['baseline_ms']:.3f} ms baseline ({regression['ratio']:.2f}x)"
+        )
+    
+    if regressions:
+        return 1
+    
+    logger.info(f"{len(results)} benchmarks within {args.tolerance:.0%} of baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
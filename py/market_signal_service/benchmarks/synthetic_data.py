@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+from market_signal_service.domain.models.ohlcv import OHLCV
+
+class SyntheticData:
+    START = pd.Timestamp('2020-01-01')
+    
+    @staticmethod
+    def generate(rows: int, seed: int = 42, frequency: str = '1h') -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        
+        drift = 0.0004 * np.sin(np.arange(rows) / 250)
+        close = 100 * np.exp(np.cumsum(drift + rng.normal(0, 0.01, rows)))
+        open_ = np.concatenate([[close[0]], close[:-1]])
+        spread = np.abs(rng.normal(0, 0.004, rows))
+        
+        return pd.DataFrame({
+            'timestamp': pd.date_range(SyntheticData.START, periods=rows, freq=frequency),
+            'open': open_,
+            'high': np.maximum(open_, close) * (1 + spread),
+            'low': np.minimum(open_, close) * (1 - spread),
+            'close': close,
+            'volume': rng.uniform(100, 1000, rows)
+        })
+    
+    @staticmethod
+    def generate_ohlcv(rows: int, seed: int = 42, frequency: str = '1h') -> OHLCV:
+        return OHLCV.from_dataframe(SyntheticData.generate(rows, seed, frequency))
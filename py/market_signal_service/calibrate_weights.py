@@ -0,0 +1,58 @@
+import argparse
+import json
+from datetime import datetime
+import pandas as pd
+from market_signal_service.domain.engine.scoring.weight_calibrator import WeightCalibrator
+from market_signal_service.infrastructure.logging.logger import setup_logger
+
+logger = setup_logger()
+
+def load_history(path: str) -> pd.DataFrame:
+    if path.endswith('.parquet'):
+        data = pd.read_parquet(path)
+    else:
+        data = pd.read_csv(path)
+    
+    if 'timestamp' in data:
+        data['timestamp'] = pd.to_datetime(data['timestamp'])
+        data = data.sort_values('timestamp')
+    
+    return data.reset_index(drop=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate ScoringEngine weights and thresholds against forward returns")
+    parser.add_argument('paths', nargs='+', help="OHLCV history files (CSV or parquet)")
+    parser.add_argument('--output', default='scoring_profile.json')
+    parser.add_argument('--horizon', type=int, default=4, help="Forward return horizon in bars")
+    parser.add_argument('--weight-step', type=float, default=0.05)
+    parser.add_argument('--threshold-min', type=float, default=0.05)
+    parser.add_argument('--threshold-max', type=float, default=0.6)
+    parser.add_argument('--threshold-step', type=float, default=0.05)
+    parser.add_argument('--objective', choices=WeightCalibrator.OBJECTIVES, default='sharpe')
+    parser.add_argument('--min-trade-ratio', type=float, default=0.05)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    
+    histories = [load_history(path) for path in args.paths]
+    thresholds = WeightCalibrator.threshold_grid(args.threshold_min, args.threshold_max, args.threshold_step)
+    
+    profile = WeightCalibrator.calibrate(
+        histories,
+        horizon=args.horizon,
+        weight_step=args.weight_step,
+        buy_thresholds=thresholds,
+        sell_thresholds=-thresholds,
+        objective=args.objective,
+        min_trade_ratio=args.min_trade_ratio,
+        workers=args.workers
+    )
+    profile['created_at'] = datetime.utcnow().isoformat()
+    profile['sources'] = args.paths
+    
+    with open(args.output, 'w') as f:
+        json.dump(profile, f, indent=2)
+    
+    logger.info(f"Wrote scoring profile to {args.output}: {profile['weights']} buy>={profile['buy_threshold']} sell<={profile['sell_threshold']}")
+
+if __name__ == "__main__":
+    main()
@@ -15,3 +15,6 @@ class InvalidTimeframeError(MarketSignalException):
 
 class CacheError(MarketSignalException):
     pass
+
+class CircuitOpenError(ExchangeError):
+    pass
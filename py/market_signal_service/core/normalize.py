@@ -1,3 +1,5 @@
+import numpy as np
+
 def score_to_signal(score: float, buy_threshold: float = 0.3, sell_threshold: float = -0.3) -> str:
     if score >= buy_threshold:
         return "BUY"
@@ -12,3 +14,9 @@ def score_to_strength_percent(score: float) -> int:
 
 def normalize_score(score: float) -> float:
     return max(-1.0, min(1.0, score))
+
+def scores_to_signals(scores: np.ndarray, buy_threshold: float = 0.3, sell_threshold: float = -0.3) -> np.ndarray:
+    return np.select([scores >= buy_threshold, scores <= sell_threshold], ["BUY", "SELL"], default="HOLD")
+
+def scores_to_strength_percents(scores: np.ndarray) -> np.ndarray:
+    return np.clip((np.abs(scores) * 100).astype(int), 0, 100)
@@ -0,0 +1,27 @@
+import math
+from dataclasses import asdict, is_dataclass
+from datetime import date
+from typing import Any
+import numpy as np
+import orjson
+
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def to_json_safe(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        value = value.item()
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        return value
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, date):
+        return value.isoformat()
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def json_dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=to_json_safe, option=JSON_OPTIONS)
@@ -0,0 +1,24 @@
+QUOTE_ASSETS = ('USDT', 'USDC', 'FDUSD', 'TUSD', 'BUSD', 'DAI', 'BTC', 'ETH', 'BNB', 'EUR', 'TRY')
+
+HYPHENATED_EXCHANGES = ('kucoin',)
+
+def split_symbol(symbol: str) -> tuple:
+    symbol = symbol.upper().strip()
+    if '-' in symbol:
+        base, quote = symbol.split('-', 1)
+        return base, quote
+    
+    for quote in QUOTE_ASSETS:
+        if symbol.endswith(quote) and len(symbol) > len(quote):
+            return symbol[:-len(quote)], quote
+    
+    return symbol, ''
+
+def to_exchange_symbol(symbol: str, exchange: str) -> str:
+    base, quote = split_symbol(symbol)
+    if not quote:
+        return symbol.upper().strip()
+    
+    if exchange.lower() in HYPHENATED_EXCHANGES:
+        return f"{base}-{quote}"
+    return f"{base}{quote}"
@@ -1,3 +1,7 @@
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
 VALID_TIMEFRAMES = [
     '1m', '3m', '5m', '15m', '30m',
     '1h', '2h', '4h', '6h', '8h', '12h',
@@ -51,3 +55,39 @@ def normalize_timeframe(timeframe: str) -> str:
 def get_timeframe_minutes(timeframe: str) -> int:
     normalized = normalize_timeframe(timeframe)
     return TIMEFRAME_MINUTES.get(normalized, 60)
+
+WEEK_OPEN_OFFSET_SECONDS = 4 * 86400
+
+def get_timeframe_seconds(timeframe: str) -> int:
+    return get_timeframe_minutes(timeframe) * 60
+
+def _boundary_timeframe(timeframe: str) -> str:
+    if timeframe.strip() in ('1M', '1mo', '1month'):
+        return '1M'
+    return normalize_timeframe(timeframe)
+
+def get_candle_open_time(timeframe: str, timestamp: float) -> float:
+    timeframe = _boundary_timeframe(timeframe)
+    
+    if timeframe == '1M':
+        moment = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc).timestamp()
+    
+    period = get_timeframe_seconds(timeframe)
+    offset = WEEK_OPEN_OFFSET_SECONDS if timeframe == '1w' else 0
+    return ((timestamp - offset) // period) * period + offset
+
+def get_next_candle_open_time(timeframe: str, timestamp: float) -> float:
+    timeframe = _boundary_timeframe(timeframe)
+    open_time = get_candle_open_time(timeframe, timestamp)
+    
+    if timeframe == '1M':
+        moment = datetime.fromtimestamp(open_time, tz=timezone.utc)
+        year, month = (moment.year + 1, 1) if moment.month == 12 else (moment.year, moment.month + 1)
+        return datetime(year, month, 1, tzinfo=timezone.utc).timestamp()
+    
+    return open_time + get_timeframe_seconds(timeframe)
+
+def seconds_until_candle_close(timeframe: str, now: Optional[float] = None) -> float:
+    now = now if now is not None else time.time()
+    return get_next_candle_open_time(timeframe, now) - now
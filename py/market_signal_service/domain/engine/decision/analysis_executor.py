@@ -0,0 +1,98 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Tuple, Union
+import pandas as pd
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.engine.scoring.scoring_engine import ScoringEngine
+from market_signal_service.domain.models.ohlcv import OHLCV
+from market_signal_service.domain.models.signal_result import SignalResult
+from market_signal_service.infrastructure.metrics.pipeline_metrics import PipelineMetrics
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+_worker_engine = None
+
+_WORKER_STAGES = {
+    'indicators': PipelineMetrics.INDICATORS,
+    'scoring': PipelineMetrics.SCORING,
+    'explanation': PipelineMetrics.EXPLANATION
+}
+
+def _initialize_worker(profile: Dict) -> None:
+    global _worker_engine
+    _worker_engine = DecisionEngine()
+    ScoringEngine.apply_profile(profile)
+
+def _analyze_buffers(timestamps: bytes, values: bytes, symbol: str, timeframe: str, exchange: str) -> Tuple[SignalResult, Dict[str, float]]:
+    before = {stage: histogram.sum for stage, histogram in _WORKER_STAGES.items()}
+    result = _worker_engine.analyze(OHLCV.from_buffers(timestamps, values), symbol, timeframe, exchange)
+    return result, {stage: histogram.sum - before[stage] for stage, histogram in _WORKER_STAGES.items()}
+
+def _ping() -> bool:
+    return True
+
+class AnalysisExecutor:
+    def __init__(self, workers: int, decision_engine: Optional[DecisionEngine] = None):
+        self.workers = workers
+        self.decision_engine = decision_engine or DecisionEngine()
+        self._pool = None
+    
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+    
+    def start(self) -> None:
+        if not self.enabled or self._pool is not None:
+            return
+        
+        profile = {
+            'weights': dict(ScoringEngine.WEIGHTS),
+            'buy_threshold': ScoringEngine.BUY_THRESHOLD,
+            'sell_threshold': ScoringEngine.SELL_THRESHOLD
+        }
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_initialize_worker,
+            initargs=(profile,)
+        )
+        for _ in range(self.workers):
+            self._pool.submit(_ping)
+        
+        logger.info(f"Started analysis executor with {self.workers} worker processes")
+    
+    async def analyze(
+        self,
+        ohlcv_data: Union[pd.DataFrame, OHLCV],
+        symbol: str,
+        timeframe: str,
+        exchange: str
+    ) -> SignalResult:
+        if not self.enabled:
+            return self.decision_engine.analyze(ohlcv_data, symbol, timeframe, exchange)
+        
+        self.start()
+        timestamps, values = OHLCV.of(ohlcv_data).to_buffers()
+        
+        try:
+            with PipelineMetrics.ANALYSIS.time():
+                result, stage_seconds = await asyncio.get_running_loop().run_in_executor(
+                    self._pool, _analyze_buffers, timestamps, values, symbol, timeframe, exchange
+                )
+        except BrokenProcessPool:
+            logger.error("Analysis worker pool broke, restarting it and analyzing inline")
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            return self.decision_engine.analyze(ohlcv_data, symbol, timeframe, exchange)
+        
+        for stage, seconds in stage_seconds.items():
+            _WORKER_STAGES[stage].observe(seconds)
+        return result
+    
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
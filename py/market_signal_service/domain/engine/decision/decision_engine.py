@@ -1,13 +1,18 @@
 import pandas as pd
+from typing import Union
 from datetime import datetime
 from market_signal_service.domain.engine.detectors.trend_detector import TrendDetector
 from market_signal_service.domain.engine.detectors.momentum_detector import MomentumDetector
 from market_signal_service.domain.engine.detectors.strength_detector import StrengthDetector
 from market_signal_service.domain.engine.detectors.structure_detector import StructureDetector
 from market_signal_service.domain.engine.scoring.scoring_engine import ScoringEngine
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
 from market_signal_service.domain.models.signal_result import SignalResult
-from market_signal_service.core.normalize import score_to_signal, score_to_strength_percent
-from market_signal_service.core.thresholds import BUY_THRESHOLD, SELL_THRESHOLD
+from market_signal_service.domain.models.signal_series import SignalSeries
+from market_signal_service.domain.models.ohlcv import OHLCV
+from market_signal_service.core.normalize import score_to_signal, score_to_strength_percent, scores_to_signals, scores_to_strength_percents
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.metrics.pipeline_metrics import PipelineMetrics
 
 class DecisionEngine:
     def __init__(self):
@@ -16,36 +21,46 @@ class DecisionEngine:
         self.strength_detector = StrengthDetector()
         self.structure_detector = StructureDetector()
         self.scoring_engine = ScoringEngine()
+        
+        profile_path = get_settings().SCORING_PROFILE_PATH
+        if profile_path:
+            self.scoring_engine.load_profile(profile_path)
     
     def analyze(
         self, 
-        ohlcv_data: pd.DataFrame, 
+        ohlcv_data: Union[pd.DataFrame, OHLCV], 
         symbol: str, 
         timeframe: str, 
         exchange: str
     ) -> SignalResult:
-        trend = self.trend_detector.detect(ohlcv_data)
-        momentum = self.momentum_detector.detect(ohlcv_data)
-        strength = self.strength_detector.detect(ohlcv_data)
-        structure = self.structure_detector.detect(ohlcv_data)
-        
-        score = self.scoring_engine.calculate_score(trend, momentum, strength, structure)
-        
-        signal = score_to_signal(score, BUY_THRESHOLD, SELL_THRESHOLD)
-        strength_percent = score_to_strength_percent(score)
-        
-        trend_info = self.trend_detector.get_trend_info(ohlcv_data)
-        momentum_info = self.momentum_detector.get_momentum_info(ohlcv_data)
-        strength_info = self.strength_detector.get_strength_info(ohlcv_data)
-        structure_info = self.structure_detector.get_structure_info(ohlcv_data)
-        
-        indicators = {
-            'trend_details': trend_info,
-            'momentum_details': momentum_info,
-            'strength_details': strength_info,
-            'structure_details': structure_info,
-            'score_breakdown': self.scoring_engine.get_score_breakdown(trend, momentum, strength, structure)
-        }
+        with PipelineMetrics.ANALYSIS.time():
+            context = IndicatorContext.of(ohlcv_data)
+            
+            with PipelineMetrics.INDICATORS.time():
+                trend = self.trend_detector.detect(context)
+                momentum = self.momentum_detector.detect(context)
+                strength = self.strength_detector.detect(context)
+                structure = self.structure_detector.detect(context)
+            
+            with PipelineMetrics.SCORING.time():
+                score = self.scoring_engine.calculate_score(trend, momentum, strength, structure)
+                
+                signal = score_to_signal(score, self.scoring_engine.BUY_THRESHOLD, self.scoring_engine.SELL_THRESHOLD)
+                strength_percent = score_to_strength_percent(score)
+            
+            with PipelineMetrics.EXPLANATION.time():
+                trend_info = self.trend_detector.get_trend_info(context)
+                momentum_info = self.momentum_detector.get_momentum_info(context)
+                strength_info = self.strength_detector.get_strength_info(context)
+                structure_info = self.structure_detector.get_structure_info(context)
+                
+                indicators = {
+                    'trend_details': trend_info,
+                    'momentum_details': momentum_info,
+                    'strength_details': strength_info,
+                    'structure_details': structure_info,
+                    'score_breakdown': self.scoring_engine.get_score_breakdown(trend, momentum, strength, structure)
+                }
         
         return SignalResult(
             signal=signal,
@@ -61,3 +76,26 @@ class DecisionEngine:
             timestamp=datetime.utcnow(),
             indicators=indicators
         )
+    
+    def analyze_history(self, ohlcv_data: Union[pd.DataFrame, OHLCV]) -> SignalSeries:
+        if not isinstance(ohlcv_data, (pd.DataFrame, OHLCV)):
+            ohlcv_data = pd.DataFrame(ohlcv_data)
+        context = IndicatorContext(ohlcv_data)
+        
+        trend = self.trend_detector.detect_series(context)
+        momentum = self.momentum_detector.detect_series(context)
+        strength = self.strength_detector.detect_series(context)
+        structure = self.structure_detector.detect_series(context)
+        
+        scores = self.scoring_engine.calculate_scores(trend, momentum, strength, structure)
+        
+        return SignalSeries(
+            signal=scores_to_signals(scores, self.scoring_engine.BUY_THRESHOLD, self.scoring_engine.SELL_THRESHOLD),
+            score=scores,
+            strength_percent=scores_to_strength_percents(scores),
+            trend=trend,
+            momentum=momentum,
+            strength=strength,
+            structure=structure,
+            timestamp=context.data.datetimes() if 'timestamp' in ohlcv_data else None
+        )
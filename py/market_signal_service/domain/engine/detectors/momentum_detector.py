@@ -1,14 +1,15 @@
 import pandas as pd
+import numpy as np
 from market_signal_service.domain.engine.indicators.rsi_indicator import RSIIndicator
-from market_signal_service.domain.engine.indicators.macd_indicator import MACDIndicator
-from market_signal_service.domain.engine.indicators.stochastic_indicator import StochasticIndicator
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
 
 class MomentumDetector:
     @staticmethod
     def detect(data: pd.DataFrame) -> str:
-        rsi = RSIIndicator.get_current_rsi(data)
-        macd = MACDIndicator.get_current_macd(data)
-        stoch = StochasticIndicator.get_current_stoch(data)
+        context = IndicatorContext.of(data)
+        rsi = context.current_rsi()
+        macd = context.current_macd()
+        stoch = context.current_stoch()
         
         bullish_signals = 0
         bearish_signals = 0
@@ -42,13 +43,33 @@ class MomentumDetector:
         else:
             return "NEUTRAL"
     
+    @staticmethod
+    def detect_series(data: pd.DataFrame) -> np.ndarray:
+        context = IndicatorContext.of(data)
+        rsi = context.rsi()
+        histogram = context.macd()['histogram']
+        stoch_k = context.stochastic()['k']
+        
+        oversold = rsi < 30
+        overbought = (rsi > 70) & ~oversold
+        
+        bullish_signals = (rsi > 50).astype(int) + oversold + (histogram > 0) + (stoch_k > 50)
+        bearish_signals = (rsi < 50).astype(int) + overbought + (histogram < 0) + (stoch_k < 50)
+        
+        return np.select(
+            [bullish_signals > bearish_signals, bearish_signals > bullish_signals],
+            ["BULLISH", "BEARISH"],
+            default="NEUTRAL"
+        )
+    
     @staticmethod
     def get_momentum_info(data: pd.DataFrame) -> dict:
-        momentum = MomentumDetector.detect(data)
+        context = IndicatorContext.of(data)
+        momentum = MomentumDetector.detect(context)
         
-        rsi = RSIIndicator.get_current_rsi(data)
-        macd = MACDIndicator.get_current_macd(data)
-        stoch = StochasticIndicator.get_current_stoch(data)
+        rsi = context.current_rsi()
+        macd = context.current_macd()
+        stoch = context.current_stoch()
         
         return {
             'momentum': momentum,
@@ -1,18 +1,31 @@
 import pandas as pd
+import numpy as np
 from market_signal_service.domain.engine.indicators.adx_indicator import ADXIndicator
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
 
 class StrengthDetector:
     @staticmethod
     def detect(data: pd.DataFrame) -> str:
-        adx_data = ADXIndicator.get_current_adx(data)
+        adx_data = IndicatorContext.of(data).current_adx()
         adx_value = adx_data['adx']
         
         return ADXIndicator.get_trend_strength(adx_value)
     
+    @staticmethod
+    def detect_series(data: pd.DataFrame) -> np.ndarray:
+        adx = IndicatorContext.of(data).adx()['adx']
+        
+        return np.select(
+            [np.isnan(adx), adx > 25, adx > 20],
+            ["NONE", "STRONG", "MODERATE"],
+            default="WEAK"
+        )
+    
     @staticmethod
     def get_strength_info(data: pd.DataFrame) -> dict:
-        strength = StrengthDetector.detect(data)
-        adx_data = ADXIndicator.get_current_adx(data)
+        context = IndicatorContext.of(data)
+        strength = StrengthDetector.detect(context)
+        adx_data = context.current_adx()
         
         return {
             'strength': strength,
@@ -1,18 +1,25 @@
 import pandas as pd
+import numpy as np
 from market_signal_service.domain.engine.indicators.market_structure_indicator import MarketStructureIndicator
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
 
 class StructureDetector:
     @staticmethod
     def detect(data: pd.DataFrame) -> str:
-        return MarketStructureIndicator.detect_structure(data)
+        swing_points = IndicatorContext.of(data).swing_points()
+        return MarketStructureIndicator.classify_structure(swing_points)
+    
+    @staticmethod
+    def detect_series(data: pd.DataFrame, lookback: int = 5) -> np.ndarray:
+        context = IndicatorContext.of(data)
+        return MarketStructureIndicator.classify_structure_series(context.data, context.swing_indices(lookback), lookback)
     
     @staticmethod
     def get_structure_info(data: pd.DataFrame) -> dict:
-        structure = StructureDetector.detect(data)
-        structure_details = MarketStructureIndicator.get_structure_info(data)
+        structure_details = MarketStructureIndicator.summarize_structure(IndicatorContext.of(data).swing_points())
         
         return {
-            'structure': structure,
+            'structure': structure_details['structure'],
             'swing_high_count': structure_details['swing_high_count'],
             'swing_low_count': structure_details['swing_low_count'],
             'last_swing_high': structure_details['last_swing_high'],
@@ -1,14 +1,15 @@
 import pandas as pd
-from market_signal_service.domain.engine.indicators.ma_indicator import MAIndicator
-from market_signal_service.domain.engine.indicators.ema_indicator import EMAIndicator
+import numpy as np
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
 
 class TrendDetector:
     @staticmethod
     def detect(data: pd.DataFrame) -> str:
-        current_price = data['close'].iloc[-1]
+        context = IndicatorContext.of(data)
+        current_price = context.current_price()
         
-        mas = MAIndicator.get_all_mas(data)
-        emas = EMAIndicator.get_all_emas(data)
+        mas = context.all_mas()
+        emas = context.all_emas()
         
         ma50 = mas.get('ma50')
         ma200 = mas.get('ma200')
@@ -47,12 +48,33 @@ class TrendDetector:
         else:
             return "SIDEWAYS"
     
+    @staticmethod
+    def detect_series(data: pd.DataFrame) -> np.ndarray:
+        context = IndicatorContext.of(data)
+        close = context.close()
+        ma50 = context.ma(50)
+        ma200 = context.ma(200)
+        ema20 = context.ema(20)
+        
+        bullish_signals = (
+            (close > ma200).astype(int) +
+            (close > ma50).astype(int) +
+            (ma50 > ma200).astype(int) +
+            (close > ema20).astype(int)
+        )
+        bearish_signals = 4 - bullish_signals
+        
+        trend = np.select([bullish_signals >= 3, bearish_signals >= 3], ["UPTREND", "DOWNTREND"], default="SIDEWAYS")
+        trend[:199] = "SIDEWAYS"
+        return trend
+    
     @staticmethod
     def get_trend_info(data: pd.DataFrame) -> dict:
-        trend = TrendDetector.detect(data)
+        context = IndicatorContext.of(data)
+        trend = TrendDetector.detect(context)
         
-        current_price = data['close'].iloc[-1]
-        mas = MAIndicator.get_all_mas(data)
+        current_price = context.current_price()
+        mas = context.all_mas()
         
         return {
             'trend': trend,
@@ -1,45 +1,47 @@
 import pandas as pd
 import numpy as np
+from market_signal_service.domain.engine.indicators.indicator_kernels import IndicatorKernels
 
 class ADXIndicator:
     @staticmethod
     def calculate(data: pd.DataFrame, period: int = 14) -> dict:
-        high = data['high']
-        low = data['low']
-        close = data['close']
+        high = IndicatorKernels.column(data, 'high')
+        low = IndicatorKernels.column(data, 'low')
+        close = IndicatorKernels.column(data, 'close')
         
-        plus_dm = high.diff()
-        minus_dm = -low.diff()
+        plus_dm = IndicatorKernels.diff(high)
+        minus_dm = -IndicatorKernels.diff(low)
         
         plus_dm[plus_dm < 0] = 0
         minus_dm[minus_dm < 0] = 0
         
+        prev_close = np.concatenate(([np.nan], close[:-1]))
         tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        tr2 = np.abs(high - prev_close)
+        tr3 = np.abs(low - prev_close)
+        tr = np.fmax(tr1, np.fmax(tr2, tr3))
         
-        atr = tr.rolling(window=period).mean()
+        atr = IndicatorKernels.rolling_mean(tr, period)
         
-        plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr)
-        minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr)
+        plus_di = 100 * IndicatorKernels.divide(IndicatorKernels.rolling_mean(plus_dm, period), atr)
+        minus_di = 100 * IndicatorKernels.divide(IndicatorKernels.rolling_mean(minus_dm, period), atr)
         
-        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-        adx = dx.rolling(window=period).mean()
+        dx = 100 * IndicatorKernels.divide(np.abs(plus_di - minus_di), plus_di + minus_di)
+        adx = IndicatorKernels.rolling_mean(dx, period)
         
         return {
-            'adx': adx,
-            'plus_di': plus_di,
-            'minus_di': minus_di
+            'adx': IndicatorKernels.wrap(adx, data),
+            'plus_di': IndicatorKernels.wrap(plus_di, data),
+            'minus_di': IndicatorKernels.wrap(minus_di, data)
         }
     
     @staticmethod
     def get_current_adx(data: pd.DataFrame) -> dict:
         adx_data = ADXIndicator.calculate(data)
         return {
-            'adx': adx_data['adx'].iloc[-1],
-            'plus_di': adx_data['plus_di'].iloc[-1],
-            'minus_di': adx_data['minus_di'].iloc[-1]
+            'adx': np.asarray(adx_data['adx'])[-1],
+            'plus_di': np.asarray(adx_data['plus_di'])[-1],
+            'minus_di': np.asarray(adx_data['minus_di'])[-1]
         }
     
     @staticmethod
@@ -1,10 +1,12 @@
 import pandas as pd
 import numpy as np
+from market_signal_service.domain.engine.indicators.indicator_kernels import IndicatorKernels
 
 class EMAIndicator:
     @staticmethod
     def calculate(data: pd.DataFrame, period: int = 20) -> pd.Series:
-        return data['close'].ewm(span=period, adjust=False).mean()
+        ema = IndicatorKernels.ema(IndicatorKernels.column(data, 'close'), period)
+        return IndicatorKernels.wrap(ema, data)
     
     @staticmethod
     def calculate_ema12(data: pd.DataFrame) -> pd.Series:
@@ -21,7 +23,7 @@ class EMAIndicator:
     @staticmethod
     def get_all_emas(data: pd.DataFrame) -> dict:
         return {
-            'ema12': EMAIndicator.calculate_ema12(data).iloc[-1],
-            'ema20': EMAIndicator.calculate_ema20(data).iloc[-1],
-            'ema26': EMAIndicator.calculate_ema26(data).iloc[-1]
+            'ema12': np.asarray(EMAIndicator.calculate_ema12(data))[-1],
+            'ema20': np.asarray(EMAIndicator.calculate_ema20(data))[-1],
+            'ema26': np.asarray(EMAIndicator.calculate_ema26(data))[-1]
         }
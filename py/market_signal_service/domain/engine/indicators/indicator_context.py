@@ -0,0 +1,109 @@
+import pandas as pd
+import numpy as np
+from typing import Any, Callable
+from market_signal_service.domain.engine.indicators.ma_indicator import MAIndicator
+from market_signal_service.domain.engine.indicators.ema_indicator import EMAIndicator
+from market_signal_service.domain.engine.indicators.rsi_indicator import RSIIndicator
+from market_signal_service.domain.engine.indicators.macd_indicator import MACDIndicator
+from market_signal_service.domain.engine.indicators.stochastic_indicator import StochasticIndicator
+from market_signal_service.domain.engine.indicators.adx_indicator import ADXIndicator
+from market_signal_service.domain.engine.indicators.market_structure_indicator import MarketStructureIndicator
+from market_signal_service.domain.models.ohlcv import OHLCV
+
+class IndicatorContext:
+    def __init__(self, data: pd.DataFrame):
+        self.data = OHLCV.of(data)
+        self._cache = {}
+    
+    @staticmethod
+    def of(data) -> "IndicatorContext":
+        if isinstance(data, (pd.DataFrame, OHLCV)):
+            return IndicatorContext(data)
+        return data
+    
+    def __len__(self) -> int:
+        return len(self.data)
+    
+    def get(self, name: str, compute: Callable[..., Any], **params) -> Any:
+        key = (name, tuple(sorted(params.items())))
+        if key not in self._cache:
+            self._cache[key] = compute(self.data, **params)
+        return self._cache[key]
+    
+    def ma(self, period: int = 50) -> np.ndarray:
+        return self.get('ma', MAIndicator.calculate, period=period)
+    
+    def ema(self, period: int = 20) -> np.ndarray:
+        return self.get('ema', EMAIndicator.calculate, period=period)
+    
+    def rsi(self, period: int = 14) -> np.ndarray:
+        return self.get('rsi', RSIIndicator.calculate, period=period)
+    
+    def macd(self, fast: int = 12, slow: int = 26, signal: int = 9) -> dict:
+        return self.get(
+            'macd',
+            lambda data, fast, slow, signal: MACDIndicator.from_emas(self.ema(fast), self.ema(slow), signal),
+            fast=fast, slow=slow, signal=signal
+        )
+    
+    def stochastic(self, k_period: int = 14, d_period: int = 3) -> dict:
+        return self.get('stochastic', StochasticIndicator.calculate, k_period=k_period, d_period=d_period)
+    
+    def adx(self, period: int = 14) -> dict:
+        return self.get('adx', ADXIndicator.calculate, period=period)
+    
+    def swing_points(self, lookback: int = 5) -> dict:
+        return self.get(
+            'swing_points',
+            lambda data, lookback: MarketStructureIndicator.swing_points_from_indices(data, self.swing_indices(lookback)),
+            lookback=lookback
+        )
+    
+    def swing_indices(self, lookback: int = 5) -> dict:
+        return self.get('swing_indices', MarketStructureIndicator.find_swing_indices, lookback=lookback)
+    
+    def close(self) -> np.ndarray:
+        return self.data.close
+    
+    def current_price(self) -> float:
+        return self.data.close[-1]
+    
+    def all_mas(self) -> dict:
+        return {
+            'ma50': self.ma(50)[-1] if len(self) >= 50 else None,
+            'ma200': self.ma(200)[-1] if len(self) >= 200 else None
+        }
+    
+    def all_emas(self) -> dict:
+        return {
+            'ema12': self.ema(12)[-1],
+            'ema20': self.ema(20)[-1],
+            'ema26': self.ema(26)[-1]
+        }
+    
+    def current_rsi(self, period: int = 14) -> float:
+        rsi = self.rsi(period)
+        return rsi[-1] if len(rsi) > 0 else None
+    
+    def current_macd(self) -> dict:
+        macd_data = self.macd()
+        return {
+            'macd': macd_data['macd'][-1],
+            'signal': macd_data['signal'][-1],
+            'histogram': macd_data['histogram'][-1]
+        }
+    
+    def current_stoch(self) -> dict:
+        stoch_data = self.stochastic()
+        return {
+            'k': stoch_data['k'][-1],
+            'd': stoch_data['d'][-1]
+        }
+    
+    def current_adx(self) -> dict:
+        adx_data = self.adx()
+        return {
+            'adx': adx_data['adx'][-1],
+            'plus_di': adx_data['plus_di'][-1],
+            'minus_di': adx_data['minus_di'][-1]
+        }
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+class IndicatorKernels:
+    @staticmethod
+    def column(data, name: str) -> np.ndarray:
+        return np.asarray(data[name], dtype=np.float64)
+    
+    @staticmethod
+    def wrap(values: np.ndarray, data):
+        if isinstance(data, pd.DataFrame):
+            return pd.Series(values, index=data.index)
+        return values
+    
+    @staticmethod
+    def rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+        result = np.full(len(values), np.nan)
+        if len(values) >= period:
+            result[period - 1:] = np.lib.stride_tricks.sliding_window_view(values, period).mean(axis=1)
+        return result
+    
+    @staticmethod
+    def rolling_min(values: np.ndarray, period: int) -> np.ndarray:
+        result = np.full(len(values), np.nan)
+        if len(values) >= period:
+            result[period - 1:] = np.lib.stride_tricks.sliding_window_view(values, period).min(axis=1)
+        return result
+    
+    @staticmethod
+    def rolling_max(values: np.ndarray, period: int) -> np.ndarray:
+        result = np.full(len(values), np.nan)
+        if len(values) >= period:
+            result[period - 1:] = np.lib.stride_tricks.sliding_window_view(values, period).max(axis=1)
+        return result
+    
+    @staticmethod
+    def ema(values: np.ndarray, period: int) -> np.ndarray:
+        return pd.Series(values).ewm(span=period, adjust=False).mean().to_numpy()
+    
+    @staticmethod
+    def diff(values: np.ndarray) -> np.ndarray:
+        result = np.empty(len(values))
+        result[:1] = np.nan
+        np.subtract(values[1:], values[:-1], out=result[1:])
+        return result
+    
+    @staticmethod
+    def divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return numerator / denominator
@@ -1,10 +1,12 @@
 import pandas as pd
 import numpy as np
+from market_signal_service.domain.engine.indicators.indicator_kernels import IndicatorKernels
 
 class MAIndicator:
     @staticmethod
     def calculate(data: pd.DataFrame, period: int = 50) -> pd.Series:
-        return data['close'].rolling(window=period).mean()
+        ma = IndicatorKernels.rolling_mean(IndicatorKernels.column(data, 'close'), period)
+        return IndicatorKernels.wrap(ma, data)
     
     @staticmethod
     def calculate_ma50(data: pd.DataFrame) -> pd.Series:
@@ -17,6 +19,6 @@ class MAIndicator:
     @staticmethod
     def get_all_mas(data: pd.DataFrame) -> dict:
         return {
-            'ma50': MAIndicator.calculate_ma50(data).iloc[-1] if len(data) >= 50 else None,
-            'ma200': MAIndicator.calculate_ma200(data).iloc[-1] if len(data) >= 200 else None
+            'ma50': np.asarray(MAIndicator.calculate_ma50(data))[-1] if len(data) >= 50 else None,
+            'ma200': np.asarray(MAIndicator.calculate_ma200(data))[-1] if len(data) >= 200 else None
         }
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 from market_signal_service.domain.engine.indicators.ema_indicator import EMAIndicator
+from market_signal_service.domain.engine.indicators.indicator_kernels import IndicatorKernels
 
 class MACDIndicator:
     @staticmethod
@@ -8,8 +9,14 @@ class MACDIndicator:
         ema_fast = EMAIndicator.calculate(data, fast)
         ema_slow = EMAIndicator.calculate(data, slow)
         
+        return MACDIndicator.from_emas(ema_fast, ema_slow, signal)
+    
+    @staticmethod
+    def from_emas(ema_fast: pd.Series, ema_slow: pd.Series, signal: int = 9) -> dict:
         macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+        signal_line = IndicatorKernels.ema(np.asarray(macd_line), signal)
+        if isinstance(macd_line, pd.Series):
+            signal_line = pd.Series(signal_line, index=macd_line.index)
         histogram = macd_line - signal_line
         
         return {
@@ -22,21 +29,25 @@ class MACDIndicator:
     def get_current_macd(data: pd.DataFrame) -> dict:
         macd_data = MACDIndicator.calculate(data)
         return {
-            'macd': macd_data['macd'].iloc[-1],
-            'signal': macd_data['signal'].iloc[-1],
-            'histogram': macd_data['histogram'].iloc[-1]
+            'macd': np.asarray(macd_data['macd'])[-1],
+            'signal': np.asarray(macd_data['signal'])[-1],
+            'histogram': np.asarray(macd_data['histogram'])[-1]
         }
     
     @staticmethod
     def is_bullish_crossover(macd_data: dict) -> bool:
         if len(macd_data['macd']) < 2:
             return False
-        return (macd_data['macd'].iloc[-1] > macd_data['signal'].iloc[-1] and 
-                macd_data['macd'].iloc[-2] <= macd_data['signal'].iloc[-2])
+        macd_line = np.asarray(macd_data['macd'])
+        signal_line = np.asarray(macd_data['signal'])
+        return (macd_line[-1] > signal_line[-1] and 
+                macd_line[-2] <= signal_line[-2])
     
     @staticmethod
     def is_bearish_crossover(macd_data: dict) -> bool:
         if len(macd_data['macd']) < 2:
             return False
-        return (macd_data['macd'].iloc[-1] < macd_data['signal'].iloc[-1] and 
-                macd_data['macd'].iloc[-2] >= macd_data['signal'].iloc[-2])
+        macd_line = np.asarray(macd_data['macd'])
+        signal_line = np.asarray(macd_data['signal'])
+        return (macd_line[-1] < signal_line[-1] and 
+                macd_line[-2] >= signal_line[-2])
@@ -4,33 +4,46 @@ import numpy as np
 class MarketStructureIndicator:
     @staticmethod
     def find_swing_points(data: pd.DataFrame, lookback: int = 5) -> dict:
-        highs = data['high']
-        lows = data['low']
-        
-        swing_highs = []
-        swing_lows = []
-        
-        for i in range(lookback, len(data) - lookback):
-            is_swing_high = all(highs.iloc[i] > highs.iloc[i-j] for j in range(1, lookback+1)) and \
-                           all(highs.iloc[i] > highs.iloc[i+j] for j in range(1, lookback+1))
-            
-            is_swing_low = all(lows.iloc[i] < lows.iloc[i-j] for j in range(1, lookback+1)) and \
-                          all(lows.iloc[i] < lows.iloc[i+j] for j in range(1, lookback+1))
-            
-            if is_swing_high:
-                swing_highs.append({'index': i, 'value': highs.iloc[i]})
-            if is_swing_low:
-                swing_lows.append({'index': i, 'value': lows.iloc[i]})
+        swing_indices = MarketStructureIndicator.find_swing_indices(data, lookback)
+        return MarketStructureIndicator.swing_points_from_indices(data, swing_indices)
+    
+    @staticmethod
+    def swing_points_from_indices(data: pd.DataFrame, swing_indices: dict) -> dict:
+        highs = np.asarray(data['high'])
+        lows = np.asarray(data['low'])
         
         return {
-            'swing_highs': swing_highs,
-            'swing_lows': swing_lows
+            'swing_highs': [{'index': i, 'value': highs[i]} for i in swing_indices['swing_highs'].tolist()],
+            'swing_lows': [{'index': i, 'value': lows[i]} for i in swing_indices['swing_lows'].tolist()]
+        }
+    
+    @staticmethod
+    def find_swing_indices(data: pd.DataFrame, lookback: int = 5) -> dict:
+        return {
+            'swing_highs': MarketStructureIndicator._swing_indices(np.asarray(data['high']), lookback),
+            'swing_lows': MarketStructureIndicator._swing_indices(-np.asarray(data['low']), lookback)
         }
     
+    @staticmethod
+    def _swing_indices(values: np.ndarray, lookback: int) -> np.ndarray:
+        window = 2 * lookback + 1
+        if len(values) < window:
+            return np.empty(0, dtype=np.int64)
+        
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        left_max = windows[:, :lookback].max(axis=1)
+        right_max = windows[:, lookback + 1:].max(axis=1)
+        is_swing = windows[:, lookback] > np.maximum(left_max, right_max)
+        
+        return np.flatnonzero(is_swing) + lookback
+    
     @staticmethod
     def detect_structure(data: pd.DataFrame) -> str:
         swing_points = MarketStructureIndicator.find_swing_points(data)
-        
+        return MarketStructureIndicator.classify_structure(swing_points)
+    
+    @staticmethod
+    def classify_structure(swing_points: dict) -> str:
         highs = swing_points['swing_highs']
         lows = swing_points['swing_lows']
         
@@ -49,13 +62,38 @@ class MarketStructureIndicator:
         else:
             return "CHOPPY"
     
+    @staticmethod
+    def classify_structure_series(data: pd.DataFrame, swing_indices: dict, lookback: int = 5) -> np.ndarray:
+        n = len(data)
+        bars = np.arange(n)
+        
+        last_high, prev_high = MarketStructureIndicator._confirmed_swing_values(
+            np.asarray(data['high']), swing_indices['swing_highs'], bars, lookback
+        )
+        last_low, prev_low = MarketStructureIndicator._confirmed_swing_values(
+            np.asarray(data['low']), swing_indices['swing_lows'], bars, lookback
+        )
+        
+        bullish = (last_high > prev_high) & (last_low > prev_low)
+        bearish = (last_high < prev_high) & (last_low < prev_low)
+        
+        return np.select([bullish, bearish], ["BULLISH_STRUCTURE", "BEARISH_STRUCTURE"], default="CHOPPY")
+    
+    @staticmethod
+    def _confirmed_swing_values(values: np.ndarray, indices: np.ndarray, bars: np.ndarray, lookback: int) -> tuple:
+        swing_values = np.concatenate(([np.nan, np.nan], values[indices]))
+        confirmed = np.searchsorted(indices + lookback, bars, side='right')
+        return swing_values[confirmed + 1], swing_values[confirmed]
+    
     @staticmethod
     def get_structure_info(data: pd.DataFrame) -> dict:
-        structure = MarketStructureIndicator.detect_structure(data)
         swing_points = MarketStructureIndicator.find_swing_points(data)
-        
+        return MarketStructureIndicator.summarize_structure(swing_points)
+    
+    @staticmethod
+    def summarize_structure(swing_points: dict) -> dict:
         return {
-            'structure': structure,
+            'structure': MarketStructureIndicator.classify_structure(swing_points),
             'swing_high_count': len(swing_points['swing_highs']),
             'swing_low_count': len(swing_points['swing_lows']),
             'last_swing_high': swing_points['swing_highs'][-1] if swing_points['swing_highs'] else None,
@@ -1,26 +1,27 @@
 import pandas as pd
 import numpy as np
+from market_signal_service.domain.engine.indicators.indicator_kernels import IndicatorKernels
 
 class RSIIndicator:
     @staticmethod
     def calculate(data: pd.DataFrame, period: int = 14) -> pd.Series:
-        delta = data['close'].diff()
+        delta = IndicatorKernels.diff(IndicatorKernels.column(data, 'close'))
         
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
         
-        avg_gain = gain.rolling(window=period).mean()
-        avg_loss = loss.rolling(window=period).mean()
+        avg_gain = IndicatorKernels.rolling_mean(gain, period)
+        avg_loss = IndicatorKernels.rolling_mean(loss, period)
         
-        rs = avg_gain / avg_loss
+        rs = IndicatorKernels.divide(avg_gain, avg_loss)
         rsi = 100 - (100 / (1 + rs))
         
-        return rsi
+        return IndicatorKernels.wrap(rsi, data)
     
     @staticmethod
     def get_current_rsi(data: pd.DataFrame, period: int = 14) -> float:
-        rsi = RSIIndicator.calculate(data, period)
-        return rsi.iloc[-1] if len(rsi) > 0 else None
+        rsi = np.asarray(RSIIndicator.calculate(data, period))
+        return rsi[-1] if len(rsi) > 0 else None
     
     @staticmethod
     def is_overbought(rsi_value: float, threshold: float = 70) -> bool:
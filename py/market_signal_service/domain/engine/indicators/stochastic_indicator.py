@@ -1,26 +1,28 @@
 import pandas as pd
 import numpy as np
+from market_signal_service.domain.engine.indicators.indicator_kernels import IndicatorKernels
 
 class StochasticIndicator:
     @staticmethod
     def calculate(data: pd.DataFrame, k_period: int = 14, d_period: int = 3) -> dict:
-        low_min = data['low'].rolling(window=k_period).min()
-        high_max = data['high'].rolling(window=k_period).max()
+        close = IndicatorKernels.column(data, 'close')
+        low_min = IndicatorKernels.rolling_min(IndicatorKernels.column(data, 'low'), k_period)
+        high_max = IndicatorKernels.rolling_max(IndicatorKernels.column(data, 'high'), k_period)
         
-        k_percent = 100 * ((data['close'] - low_min) / (high_max - low_min))
-        d_percent = k_percent.rolling(window=d_period).mean()
+        k_percent = 100 * IndicatorKernels.divide(close - low_min, high_max - low_min)
+        d_percent = IndicatorKernels.rolling_mean(k_percent, d_period)
         
         return {
-            'k': k_percent,
-            'd': d_percent
+            'k': IndicatorKernels.wrap(k_percent, data),
+            'd': IndicatorKernels.wrap(d_percent, data)
         }
     
     @staticmethod
     def get_current_stoch(data: pd.DataFrame) -> dict:
         stoch_data = StochasticIndicator.calculate(data)
         return {
-            'k': stoch_data['k'].iloc[-1],
-            'd': stoch_data['d'].iloc[-1]
+            'k': np.asarray(stoch_data['k'])[-1],
+            'd': np.asarray(stoch_data['d'])[-1]
         }
     
     @staticmethod
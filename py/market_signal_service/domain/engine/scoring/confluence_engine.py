@@ -0,0 +1,24 @@
+import math
+from typing import Dict, List, Optional
+from market_signal_service.core.timeframes import get_timeframe_minutes
+
+class ConfluenceEngine:
+    @staticmethod
+    def default_weights(timeframes: List[str]) -> Dict[str, float]:
+        return {timeframe: math.log1p(get_timeframe_minutes(timeframe)) for timeframe in timeframes}
+    
+    @staticmethod
+    def normalize_weights(timeframes: List[str], weights: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        raw_weights = ConfluenceEngine.default_weights(timeframes)
+        if weights:
+            raw_weights.update({timeframe: weight for timeframe, weight in weights.items() if timeframe in raw_weights})
+        
+        total = sum(raw_weights.values())
+        if total <= 0:
+            return {timeframe: 1.0 / len(timeframes) for timeframe in timeframes}
+        return {timeframe: weight / total for timeframe, weight in raw_weights.items()}
+    
+    @staticmethod
+    def calculate_score(scores: Dict[str, float], weights: Dict[str, float]) -> float:
+        confluence_score = sum(scores[timeframe] * weights[timeframe] for timeframe in scores)
+        return round(confluence_score, 3)
@@ -0,0 +1,23 @@
+from typing import Dict
+from market_signal_service.domain.models.ohlcv import OHLCV
+
+class ConsensusEngine:
+    @staticmethod
+    def volume_weights(series: Dict[str, OHLCV]) -> Dict[str, float]:
+        volumes = {exchange: float(data.volume.sum()) for exchange, data in series.items()}
+        
+        total = sum(volumes.values())
+        if total <= 0:
+            return {exchange: 1.0 / len(series) for exchange in series}
+        return {exchange: volume / total for exchange, volume in volumes.items()}
+    
+    @staticmethod
+    def calculate_score(scores: Dict[str, float], weights: Dict[str, float]) -> float:
+        consensus_score = sum(scores[exchange] * weights[exchange] for exchange in scores)
+        return round(consensus_score, 3)
+    
+    @staticmethod
+    def agreement(signals: Dict[str, str], signal: str) -> float:
+        if not signals:
+            return 0.0
+        return round(sum(1 for value in signals.values() if value == signal) / len(signals), 3)
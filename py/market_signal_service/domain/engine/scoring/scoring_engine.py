@@ -1,4 +1,10 @@
+import json
 from typing import Dict
+import numpy as np
+from market_signal_service.core.thresholds import BUY_THRESHOLD, SELL_THRESHOLD
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
 
 class ScoringEngine:
     WEIGHTS = {
@@ -8,6 +14,9 @@ class ScoringEngine:
         'structure': 0.15
     }
     
+    BUY_THRESHOLD = BUY_THRESHOLD
+    SELL_THRESHOLD = SELL_THRESHOLD
+    
     TREND_SCORES = {
         'UPTREND': 1.0,
         'DOWNTREND': -1.0,
@@ -33,6 +42,32 @@ class ScoringEngine:
         'CHOPPY': 0.0
     }
     
+    @staticmethod
+    def load_profile(path: str) -> dict:
+        with open(path) as f:
+            profile = json.load(f)
+        
+        ScoringEngine.apply_profile(profile)
+        logger.info(f"Loaded scoring profile from {path}")
+        
+        return profile
+    
+    @staticmethod
+    def apply_profile(profile: dict) -> None:
+        weights = profile.get('weights', {})
+        unknown = set(weights) - set(ScoringEngine.WEIGHTS)
+        if unknown:
+            raise ValueError(f"Unknown scoring weights in profile: {sorted(unknown)}")
+        
+        buy_threshold = profile.get('buy_threshold', ScoringEngine.BUY_THRESHOLD)
+        sell_threshold = profile.get('sell_threshold', ScoringEngine.SELL_THRESHOLD)
+        if sell_threshold >= buy_threshold:
+            raise ValueError("Scoring profile sell_threshold must be below buy_threshold")
+        
+        ScoringEngine.WEIGHTS = {**ScoringEngine.WEIGHTS, **{name: float(weight) for name, weight in weights.items()}}
+        ScoringEngine.BUY_THRESHOLD = float(buy_threshold)
+        ScoringEngine.SELL_THRESHOLD = float(sell_threshold)
+    
     @staticmethod
     def calculate_score(trend: str, momentum: str, strength: str, structure: str) -> float:
         trend_score = ScoringEngine.TREND_SCORES.get(trend, 0.0)
@@ -57,6 +92,33 @@ class ScoringEngine:
         
         return round(final_score, 3)
     
+    @staticmethod
+    def calculate_scores(
+        trends: np.ndarray,
+        momentums: np.ndarray,
+        strengths: np.ndarray,
+        structures: np.ndarray
+    ) -> np.ndarray:
+        trend_scores = ScoringEngine._lookup(trends, ScoringEngine.TREND_SCORES)
+        momentum_scores = ScoringEngine._lookup(momentums, ScoringEngine.MOMENTUM_SCORES)
+        strength_scores = ScoringEngine._lookup(strengths, ScoringEngine.STRENGTH_SCORES)
+        structure_scores = ScoringEngine._lookup(structures, ScoringEngine.STRUCTURE_SCORES)
+        
+        base_scores = (
+            trend_scores * ScoringEngine.WEIGHTS['trend'] +
+            momentum_scores * ScoringEngine.WEIGHTS['momentum'] +
+            structure_scores * ScoringEngine.WEIGHTS['structure']
+        )
+        
+        final_scores = base_scores * (1 + strength_scores * ScoringEngine.WEIGHTS['strength'])
+        
+        distinct_scores, positions = np.unique(np.clip(final_scores, -1.0, 1.0), return_inverse=True)
+        return np.array([round(score, 3) for score in distinct_scores.tolist()])[positions]
+    
+    @staticmethod
+    def _lookup(labels: np.ndarray, scores: Dict[str, float]) -> np.ndarray:
+        return np.select([labels == label for label in scores], list(scores.values()), default=0.0)
+    
     @staticmethod
     def get_score_breakdown(trend: str, momentum: str, strength: str, structure: str) -> Dict[str, float]:
         return {
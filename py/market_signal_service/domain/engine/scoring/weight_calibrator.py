@@ -0,0 +1,198 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.engine.scoring.scoring_engine import ScoringEngine
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+class WeightCalibrator:
+    COMPONENTS = (
+        ('trend', ScoringEngine.TREND_SCORES),
+        ('momentum', ScoringEngine.MOMENTUM_SCORES),
+        ('strength', ScoringEngine.STRENGTH_SCORES),
+        ('structure', ScoringEngine.STRUCTURE_SCORES)
+    )
+    OBJECTIVES = ('sharpe', 'return', 'hit_rate')
+    
+    @staticmethod
+    def state_count() -> int:
+        return int(np.prod([len(scores) for _, scores in WeightCalibrator.COMPONENTS]))
+    
+    @staticmethod
+    def state_scores() -> np.ndarray:
+        return np.array(
+            list(itertools.product(*(list(scores.values()) for _, scores in WeightCalibrator.COMPONENTS))),
+            dtype=np.float64
+        )
+    
+    @staticmethod
+    def component_states(ohlcv_data: pd.DataFrame, horizon: int, warmup: int = 200) -> tuple:
+        history = DecisionEngine().analyze_history(ohlcv_data)
+        
+        states = np.zeros(len(history), dtype=np.int64)
+        for name, scores in WeightCalibrator.COMPONENTS:
+            labels = getattr(history, name)
+            positions = np.select([labels == label for label in scores], list(range(len(scores))), default=-1)
+            neutral = list(scores.values()).index(0.0)
+            states = states * len(scores) + np.where(positions < 0, neutral, positions)
+        
+        close = np.asarray(ohlcv_data['close'], dtype=np.float64)
+        forward_returns = np.full(len(close), np.nan)
+        forward_returns[:-horizon] = close[horizon:] / close[:-horizon] - 1
+        
+        valid = np.isfinite(forward_returns)
+        valid[:warmup] = False
+        return states[valid], forward_returns[valid]
+    
+    @staticmethod
+    def state_statistics(states: np.ndarray, forward_returns: np.ndarray) -> Dict[str, np.ndarray]:
+        size = WeightCalibrator.state_count()
+        return {
+            'count': np.bincount(states, minlength=size).astype(np.float64),
+            'sum': np.bincount(states, weights=forward_returns, minlength=size),
+            'sum_squares': np.bincount(states, weights=forward_returns ** 2, minlength=size),
+            'up': np.bincount(states, weights=(forward_returns > 0).astype(np.float64), minlength=size),
+            'down': np.bincount(states, weights=(forward_returns < 0).astype(np.float64), minlength=size)
+        }
+    
+    @staticmethod
+    def merge_statistics(statistics: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        return {key: np.sum([stats[key] for stats in statistics], axis=0) for key in statistics[0]}
+    
+    @staticmethod
+    def weight_grid(step: float = 0.05) -> np.ndarray:
+        units = int(round(1 / step))
+        grid = [
+            (trend, momentum, strength, units - trend - momentum - strength)
+            for trend in range(units + 1)
+            for momentum in range(units + 1 - trend)
+            for strength in range(units + 1 - trend - momentum)
+        ]
+        return np.array(grid, dtype=np.float64) / units
+    
+    @staticmethod
+    def threshold_grid(start: float = 0.05, stop: float = 0.6, step: float = 0.05) -> np.ndarray:
+        return np.round(np.arange(start, stop + step / 2, step), 6)
+    
+    @staticmethod
+    def state_scores_for_weights(weights: np.ndarray) -> np.ndarray:
+        components = WeightCalibrator.state_scores()
+        trend, momentum, strength, structure = components.T
+        base = (
+            np.outer(weights[:, 0], trend) +
+            np.outer(weights[:, 1], momentum) +
+            np.outer(weights[:, 3], structure)
+        )
+        scores = np.clip(base * (1 + np.outer(weights[:, 2], strength)), -1.0, 1.0)
+        return np.round(scores, 3)
+    
+    @staticmethod
+    def evaluate(
+        weights: np.ndarray,
+        statistics: Dict[str, np.ndarray],
+        buy_thresholds: np.ndarray,
+        sell_thresholds: np.ndarray,
+        objective: str = 'sharpe',
+        min_trade_ratio: float = 0.05
+    ) -> dict:
+        scores = WeightCalibrator.state_scores_for_weights(weights)
+        total = statistics['count'].sum()
+        
+        longs = (scores[:, None, :] >= buy_thresholds[None, :, None]).astype(np.float64)
+        shorts = (scores[:, None, :] <= sell_thresholds[None, :, None]).astype(np.float64)
+        longs = longs[:, :, None, :]
+        shorts = shorts[:, None, :, :]
+        positions = longs - shorts
+        active = np.abs(positions)
+        
+        trades = active @ statistics['count']
+        pnl = positions @ statistics['sum']
+        mean = pnl / total
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if objective == 'return':
+                value = mean
+            elif objective == 'hit_rate':
+                hits = np.maximum(positions, 0) @ statistics['up'] + np.maximum(-positions, 0) @ statistics['down']
+                value = hits / trades
+            else:
+                variance = (active @ statistics['sum_squares']) / total - mean ** 2
+                value = mean / np.sqrt(variance)
+        
+        valid = (trades / total >= min_trade_ratio) & (sell_thresholds[None, None, :] < buy_thresholds[None, :, None])
+        value = np.where(valid & np.isfinite(value), value, -np.inf)
+        
+        best = np.unravel_index(np.argmax(value), value.shape)
+        return {
+            'value': float(value[best]),
+            'weights': weights[best[0]].tolist(),
+            'buy_threshold': float(buy_thresholds[best[1]]),
+            'sell_threshold': float(sell_thresholds[best[2]]),
+            'mean_return': float(mean[best]),
+            'trade_ratio': float(trades[best] / total)
+        }
+    
+    @staticmethod
+    def calibrate(
+        histories: List[pd.DataFrame],
+        horizon: int = 4,
+        weight_step: float = 0.05,
+        buy_thresholds: Optional[np.ndarray] = None,
+        sell_thresholds: Optional[np.ndarray] = None,
+        objective: str = 'sharpe',
+        min_trade_ratio: float = 0.05,
+        workers: Optional[int] = None,
+        chunk_size: int = 64
+    ) -> dict:
+        if objective not in WeightCalibrator.OBJECTIVES:
+            raise ValueError(f"Invalid objective. Must be one of: {WeightCalibrator.OBJECTIVES}")
+        
+        buy_thresholds = buy_thresholds if buy_thresholds is not None else WeightCalibrator.threshold_grid()
+        sell_thresholds = sell_thresholds if sell_thresholds is not None else -WeightCalibrator.threshold_grid()
+        weights = WeightCalibrator.weight_grid(weight_step)
+        chunks = [weights[i:i + chunk_size] for i in range(0, len(weights), chunk_size)]
+        workers = workers or os.cpu_count() or 1
+        
+        logger.info(f"Calibrating {len(weights)} weight sets x {len(buy_thresholds) * len(sell_thresholds)} thresholds on {len(histories)} histories")
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            states = list(executor.map(WeightCalibrator._history_statistics, histories, itertools.repeat(horizon)))
+            statistics = WeightCalibrator.merge_statistics(states)
+            
+            results = list(executor.map(
+                WeightCalibrator.evaluate,
+                chunks,
+                itertools.repeat(statistics),
+                itertools.repeat(buy_thresholds),
+                itertools.repeat(sell_thresholds),
+                itertools.repeat(objective),
+                itertools.repeat(min_trade_ratio)
+            ))
+        
+        best = max(results, key=lambda result: result['value'])
+        if not np.isfinite(best['value']):
+            raise ValueError("No weight combination met the minimum trade ratio")
+        
+        return {
+            'weights': dict(zip(('trend', 'momentum', 'strength', 'structure'), best['weights'])),
+            'buy_threshold': best['buy_threshold'],
+            'sell_threshold': best['sell_threshold'],
+            'objective': objective,
+            'metrics': {
+                objective: best['value'],
+                'mean_return': best['mean_return'],
+                'trade_ratio': best['trade_ratio'],
+                'bars': int(statistics['count'].sum()),
+                'horizon': horizon,
+                'evaluated': len(weights) * len(buy_thresholds) * len(sell_thresholds)
+            }
+        }
+    
+    @staticmethod
+    def _history_statistics(ohlcv_data: pd.DataFrame, horizon: int) -> Dict[str, np.ndarray]:
+        return WeightCalibrator.state_statistics(*WeightCalibrator.component_states(ohlcv_data, horizon))
@@ -0,0 +1,90 @@
+import math
+from collections import deque
+
+class RollingMean:
+    RESUM_INTERVAL = 1024
+    
+    def __init__(self, period: int):
+        self.period = period
+        self._values = deque()
+        self._sum = 0.0
+        self._nan_count = 0
+        self._updates = 0
+    
+    def update(self, value: float) -> float:
+        self._values.append(value)
+        if math.isnan(value):
+            self._nan_count += 1
+        else:
+            self._sum += value
+        
+        if len(self._values) > self.period:
+            dropped = self._values.popleft()
+            if math.isnan(dropped):
+                self._nan_count -= 1
+            else:
+                self._sum -= dropped
+        
+        self._updates += 1
+        if self._updates % self.RESUM_INTERVAL == 0:
+            self._sum = math.fsum(v for v in self._values if not math.isnan(v))
+        
+        return self.value
+    
+    @property
+    def value(self) -> float:
+        if len(self._values) < self.period or self._nan_count > 0:
+            return math.nan
+        return self._sum / self.period
+
+class RecursiveEMA:
+    def __init__(self, span: int):
+        self.alpha = 2.0 / (span + 1)
+        self.value = math.nan
+    
+    def update(self, value: float) -> float:
+        if math.isnan(self.value):
+            self.value = value
+        else:
+            self.value = self.value + self.alpha * (value - self.value)
+        return self.value
+
+class RollingExtreme:
+    def __init__(self, period: int, mode: str = "min"):
+        self.period = period
+        self._better = (lambda a, b: a <= b) if mode == "min" else (lambda a, b: a >= b)
+        self._window = deque()
+        self._nan_positions = deque()
+        self._count = 0
+    
+    def update(self, value: float) -> float:
+        position = self._count
+        self._count += 1
+        
+        if math.isnan(value):
+            self._nan_positions.append(position)
+        else:
+            while self._window and self._better(value, self._window[-1][1]):
+                self._window.pop()
+            self._window.append((position, value))
+        
+        oldest = position - self.period + 1
+        while self._window and self._window[0][0] < oldest:
+            self._window.popleft()
+        while self._nan_positions and self._nan_positions[0] < oldest:
+            self._nan_positions.popleft()
+        
+        return self.value
+    
+    @property
+    def value(self) -> float:
+        if self._count < self.period or self._nan_positions or not self._window:
+            return math.nan
+        return self._window[0][1]
+
+def safe_ratio(numerator: float, denominator: float) -> float:
+    if denominator == 0:
+        if numerator == 0 or math.isnan(numerator):
+            return math.nan
+        return math.copysign(math.inf, numerator)
+    return numerator / denominator
@@ -0,0 +1,182 @@
+import math
+from collections import deque
+import pandas as pd
+from market_signal_service.domain.engine.streaming.rolling_state import RollingMean, RecursiveEMA, RollingExtreme, safe_ratio
+
+class StreamingIndicatorEngine:
+    def __init__(
+        self,
+        capacity: int = 300,
+        ma_periods: tuple = (50, 200),
+        ema_periods: tuple = (12, 20, 26),
+        rsi_period: int = 14,
+        macd_fast: int = 12,
+        macd_slow: int = 26,
+        macd_signal: int = 9,
+        stoch_k_period: int = 14,
+        stoch_d_period: int = 3,
+        adx_period: int = 14,
+        swing_lookback: int = 5
+    ):
+        self.capacity = capacity
+        self.count = 0
+        self.last_timestamp = None
+        
+        self._close = math.nan
+        self._prev_high = math.nan
+        self._prev_low = math.nan
+        self._prev_close = math.nan
+        
+        self._mas = {period: RollingMean(period) for period in ma_periods}
+        self.ema_periods = ema_periods
+        self._emas = {period: RecursiveEMA(period) for period in set(ema_periods) | {macd_fast, macd_slow}}
+        
+        self._rsi_gain = RollingMean(rsi_period)
+        self._rsi_loss = RollingMean(rsi_period)
+        
+        self._macd_fast = self._emas[macd_fast]
+        self._macd_slow = self._emas[macd_slow]
+        self._macd_signal = RecursiveEMA(macd_signal)
+        self._macd = math.nan
+        
+        self._stoch_low = RollingExtreme(stoch_k_period, "min")
+        self._stoch_high = RollingExtreme(stoch_k_period, "max")
+        self._stoch_d = RollingMean(stoch_d_period)
+        self._stoch_k = math.nan
+        
+        self._tr = RollingMean(adx_period)
+        self._plus_dm = RollingMean(adx_period)
+        self._minus_dm = RollingMean(adx_period)
+        self._dx = RollingMean(adx_period)
+        self._plus_di = math.nan
+        self._minus_di = math.nan
+        
+        self.swing_lookback = swing_lookback
+        self._swing_window = deque(maxlen=2 * swing_lookback + 1)
+        self._swing_highs = deque()
+        self._swing_lows = deque()
+    
+    @classmethod
+    def from_dataframe(cls, data: pd.DataFrame, **kwargs) -> "StreamingIndicatorEngine":
+        engine = cls(**kwargs)
+        timestamps = data['timestamp'] if 'timestamp' in data else [None] * len(data)
+        for row in zip(timestamps, data['open'], data['high'], data['low'], data['close'], data['volume']):
+            engine.append(*row)
+        return engine
+    
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+    
+    def append(self, timestamp, open_: float, high: float, low: float, close: float, volume: float = 0.0) -> None:
+        open_, high, low, close = float(open_), float(high), float(low), float(close)
+        
+        for ma in self._mas.values():
+            ma.update(close)
+        for ema in self._emas.values():
+            ema.update(close)
+        
+        self._update_rsi(close)
+        self._update_macd()
+        self._update_stochastic(high, low, close)
+        self._update_adx(high, low)
+        self._update_swings(high, low)
+        
+        self._prev_high = high
+        self._prev_low = low
+        self._prev_close = close
+        self._close = close
+        self.last_timestamp = timestamp
+        self.count += 1
+    
+    def _update_rsi(self, close: float) -> None:
+        delta = close - self._prev_close
+        self._rsi_gain.update(delta if delta > 0 else 0.0)
+        self._rsi_loss.update(-delta if delta < 0 else 0.0)
+    
+    def _update_macd(self) -> None:
+        self._macd = self._macd_fast.value - self._macd_slow.value
+        self._macd_signal.update(self._macd)
+    
+    def _update_stochastic(self, high: float, low: float, close: float) -> None:
+        low_min = self._stoch_low.update(low)
+        high_max = self._stoch_high.update(high)
+        self._stoch_k = 100 * safe_ratio(close - low_min, high_max - low_min)
+        self._stoch_d.update(self._stoch_k)
+    
+    def _update_adx(self, high: float, low: float) -> None:
+        plus_dm = high - self._prev_high
+        minus_dm = self._prev_low - low
+        if plus_dm < 0:
+            plus_dm = 0.0
+        if minus_dm < 0:
+            minus_dm = 0.0
+        
+        ranges = [high - low, abs(high - self._prev_close), abs(low - self._prev_close)]
+        tr = max((r for r in ranges if not math.isnan(r)), default=math.nan)
+        
+        atr = self._tr.update(tr)
+        self._plus_di = 100 * safe_ratio(self._plus_dm.update(plus_dm), atr)
+        self._minus_di = 100 * safe_ratio(self._minus_dm.update(minus_dm), atr)
+        self._dx.update(100 * safe_ratio(abs(self._plus_di - self._minus_di), self._plus_di + self._minus_di))
+    
+    def _update_swings(self, high: float, low: float) -> None:
+        lookback = self.swing_lookback
+        self._swing_window.append((self.count, high, low))
+        
+        if len(self._swing_window) == self._swing_window.maxlen:
+            index, center_high, center_low = self._swing_window[lookback]
+            neighbours = [bar for i, bar in enumerate(self._swing_window) if i != lookback]
+            if all(center_high > bar[1] for bar in neighbours):
+                self._swing_highs.append((index, center_high))
+            if all(center_low < bar[2] for bar in neighbours):
+                self._swing_lows.append((index, center_low))
+        
+        oldest = self.count + 1 - self.capacity + lookback
+        for swings in (self._swing_highs, self._swing_lows):
+            while swings and swings[0][0] < oldest:
+                swings.popleft()
+    
+    def current_price(self) -> float:
+        return self._close
+    
+    def all_mas(self) -> dict:
+        return {
+            f'ma{period}': ma.value if len(self) >= period else None
+            for period, ma in self._mas.items()
+        }
+    
+    def all_emas(self) -> dict:
+        return {f'ema{period}': self._emas[period].value for period in self.ema_periods}
+    
+    def current_rsi(self) -> float:
+        if self.count == 0:
+            return None
+        rs = safe_ratio(self._rsi_gain.value, self._rsi_loss.value)
+        return 100 - (100 / (1 + rs))
+    
+    def current_macd(self) -> dict:
+        return {
+            'macd': self._macd,
+            'signal': self._macd_signal.value,
+            'histogram': self._macd - self._macd_signal.value
+        }
+    
+    def current_stoch(self) -> dict:
+        return {
+            'k': self._stoch_k,
+            'd': self._stoch_d.value
+        }
+    
+    def current_adx(self) -> dict:
+        return {
+            'adx': self._dx.value,
+            'plus_di': self._plus_di,
+            'minus_di': self._minus_di
+        }
+    
+    def swing_points(self) -> dict:
+        offset = max(0, self.count - self.capacity)
+        return {
+            'swing_highs': [{'index': index - offset, 'value': value} for index, value in self._swing_highs],
+            'swing_lows': [{'index': index - offset, 'value': value} for index, value in self._swing_lows]
+        }
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+@dataclass
+class BackfillProgress:
+    symbol: str
+    timeframe: str
+    exchange: str
+    pages_done: int
+    pages_total: int
+    candles: int
+    elapsed: float
+    
+    @property
+    def percent(self) -> float:
+        if self.pages_total == 0:
+            return 100.0
+        return round(self.pages_done / self.pages_total * 100, 1)
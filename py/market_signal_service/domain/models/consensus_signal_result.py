@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+from market_signal_service.domain.models.signal_result import SignalResult
+
+@dataclass
+class ConsensusSignalResult:
+    signal: str
+    score: float
+    strength_percent: int
+    agreement: Optional[float]
+    mode: str
+    symbol: str
+    timeframe: str
+    exchanges: List[str]
+    weights: Dict[str, float]
+    results: Dict[str, SignalResult]
+    errors: Dict[str, str]
+    timestamp: datetime
+    
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = datetime.utcnow()
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List
+from market_signal_service.domain.models.signal_result import SignalResult
+
+@dataclass
+class MultiTimeframeSignalResult:
+    signal: str
+    score: float
+    strength_percent: int
+    symbol: str
+    exchange: str
+    timeframes: List[str]
+    weights: Dict[str, float]
+    results: Dict[str, SignalResult]
+    timestamp: datetime
+    
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = datetime.utcnow()
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import ClassVar, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+@dataclass
+class OHLCV:
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    
+    COLUMNS: ClassVar[Tuple[str, ...]] = ('open', 'high', 'low', 'close', 'volume')
+    
+    def __post_init__(self):
+        self.timestamp = np.ascontiguousarray(self.timestamp, dtype=np.int64)
+        for column in self.COLUMNS:
+            setattr(self, column, np.ascontiguousarray(getattr(self, column), dtype=np.float64))
+    
+    def __len__(self) -> int:
+        return len(self.timestamp)
+    
+    def __contains__(self, column: str) -> bool:
+        return column == 'timestamp' or column in self.COLUMNS
+    
+    def __getitem__(self, column: str) -> np.ndarray:
+        if column not in self:
+            raise KeyError(column)
+        return getattr(self, column)
+    
+    @property
+    def nbytes(self) -> int:
+        return self.timestamp.nbytes + sum(array.nbytes for array in self.arrays())
+    
+    @classmethod
+    def of(cls, data) -> "OHLCV":
+        if isinstance(data, OHLCV):
+            return data
+        return cls.from_dataframe(data)
+    
+    @classmethod
+    def from_dataframe(cls, data: pd.DataFrame) -> "OHLCV":
+        if 'timestamp' in data:
+            timestamp = data['timestamp'].to_numpy().astype('datetime64[ms]').astype(np.int64)
+        else:
+            timestamp = np.arange(len(data), dtype=np.int64)
+        
+        return cls(timestamp, *(
+            data[column].to_numpy(dtype=np.float64) if column in data else np.full(len(data), np.nan)
+            for column in cls.COLUMNS
+        ))
+    
+    @classmethod
+    def empty(cls) -> "OHLCV":
+        return cls.from_arrays(np.empty(0, dtype=np.int64), np.empty((0, len(cls.COLUMNS))))
+    
+    @classmethod
+    def from_buffers(cls, timestamps: bytes, values: bytes) -> "OHLCV":
+        return cls.from_arrays(
+            np.frombuffer(timestamps, dtype=np.int64),
+            np.frombuffer(values, dtype=np.float64).reshape(-1, len(cls.COLUMNS))
+        )
+    
+    @classmethod
+    def from_arrays(cls, timestamps: np.ndarray, values: np.ndarray) -> "OHLCV":
+        return cls(timestamps, *values.T)
+    
+    def to_buffers(self) -> Tuple[bytes, bytes]:
+        return self.timestamp.tobytes(), self.values().tobytes()
+    
+    def values(self) -> np.ndarray:
+        return np.column_stack([getattr(self, column) for column in self.COLUMNS])
+    
+    def tail(self, limit: Optional[int]) -> "OHLCV":
+        if limit is None or limit >= len(self):
+            return self
+        return OHLCV(*(array[len(self) - limit:] for array in (self.timestamp, *self.arrays())))
+    
+    def arrays(self) -> Tuple[np.ndarray, ...]:
+        return tuple(getattr(self, column) for column in self.COLUMNS)
+    
+    def datetimes(self) -> np.ndarray:
+        return self.timestamp.astype('datetime64[ms]').astype('datetime64[ns]')
+    
+    def to_frame(self) -> pd.DataFrame:
+        df = pd.DataFrame({column: getattr(self, column) for column in self.COLUMNS})
+        df.insert(0, 'timestamp', pd.to_datetime(self.timestamp, unit='ms'))
+        return df
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+@dataclass
+class SignalSeries:
+    signal: np.ndarray
+    score: np.ndarray
+    strength_percent: np.ndarray
+    trend: np.ndarray
+    momentum: np.ndarray
+    strength: np.ndarray
+    structure: np.ndarray
+    timestamp: Optional[np.ndarray] = None
+    
+    def __len__(self) -> int:
+        return len(self.score)
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        columns = {
+            'signal': self.signal,
+            'score': self.score,
+            'strength_percent': self.strength_percent,
+            'trend': self.trend,
+            'momentum': self.momentum,
+            'strength': self.strength,
+            'structure': self.structure
+        }
+        if self.timestamp is not None:
+            columns = {'timestamp': self.timestamp, **columns}
+        return pd.DataFrame(columns)
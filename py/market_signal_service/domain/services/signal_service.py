@@ -1,14 +1,35 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+import pandas as pd
 from market_signal_service.infrastructure.market_data.market_data_service import MarketDataService
+from market_signal_service.infrastructure.cache.cache_service import CacheService
 from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.engine.decision.analysis_executor import AnalysisExecutor
+from market_signal_service.domain.engine.scoring.confluence_engine import ConfluenceEngine
+from market_signal_service.domain.engine.scoring.consensus_engine import ConsensusEngine
+from market_signal_service.infrastructure.market_data.composite_series import CompositeSeries
 from market_signal_service.domain.models.signal_result import SignalResult
+from market_signal_service.domain.models.ohlcv import OHLCV
+from market_signal_service.domain.models.multi_timeframe_signal_result import MultiTimeframeSignalResult
+from market_signal_service.domain.models.consensus_signal_result import ConsensusSignalResult
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.metrics.pipeline_metrics import PipelineMetrics
+from market_signal_service.core.timeframes import normalize_timeframe, get_timeframe_minutes, get_next_candle_open_time
+from market_signal_service.core.normalize import score_to_signal, score_to_strength_percent
+from market_signal_service.core.exceptions import ExchangeError
 from market_signal_service.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 class SignalService:
     def __init__(self):
+        self.settings = get_settings()
         self.market_data_service = MarketDataService()
         self.decision_engine = DecisionEngine()
+        self.analysis_executor = AnalysisExecutor(self.settings.ANALYSIS_EXECUTOR_WORKERS, self.decision_engine)
+        self.result_cache = CacheService(max_entries=self.settings.SIGNAL_CACHE_MAX_ENTRIES, max_bytes=0)
     
     async def get_market_signal(
         self, 
@@ -17,6 +38,7 @@ class SignalService:
         exchange: str = "binance",
         limit: int = 300
     ) -> SignalResult:
+        exchange = self.market_data_service.select_exchange(exchange)
         logger.info(f"Getting signal for {symbol} on {exchange} ({timeframe})")
         
         ohlcv_data = await self.market_data_service.get_ohlcv(
@@ -26,7 +48,25 @@ class SignalService:
             exchange=exchange
         )
         
-        signal_result = self.decision_engine.analyze(
+        return await self._analyze_market_data(ohlcv_data, symbol, timeframe, exchange, limit)
+    
+    async def _analyze_market_data(
+        self,
+        ohlcv_data: Union[pd.DataFrame, OHLCV],
+        symbol: str,
+        timeframe: str,
+        exchange: str,
+        limit: int
+    ) -> SignalResult:
+        cache_key = self._result_cache_key(ohlcv_data, symbol, timeframe, exchange, limit)
+        if cache_key is not None:
+            cached_result = self.result_cache.get(cache_key)
+            PipelineMetrics.cache_lookup('signals', hit=cached_result is not None)
+            if cached_result is not None:
+                logger.info(f"Signal cache hit for {cache_key}")
+                return cached_result
+        
+        signal_result = await self.analysis_executor.analyze(
             ohlcv_data=ohlcv_data,
             symbol=symbol,
             timeframe=timeframe,
@@ -35,4 +75,184 @@ class SignalService:
         
         logger.info(f"Signal generated: {signal_result.signal} (score: {signal_result.score})")
         
+        if cache_key is not None:
+            self.result_cache.set(cache_key, signal_result, ttl=self.market_data_service.get_cache_ttl(timeframe))
+        
         return signal_result
+    
+    def _result_cache_key(
+        self,
+        ohlcv_data: Union[pd.DataFrame, OHLCV],
+        symbol: str,
+        timeframe: str,
+        exchange: str,
+        limit: int
+    ) -> Optional[str]:
+        if not (self.settings.CACHE_ENABLED and self.settings.SIGNAL_CACHE_ENABLED):
+            return None
+        
+        closed_at = self._last_closed_candle(ohlcv_data, timeframe)
+        if closed_at is None:
+            return None
+        
+        return f"{exchange}:{symbol}:{normalize_timeframe(timeframe)}:{limit}:{closed_at}"
+    
+    @staticmethod
+    def _last_closed_candle(ohlcv_data: Union[pd.DataFrame, OHLCV], timeframe: str) -> Optional[int]:
+        if 'timestamp' not in ohlcv_data or len(ohlcv_data) == 0:
+            return None
+        
+        timestamps = OHLCV.of(ohlcv_data).timestamp
+        if get_next_candle_open_time(timeframe, timestamps[-1] / 1000) <= time.time():
+            return int(timestamps[-1])
+        
+        if len(timestamps) < 2:
+            return None
+        return int(timestamps[-2])
+    
+    async def get_market_signals(
+        self,
+        requests: List[dict],
+        max_concurrency: Optional[int] = None
+    ) -> List[Union[SignalResult, Exception]]:
+        semaphore = asyncio.Semaphore(max_concurrency or get_settings().BATCH_MAX_CONCURRENCY)
+        
+        async def run(request: dict) -> SignalResult:
+            async with semaphore:
+                return await self.get_market_signal(**request)
+        
+        logger.info(f"Getting batch of {len(requests)} signals")
+        
+        return await asyncio.gather(*(run(request) for request in requests), return_exceptions=True)
+    
+    async def get_multi_timeframe_signal(
+        self,
+        symbol: str,
+        timeframes: List[str],
+        exchange: str = "binance",
+        limit: int = 300,
+        weights: Optional[Dict[str, float]] = None
+    ) -> MultiTimeframeSignalResult:
+        timeframes = sorted({normalize_timeframe(timeframe) for timeframe in timeframes}, key=get_timeframe_minutes)
+        exchange = self.market_data_service.select_exchange(exchange)
+        
+        logger.info(f"Getting multi-timeframe signal for {symbol} on {exchange} ({', '.join(timeframes)})")
+        
+        finest = timeframes[0]
+        base_limit, derived = self.market_data_service.plan_derivation(finest, timeframes[1:], limit, exchange)
+        
+        async def analyze_finest_and_derived() -> List[SignalResult]:
+            ohlcv_data = await self.market_data_service.get_ohlcv(
+                symbol=symbol,
+                timeframe=finest,
+                limit=base_limit,
+                exchange=exchange
+            )
+            return await asyncio.gather(
+                self._analyze_market_data(OHLCV.of(ohlcv_data).tail(limit), symbol, finest, exchange, limit),
+                *(self.get_market_signal(symbol, timeframe, exchange, limit) for timeframe in derived)
+            )
+        
+        direct = [timeframe for timeframe in timeframes[1:] if timeframe not in derived]
+        based, *fetched = await asyncio.gather(
+            analyze_finest_and_derived(),
+            *(self.get_market_signal(symbol, timeframe, exchange, limit) for timeframe in direct)
+        )
+        results = dict(zip([finest, *derived, *direct], [*based, *fetched]))
+        results = {timeframe: results[timeframe] for timeframe in timeframes}
+        
+        normalized_weights = ConfluenceEngine.normalize_weights(timeframes, weights)
+        score = ConfluenceEngine.calculate_score(
+            {timeframe: result.score for timeframe, result in results.items()},
+            normalized_weights
+        )
+        
+        scoring_engine = self.decision_engine.scoring_engine
+        signal = score_to_signal(score, scoring_engine.BUY_THRESHOLD, scoring_engine.SELL_THRESHOLD)
+        
+        logger.info(f"Confluence signal generated: {signal} (score: {score})")
+        
+        return MultiTimeframeSignalResult(
+            signal=signal,
+            score=score,
+            strength_percent=score_to_strength_percent(score),
+            symbol=symbol,
+            exchange=exchange,
+            timeframes=timeframes,
+            weights=normalized_weights,
+            results=results,
+            timestamp=datetime.utcnow()
+        )
+    
+    async def get_consensus_signal(
+        self,
+        symbol: str,
+        timeframe: str,
+        exchanges: Optional[List[str]] = None,
+        limit: int = 300,
+        mode: str = "exchanges"
+    ) -> ConsensusSignalResult:
+        exchanges = exchanges or [exchange.strip() for exchange in self.settings.CONSENSUS_EXCHANGES.split(',') if exchange.strip()]
+        
+        logger.info(f"Getting {mode} consensus signal for {symbol} ({timeframe}) across {', '.join(exchanges)}")
+        
+        fetched, failures = await self.market_data_service.get_ohlcv_all(symbol, timeframe, limit, exchanges)
+        series = {exchange: OHLCV.of(data) for exchange, data in fetched.items()}
+        errors = {exchange: str(error) for exchange, error in failures.items()}
+        
+        if not series:
+            raise ExchangeError(f"No exchange returned data for {symbol}: {errors}")
+        
+        aligned = CompositeSeries.align(series)
+        weights = ConsensusEngine.volume_weights(aligned)
+        scoring_engine = self.decision_engine.scoring_engine
+        
+        if mode == "composite":
+            composite = CompositeSeries.volume_weighted(series)
+            result = await self.analysis_executor.analyze(composite, symbol, timeframe, "composite")
+            results = {'composite': result}
+            score = result.score
+            signal = result.signal
+            agreement = None
+        else:
+            analyses = await asyncio.gather(*(
+                self.analysis_executor.analyze(data, symbol, timeframe, exchange)
+                for exchange, data in series.items()
+            ))
+            results = dict(zip(series, analyses))
+            score = ConsensusEngine.calculate_score({exchange: result.score for exchange, result in results.items()}, weights)
+            signal = score_to_signal(score, scoring_engine.BUY_THRESHOLD, scoring_engine.SELL_THRESHOLD)
+            agreement = ConsensusEngine.agreement({exchange: result.signal for exchange, result in results.items()}, signal)
+        
+        logger.info(f"Consensus signal generated: {signal} (score: {score}, agreement: {agreement})")
+        
+        return ConsensusSignalResult(
+            signal=signal,
+            score=score,
+            strength_percent=score_to_strength_percent(score),
+            agreement=agreement,
+            mode=mode,
+            symbol=symbol,
+            timeframe=timeframe,
+            exchanges=list(series),
+            weights={exchange: round(weight, 4) for exchange, weight in weights.items()},
+            results=results,
+            errors=errors,
+            timestamp=datetime.utcnow()
+        )
+    
+    def start(self) -> None:
+        self.market_data_service.start()
+        self.result_cache.start_expiry_worker()
+        self.analysis_executor.start()
+    
+    def get_cache_stats(self) -> dict:
+        return {
+            'market_data': self.market_data_service.get_cache_stats(),
+            'signals': self.result_cache.get_stats()
+        }
+    
+    async def close(self) -> None:
+        await self.result_cache.stop_expiry_worker()
+        self.analysis_executor.close()
+        await self.market_data_service.close()
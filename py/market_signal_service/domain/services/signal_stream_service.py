@@ -0,0 +1,122 @@
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.domain.models.signal_result import SignalResult
+from market_signal_service.core.timeframes import seconds_until_candle_close
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.market_data.rate_governor import RequestPriority, request_priority
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+StreamKey = Tuple[str, str, str, int]
+
+class SignalStreamService:
+    def __init__(self, signal_service: SignalService):
+        self.signal_service = signal_service
+        self.settings = get_settings()
+        self._subscribers: Dict[StreamKey, Set[asyncio.Queue]] = {}
+        self._tasks: Dict[StreamKey, asyncio.Task] = {}
+        self._latest: Dict[StreamKey, SignalResult] = {}
+    
+    async def stream(
+        self,
+        keys: List[StreamKey],
+        heartbeat: Optional[float] = None
+    ) -> AsyncIterator[Optional[Tuple[StreamKey, SignalResult]]]:
+        queue = asyncio.Queue(maxsize=self.settings.STREAM_QUEUE_SIZE)
+        self._subscribe(queue, keys)
+        
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            self._unsubscribe(queue, keys)
+    
+    def subscriber_count(self, key: StreamKey) -> int:
+        return len(self._subscribers.get(key, ()))
+    
+    async def close(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._subscribers.clear()
+        self._latest.clear()
+    
+    def _subscribe(self, queue: asyncio.Queue, keys: List[StreamKey]) -> None:
+        for key in keys:
+            self._subscribers.setdefault(key, set()).add(queue)
+            
+            if key in self._latest:
+                self._offer(queue, (key, self._latest[key]))
+            
+            if key not in self._tasks:
+                logger.info(f"Starting signal stream for {key}")
+                self._tasks[key] = asyncio.ensure_future(self._refresh(key))
+    
+    def _unsubscribe(self, queue: asyncio.Queue, keys: List[StreamKey]) -> None:
+        for key in keys:
+            subscribers = self._subscribers.get(key)
+            if subscribers is None:
+                continue
+            
+            subscribers.discard(queue)
+            if subscribers:
+                continue
+            
+            logger.info(f"Stopping signal stream for {key}")
+            del self._subscribers[key]
+            self._latest.pop(key, None)
+            task = self._tasks.pop(key, None)
+            if task is not None:
+                task.cancel()
+    
+    async def _refresh(self, key: StreamKey) -> None:
+        exchange, symbol, timeframe, limit = key
+        
+        while True:
+            try:
+                with request_priority(RequestPriority.BACKGROUND):
+                    result = await self.signal_service.get_market_signal(symbol, timeframe, exchange, limit)
+                
+                if self._changed(self._latest.get(key), result):
+                    self._latest[key] = result
+                    for queue in self._subscribers.get(key, ()):
+                        self._offer(queue, (key, result))
+                
+                delay = (
+                    seconds_until_candle_close(timeframe) +
+                    self.settings.CACHE_CANDLE_CLOSE_GRACE +
+                    self.settings.CACHE_TTL_JITTER
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Signal stream refresh failed for {key}: {str(e)}")
+                delay = self.settings.STREAM_RETRY_INTERVAL
+            
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _changed(previous: Optional[SignalResult], current: SignalResult) -> bool:
+        if previous is None:
+            return True
+        if previous is current:
+            return False
+        return (
+            (previous.signal, previous.score, previous.strength_percent, previous.trend,
+             previous.momentum, previous.strength, previous.structure) !=
+            (current.signal, current.score, current.strength_percent, current.trend,
+             current.momentum, current.strength, current.structure)
+        )
+    
+    @staticmethod
+    def _offer(queue: asyncio.Queue, item) -> None:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(item)
@@ -1,16 +1,37 @@
 from typing import Any, Optional
+from collections import OrderedDict
+import asyncio
+import heapq
+import sys
 import time
+import numpy as np
+import pandas as pd
+from market_signal_service.infrastructure.config.settings import get_settings
 from market_signal_service.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 class CacheService:
-    def __init__(self):
-        self._cache = {}
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        settings = get_settings()
+        self.max_entries = max_entries if max_entries is not None else settings.CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes if max_bytes is not None else settings.CACHE_MAX_BYTES
+        
+        self._cache = OrderedDict()
         self._timestamps = {}
+        self._sizes = {}
+        self._expiry_heap = []
+        self._bytes = 0
+        self._purge_task = None
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
     
     def get(self, key: str) -> Optional[Any]:
         if key not in self._cache:
+            self.misses += 1
             return None
         
         if key in self._timestamps:
@@ -18,27 +39,135 @@ class CacheService:
             if time.time() - timestamp > ttl:
                 logger.debug(f"Cache expired for key: {key}")
                 self.delete(key)
+                self.expirations += 1
+                self.misses += 1
                 return None
         
+        self._cache.move_to_end(key)
+        self.hits += 1
         logger.debug(f"Cache hit for key: {key}")
         return self._cache[key]
     
-    def set(self, key: str, value: Any, ttl: int = 60) -> None:
+    def peek(self, key: str) -> Optional[Any]:
+        if key not in self._cache:
+            return None
+        
+        timestamp, ttl = self._timestamps[key]
+        if time.time() - timestamp > ttl:
+            return None
+        
+        return self._cache[key]
+    
+    def set(self, key: str, value: Any, ttl: float = 60) -> None:
+        size = self._estimate_size(value)
+        if self.max_bytes and size > self.max_bytes:
+            logger.warning(f"Cache value for key {key} is {size} bytes, larger than the cache budget; not cached")
+            self.delete(key)
+            return
+        
+        if key in self._cache:
+            self._bytes -= self._sizes[key]
+        
+        now = time.time()
         self._cache[key] = value
-        self._timestamps[key] = (time.time(), ttl)
+        self._cache.move_to_end(key)
+        self._timestamps[key] = (now, ttl)
+        self._sizes[key] = size
+        self._bytes += size
+        heapq.heappush(self._expiry_heap, (now + ttl, key))
         logger.debug(f"Cache set for key: {key} with TTL: {ttl}s")
+        
+        self.purge_expired(now)
+        self._evict()
     
     def delete(self, key: str) -> None:
         if key in self._cache:
             del self._cache[key]
         if key in self._timestamps:
             del self._timestamps[key]
+        if key in self._sizes:
+            self._bytes -= self._sizes.pop(key)
         logger.debug(f"Cache deleted for key: {key}")
     
     def clear(self) -> None:
         self._cache.clear()
         self._timestamps.clear()
+        self._sizes.clear()
+        self._expiry_heap.clear()
+        self._bytes = 0
         logger.info("Cache cleared")
     
     def exists(self, key: str) -> bool:
         return self.get(key) is not None
+    
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        now = now if now is not None else time.time()
+        purged = 0
+        
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            entry = self._timestamps.get(key)
+            if entry is None or entry[0] + entry[1] != expires_at:
+                continue
+            self.delete(key)
+            purged += 1
+        
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [(timestamp + ttl, key) for key, (timestamp, ttl) in self._timestamps.items()]
+            heapq.heapify(self._expiry_heap)
+        
+        self.expirations += purged
+        if purged:
+            logger.debug(f"Purged {purged} expired cache entries")
+        return purged
+    
+    def start_expiry_worker(self, interval: Optional[float] = None) -> None:
+        if self._purge_task is not None and not self._purge_task.done():
+            return
+        interval = interval if interval is not None else get_settings().CACHE_PURGE_INTERVAL
+        self._purge_task = asyncio.ensure_future(self._run_expiry_worker(interval))
+    
+    async def stop_expiry_worker(self) -> None:
+        if self._purge_task is None:
+            return
+        self._purge_task.cancel()
+        try:
+            await self._purge_task
+        except asyncio.CancelledError:
+            pass
+        self._purge_task = None
+    
+    async def _run_expiry_worker(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.purge_expired()
+    
+    def get_stats(self) -> dict:
+        return {
+            'entries': len(self._cache),
+            'bytes': self._bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+    
+    def _evict(self) -> None:
+        while self._cache and (
+            (self.max_entries and len(self._cache) > self.max_entries) or
+            (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            key = next(iter(self._cache))
+            self.delete(key)
+            self.evictions += 1
+            logger.debug(f"Cache evicted key: {key}")
+    
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(index=True).sum())
+        if isinstance(value, np.ndarray) or hasattr(value, 'nbytes'):
+            return int(value.nbytes)
+        return sys.getsizeof(value)
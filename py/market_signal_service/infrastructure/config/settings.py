@@ -12,11 +12,55 @@ class Settings(BaseSettings):
     
     CACHE_ENABLED: bool = True
     CACHE_TTL: int = 60
+    CACHE_ALIGN_TO_CANDLE_CLOSE: bool = True
+    CACHE_FORMING_CANDLE_TTL: Optional[int] = None
+    CACHE_CANDLE_CLOSE_GRACE: float = 1.0
+    CACHE_TTL_JITTER: float = 2.0
+    CACHE_MAX_ENTRIES: int = 5000
+    CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    CACHE_PURGE_INTERVAL: float = 30.0
+    
+    CANDLE_BUFFER_CAPACITY: int = 1000
+    CANDLE_BUFFER_MAX_ENTRIES: int = 2000
+    CANDLE_BUFFER_TTL: int = 86400
+    RESAMPLE_ENABLED: bool = True
+    RESAMPLE_BASE_TIMEFRAME: Optional[str] = None
+    RESAMPLE_MAX_BASE_CANDLES: int = 5000
     
     DEFAULT_LIMIT: int = 300
     DEFAULT_EXCHANGE: str = "binance"
     DEFAULT_TIMEFRAME: str = "1h"
     
+    EXCHANGE_TIMEOUT: float = 10.0
+    EXCHANGE_MAX_CONNECTIONS: int = 20
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_SAFETY_FACTOR: float = 0.8
+    RATE_LIMIT_MAX_WAIT: float = 30.0
+    RATE_LIMIT_BACKOFF: float = 60.0
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RESET_TIMEOUT: float = 30.0
+    CIRCUIT_FAILOVER_ENABLED: bool = False
+    CIRCUIT_FAILOVER_ORDER: str = "binance,bybit,kucoin"
+    
+    SIGNAL_CACHE_ENABLED: bool = True
+    SIGNAL_CACHE_MAX_ENTRIES: int = 10000
+    STREAM_QUEUE_SIZE: int = 100
+    STREAM_HEARTBEAT_INTERVAL: float = 15.0
+    STREAM_RETRY_INTERVAL: float = 5.0
+    STREAM_MAX_SUBSCRIPTIONS: int = 50
+    SCORING_PROFILE_PATH: Optional[str] = None
+    ANALYSIS_EXECUTOR_WORKERS: int = 0
+    BATCH_MAX_ITEMS: int = 500
+    BATCH_MAX_CONCURRENCY: int = 16
+    CONSENSUS_EXCHANGES: str = "binance,bybit,kucoin"
+    CONSENSUS_TIMEOUT: float = 5.0
+    BACKFILL_MAX_CONCURRENCY: int = 4
+    BACKFILL_PAGE_RETRIES: int = 2
+    BACKFILL_RETRY_DELAY: float = 1.0
+    
+    BENCHMARK_BASELINE_PATH: Optional[str] = None
+    BENCHMARK_TOLERANCE: float = 0.5
+    
     BINANCE_API_KEY: Optional[str] = None
     BYBIT_API_KEY: Optional[str] = None
     KUCOIN_API_KEY: Optional[str] = None
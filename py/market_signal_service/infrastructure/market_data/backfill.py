@@ -0,0 +1,51 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from market_signal_service.domain.models.ohlcv import OHLCV
+from market_signal_service.core.timeframes import get_timeframe_seconds, get_candle_open_time
+
+class Backfill:
+    MONTHLY_TIMEFRAMES = ('1M', '1mo', '1month')
+    
+    @staticmethod
+    def plan_pages(timeframe: str, start_time: int, end_time: int, page_limit: int) -> List[Tuple[int, int]]:
+        start = int(get_candle_open_time(timeframe, start_time / 1000) * 1000)
+        if start > end_time:
+            return []
+        if timeframe.strip() in Backfill.MONTHLY_TIMEFRAMES:
+            return [(start, end_time)]
+        
+        page_ms = get_timeframe_seconds(timeframe) * 1000 * page_limit
+        starts = np.arange(start, end_time + 1, page_ms, dtype=np.int64)
+        return [(int(page_start), int(min(page_start + page_ms - 1, end_time))) for page_start in starts]
+    
+    @staticmethod
+    def stitch(pages: List[OHLCV], start_time: Optional[int] = None, end_time: Optional[int] = None) -> OHLCV:
+        pages = [page for page in pages if len(page) > 0]
+        if not pages:
+            return OHLCV.empty()
+        
+        timestamps = np.concatenate([page.timestamp for page in pages])
+        values = np.concatenate([page.values() for page in pages])
+        
+        order = np.argsort(timestamps, kind='stable')
+        timestamps = timestamps[order]
+        values = values[order]
+        
+        last = np.append(timestamps[1:] != timestamps[:-1], True)
+        timestamps = timestamps[last]
+        values = values[last]
+        
+        in_range = np.ones(len(timestamps), dtype=bool)
+        if start_time is not None:
+            in_range &= timestamps >= start_time
+        if end_time is not None:
+            in_range &= timestamps <= end_time
+        
+        return OHLCV.from_arrays(timestamps[in_range], values[in_range])
+    
+    @staticmethod
+    def count_gaps(data: OHLCV, timeframe: str) -> int:
+        if len(data) < 2 or timeframe.strip() in Backfill.MONTHLY_TIMEFRAMES:
+            return 0
+        step = get_timeframe_seconds(timeframe) * 1000
+        return int(np.sum(np.diff(data.timestamp) // step - 1))
@@ -1,57 +1,75 @@
-import requests
-import pandas as pd
-from typing import List
+import httpx
+from typing import List, Optional
 from market_signal_service.core.exceptions import ExchangeError, NoDataError
+from market_signal_service.domain.models.ohlcv import OHLCV
+from market_signal_service.infrastructure.market_data.kline_parser import KlineParser
+from market_signal_service.infrastructure.market_data.rate_governor import get_rate_governor
+from market_signal_service.infrastructure.config.settings import get_settings
 from market_signal_service.infrastructure.logging.logger import get_logger
 logger = get_logger(__name__)
 
 class BinanceClient:
     BASE_URL = "https://api.binance.com/api/v3"
+    KLINES_WEIGHT = 2
+    PAGE_LIMIT = 1000
     
     def __init__(self):
-        self.session = requests.Session()
+        settings = get_settings()
+        self.rate_governor = get_rate_governor('binance')
+        self.client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            timeout=settings.EXCHANGE_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=settings.EXCHANGE_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.EXCHANGE_MAX_CONNECTIONS
+            )
+        )
     
-    def get_klines(self, symbol: str, interval: str, limit: int = 300) -> pd.DataFrame:
+    async def get_klines(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 300,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None
+    ) -> OHLCV:
         try:
-            url = f"{self.BASE_URL}/klines"
             params = {
                 'symbol': symbol,
                 'interval': interval,
                 'limit': limit
             }
+            if start_time is not None:
+                params['startTime'] = start_time
+            if end_time is not None:
+                params['endTime'] = end_time
             
             logger.debug(f"Fetching klines from Binance: {symbol} {interval}")
             
-            response = self.session.get(url, params=params, timeout=10)
+            await self.rate_governor.acquire(self.KLINES_WEIGHT)
+            response = await self.client.get("/klines", params=params)
+            self.rate_governor.observe(response.status_code, response.headers)
             response.raise_for_status()
             
-            data = response.json()
+            data = KlineParser.decode(response.content)
             
             if not data or len(data) == 0:
                 raise NoDataError(f"No data returned from Binance for {symbol}")
             
-            df = pd.DataFrame(data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
+            ohlcv = KlineParser.parse(data, KlineParser.BINANCE_COLUMNS)
             
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df['open'] = df['open'].astype(float)
-            df['high'] = df['high'].astype(float)
-            df['low'] = df['low'].astype(float)
-            df['close'] = df['close'].astype(float)
-            df['volume'] = df['volume'].astype(float)
+            logger.info(f"Fetched {len(ohlcv)} candles from Binance for {symbol}")
             
-            df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+            return ohlcv
             
-            logger.info(f"Fetched {len(df)} candles from Binance for {symbol}")
-            
-            return df
-            
-        except requests.exceptions.RequestException as e:
+        except NoDataError:
+            raise
+        except httpx.HTTPError as e:
             logger.error(f"Binance API request failed: {str(e)}")
             raise ExchangeError(f"Failed to fetch data from Binance: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error in Binance client: {str(e)}")
             raise ExchangeError(f"Binance error: {str(e)}")
+    
+    async def close(self) -> None:
+        await self.client.aclose()
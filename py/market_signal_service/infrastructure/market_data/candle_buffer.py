@@ -0,0 +1,89 @@
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+from market_signal_service.domain.models.ohlcv import OHLCV
+
+class CandleBuffer:
+    COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._timestamps = np.zeros(capacity, dtype=np.int64)
+        self._values = np.zeros((capacity, len(self.COLUMNS)), dtype=np.float64)
+        self._start = 0
+        self._size = 0
+        self.fresh_until = 0.0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @property
+    def nbytes(self) -> int:
+        return self._timestamps.nbytes + self._values.nbytes
+    
+    @property
+    def first_timestamp(self) -> Optional[int]:
+        if self._size == 0:
+            return None
+        return int(self._timestamps[self._start])
+    
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        if self._size == 0:
+            return None
+        return int(self._timestamps[(self._start + self._size - 1) % self.capacity])
+    
+    def upsert_ohlcv(self, data: OHLCV) -> int:
+        data = OHLCV.of(data)
+        return self.upsert(data.timestamp, data.values())
+    
+    def upsert(self, timestamps: np.ndarray, values: np.ndarray) -> int:
+        last_timestamp = self.last_timestamp
+        
+        if last_timestamp is not None:
+            forming = np.flatnonzero(timestamps == last_timestamp)
+            if len(forming) > 0:
+                self._values[(self._start + self._size - 1) % self.capacity] = values[forming[-1]]
+            
+            newer = timestamps > last_timestamp
+            timestamps = timestamps[newer]
+            values = values[newer]
+        
+        appended = len(timestamps)
+        if appended == 0:
+            return 0
+        
+        if appended >= self.capacity:
+            self._timestamps[:] = timestamps[-self.capacity:]
+            self._values[:] = values[-self.capacity:]
+            self._start = 0
+            self._size = self.capacity
+            return appended
+        
+        positions = (self._start + self._size + np.arange(appended)) % self.capacity
+        self._timestamps[positions] = timestamps
+        self._values[positions] = values
+        
+        overflow = max(0, self._size + appended - self.capacity)
+        self._start = (self._start + overflow) % self.capacity
+        self._size = min(self._size + appended, self.capacity)
+        
+        return appended
+    
+    def arrays(self, since: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        positions = (self._start + np.arange(self._size)) % self.capacity
+        timestamps = self._timestamps[positions]
+        values = self._values[positions]
+        
+        if since is not None:
+            newer = timestamps >= since
+            return timestamps[newer], values[newer]
+        return timestamps, values
+    
+    def to_ohlcv(self, limit: Optional[int] = None) -> OHLCV:
+        count = self._size if limit is None else min(limit, self._size)
+        positions = (self._start + np.arange(self._size - count, self._size)) % self.capacity
+        return OHLCV.from_arrays(self._timestamps[positions], self._values[positions])
+    
+    def to_frame(self, limit: Optional[int] = None) -> pd.DataFrame:
+        return self.to_ohlcv(limit).to_frame()
@@ -0,0 +1,67 @@
+import time
+from market_signal_service.core.exceptions import CircuitOpenError
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+class CircuitBreaker:
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+    
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+    
+    def is_open(self) -> bool:
+        if self.state == self.OPEN:
+            return time.monotonic() - self.opened_at < self.reset_timeout
+        return self.state == self.HALF_OPEN and self.probing
+    
+    def before_call(self) -> None:
+        if self.state == self.CLOSED:
+            return
+        
+        if self.state == self.OPEN:
+            remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(f"{self.name} circuit is open, retrying in {remaining:.1f}s")
+            self.state = self.HALF_OPEN
+            self.probing = False
+            logger.info(f"{self.name} circuit half-open, sending probe request")
+        
+        if self.probing:
+            raise CircuitOpenError(f"{self.name} circuit is half-open and a probe request is in flight")
+        self.probing = True
+    
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info(f"{self.name} circuit closed after successful probe")
+        self.state = self.CLOSED
+        self.failures = 0
+        self.probing = False
+    
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.probing = False
+        
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"{self.name} circuit opened after {self.failures} consecutive failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+    
+    def release(self) -> None:
+        self.probing = False
+    
+    def get_stats(self) -> dict:
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'rejecting': self.is_open()
+        }
@@ -0,0 +1,46 @@
+from functools import reduce
+from typing import Dict
+import numpy as np
+from market_signal_service.domain.models.ohlcv import OHLCV
+from market_signal_service.core.exceptions import NoDataError
+
+class CompositeSeries:
+    PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+    
+    @staticmethod
+    def common_timestamps(series: Dict[str, OHLCV]) -> np.ndarray:
+        return reduce(np.intersect1d, (data.timestamp for data in series.values()))
+    
+    @staticmethod
+    def align(series: Dict[str, OHLCV]) -> Dict[str, OHLCV]:
+        timestamps = CompositeSeries.common_timestamps(series)
+        aligned = {}
+        
+        for exchange, data in series.items():
+            positions = np.searchsorted(data.timestamp, timestamps)
+            aligned[exchange] = OHLCV.from_arrays(timestamps, data.values()[positions])
+        
+        return aligned
+    
+    @staticmethod
+    def volume_weighted(series: Dict[str, OHLCV]) -> OHLCV:
+        if not series:
+            raise NoDataError("No exchange data to build a composite series from")
+        
+        aligned = CompositeSeries.align(series)
+        timestamps = next(iter(aligned.values())).timestamp
+        if len(timestamps) == 0:
+            raise NoDataError("Exchange candles share no common timestamps")
+        
+        volumes = np.vstack([data.volume for data in aligned.values()])
+        total_volume = volumes.sum(axis=0)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weights = np.where(total_volume > 0, volumes / total_volume, 1.0 / len(aligned))
+        
+        prices = {
+            column: (np.vstack([getattr(data, column) for data in aligned.values()]) * weights).sum(axis=0)
+            for column in CompositeSeries.PRICE_COLUMNS
+        }
+        
+        return OHLCV(timestamp=timestamps, volume=total_volume, **prices)
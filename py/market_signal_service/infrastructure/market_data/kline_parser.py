@@ -0,0 +1,41 @@
+from operator import itemgetter
+from typing import Any, Sequence
+import numpy as np
+import orjson
+from market_signal_service.domain.models.ohlcv import OHLCV
+
+class KlineParser:
+    BINANCE_COLUMNS = (0, 1, 2, 3, 4, 5)
+    BYBIT_COLUMNS = (0, 1, 2, 3, 4, 5)
+    KUCOIN_COLUMNS = (0, 1, 3, 4, 2, 5)
+    
+    @staticmethod
+    def decode(content: bytes) -> Any:
+        return orjson.loads(content)
+    
+    @staticmethod
+    def parse(
+        rows: Sequence[Sequence],
+        columns: tuple,
+        descending: bool = False,
+        timestamp_scale: int = 1
+    ) -> OHLCV:
+        count = len(rows)
+        if descending:
+            rows = rows[::-1]
+        
+        timestamp = np.fromiter(map(itemgetter(columns[0]), rows), dtype=np.int64, count=count)
+        if timestamp_scale != 1:
+            timestamp *= timestamp_scale
+        
+        values = [
+            np.fromiter(map(itemgetter(column), rows), dtype=np.float64, count=count)
+            for column in columns[1:]
+        ]
+        
+        ohlcv = OHLCV(timestamp, *values)
+        if count > 1 and np.any(timestamp[1:] < timestamp[:-1]):
+            order = np.argsort(timestamp, kind='stable')
+            ohlcv = OHLCV(timestamp[order], *(column[order] for column in values))
+        
+        return ohlcv
@@ -1,21 +1,40 @@
-import requests
-import pandas as pd
-from typing import List
+import httpx
+from typing import List, Optional
 from market_signal_service.core.exceptions import ExchangeError, NoDataError
+from market_signal_service.domain.models.ohlcv import OHLCV
+from market_signal_service.infrastructure.market_data.kline_parser import KlineParser
+from market_signal_service.infrastructure.market_data.rate_governor import get_rate_governor
+from market_signal_service.infrastructure.config.settings import get_settings
 from market_signal_service.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 class KuCoinClient:
     BASE_URL = "https://api.kucoin.com/api/v1"
+    KLINES_WEIGHT = 3
+    PAGE_LIMIT = 1500
     
     def __init__(self):
-        self.session = requests.Session()
+        settings = get_settings()
+        self.rate_governor = get_rate_governor('kucoin')
+        self.client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            timeout=settings.EXCHANGE_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=settings.EXCHANGE_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.EXCHANGE_MAX_CONNECTIONS
+            )
+        )
     
-    def get_klines(self, symbol: str, interval: str, limit: int = 300) -> pd.DataFrame:
+    async def get_klines(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 300,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None
+    ) -> OHLCV:
         try:
-            url = f"{self.BASE_URL}/market/candles"
-            
             interval_map = {
                 '1m': '1min',
                 '5m': '5min',
@@ -31,13 +50,19 @@ class KuCoinClient:
                 'symbol': symbol,
                 'type': kucoin_interval
             }
+            if start_time is not None:
+                params['startAt'] = start_time // 1000
+            if end_time is not None:
+                params['endAt'] = end_time // 1000
             
             logger.debug(f"Fetching klines from KuCoin: {symbol} {kucoin_interval}")
             
-            response = self.session.get(url, params=params, timeout=10)
+            await self.rate_governor.acquire(self.KLINES_WEIGHT)
+            response = await self.client.get("/market/candles", params=params)
+            self.rate_governor.observe(response.status_code, response.headers)
             response.raise_for_status()
             
-            result = response.json()
+            result = KlineParser.decode(response.content)
             
             if result.get('code') != '200000':
                 raise ExchangeError(f"KuCoin API error: {result.get('msg')}")
@@ -47,28 +72,20 @@ class KuCoinClient:
             if not data or len(data) == 0:
                 raise NoDataError(f"No data returned from KuCoin for {symbol}")
             
-            df = pd.DataFrame(data, columns=[
-                'timestamp', 'open', 'close', 'high', 'low', 'volume', 'turnover'
-            ])
-            
-            df['timestamp'] = pd.to_datetime(df['timestamp'].astype(float), unit='s')
-            df['open'] = df['open'].astype(float)
-            df['high'] = df['high'].astype(float)
-            df['low'] = df['low'].astype(float)
-            df['close'] = df['close'].astype(float)
-            df['volume'] = df['volume'].astype(float)
+            ohlcv = KlineParser.parse(data, KlineParser.KUCOIN_COLUMNS, descending=True, timestamp_scale=1000).tail(limit)
             
-            df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-            df = df.sort_values('timestamp').reset_index(drop=True)
-            df = df.tail(limit)
+            logger.info(f"Fetched {len(ohlcv)} candles from KuCoin for {symbol}")
             
-            logger.info(f"Fetched {len(df)} candles from KuCoin for {symbol}")
+            return ohlcv
             
-            return df
-            
-        except requests.exceptions.RequestException as e:
+        except NoDataError:
+            raise
+        except httpx.HTTPError as e:
             logger.error(f"KuCoin API request failed: {str(e)}")
             raise ExchangeError(f"Failed to fetch data from KuCoin: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error in KuCoin client: {str(e)}")
             raise ExchangeError(f"KuCoin error: {str(e)}")
+    
+    async def close(self) -> None:
+        await self.client.aclose()
@@ -1,20 +1,47 @@
-import pandas as pd
+import asyncio
+import random
+import httpx
+from typing import Callable, Dict, List, Optional, Tuple
+import time
 from market_signal_service.infrastructure.market_data.binance_client import BinanceClient
 from market_signal_service.infrastructure.market_data.bybit_client import BybitClient
 from market_signal_service.infrastructure.market_data.kucoin_client import KuCoinClient
+from market_signal_service.infrastructure.market_data.candle_buffer import CandleBuffer
+from market_signal_service.infrastructure.market_data.resampler import Resampler
+from market_signal_service.infrastructure.market_data.backfill import Backfill
+from market_signal_service.infrastructure.market_data.circuit_breaker import CircuitBreaker
+from market_signal_service.infrastructure.market_data.rate_governor import RequestPriority, request_priority, get_request_priority, get_rate_governor
+from market_signal_service.domain.models.ohlcv import OHLCV
+from market_signal_service.domain.models.backfill_progress import BackfillProgress
 from market_signal_service.infrastructure.cache.cache_service import CacheService
-from market_signal_service.core.exceptions import InvalidSymbolError
-from market_signal_service.core.timeframes import normalize_timeframe
+from market_signal_service.infrastructure.cache.single_flight import SingleFlight
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.metrics.pipeline_metrics import PipelineMetrics
+from market_signal_service.core.exceptions import CircuitOpenError, ExchangeError, InvalidSymbolError, NoDataError
+from market_signal_service.core.symbols import to_exchange_symbol
+from market_signal_service.core.timeframes import VALID_TIMEFRAMES, normalize_timeframe, get_timeframe_minutes, seconds_until_candle_close
 from market_signal_service.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 class MarketDataService:
     def __init__(self):
+        self.settings = get_settings()
         self.binance_client = BinanceClient()
         self.bybit_client = BybitClient()
         self.kucoin_client = KuCoinClient()
+        self.clients = {
+            'binance': self.binance_client,
+            'bybit': self.bybit_client,
+            'kucoin': self.kucoin_client
+        }
         self.cache_service = CacheService()
+        self.candle_buffers = CacheService(max_entries=self.settings.CANDLE_BUFFER_MAX_ENTRIES)
+        self.single_flight = SingleFlight()
+        self.circuit_breakers = {
+            exchange: CircuitBreaker(exchange, self.settings.CIRCUIT_FAILURE_THRESHOLD, self.settings.CIRCUIT_RESET_TIMEOUT)
+            for exchange in self.clients
+        }
     
     async def get_ohlcv(
         self, 
@@ -22,7 +49,7 @@ class MarketDataService:
         timeframe: str, 
         limit: int = 300, 
         exchange: str = "binance"
-    ) -> pd.DataFrame:
+    ) -> OHLCV:
         if not symbol or len(symbol.strip()) == 0:
             raise InvalidSymbolError("Symbol cannot be empty")
         
@@ -30,24 +57,361 @@ class MarketDataService:
         exchange = exchange.lower()
         timeframe = normalize_timeframe(timeframe)
         
-        cache_key = f"{exchange}:{symbol}:{timeframe}"
-        cached_data = self.cache_service.get(cache_key)
+        with PipelineMetrics.MARKET_DATA.time():
+            return await self._get_exchange_ohlcv(symbol, timeframe, limit, exchange)
+    
+    async def _get_exchange_ohlcv(self, symbol: str, timeframe: str, limit: int, exchange: str) -> OHLCV:
+        cache_key = f"{exchange}:{symbol}:{timeframe}:{limit}"
+        with PipelineMetrics.CACHE_LOOKUP.time():
+            cached_data = self.cache_service.get(cache_key) if self.settings.CACHE_ENABLED else None
         
         if cached_data is not None:
+            PipelineMetrics.cache_lookup('ohlcv', hit=True)
             logger.info(f"Cache hit for {cache_key}")
             return cached_data
         
+        PipelineMetrics.cache_lookup('ohlcv', hit=False)
         logger.info(f"Cache miss for {cache_key}, fetching from exchange")
         
-        if exchange == "binance":
-            data = self.binance_client.get_klines(symbol, timeframe, limit)
-        elif exchange == "bybit":
-            data = self.bybit_client.get_klines(symbol, timeframe, limit)
-        elif exchange == "kucoin":
-            data = self.kucoin_client.get_klines(symbol, timeframe, limit)
-        else:
+        client = self.clients.get(exchange)
+        if client is None:
+            raise InvalidSymbolError(f"Unsupported exchange: {exchange}")
+        
+        priority = get_request_priority()
+        flight_key = cache_key if priority == RequestPriority.INTERACTIVE else f"{cache_key}:{priority}"
+        
+        return await self.single_flight.do(
+            flight_key,
+            lambda: self._fetch_and_cache(client, cache_key, exchange, symbol, timeframe, limit)
+        )
+    
+    def select_exchange(self, exchange: str) -> str:
+        exchange = exchange.lower()
+        circuit_breaker = self.circuit_breakers.get(exchange)
+        if not self.settings.CIRCUIT_FAILOVER_ENABLED or circuit_breaker is None or not circuit_breaker.is_open():
+            return exchange
+        
+        for fallback in self.settings.CIRCUIT_FAILOVER_ORDER.split(','):
+            fallback = fallback.strip()
+            if fallback != exchange and fallback in self.circuit_breakers and not self.circuit_breakers[fallback].is_open():
+                logger.warning(f"{exchange} circuit is open, failing over to {fallback}")
+                PipelineMetrics.EXCHANGE_FAILOVERS.labels(exchange=exchange, fallback=fallback).inc()
+                return fallback
+        
+        return exchange
+    
+    async def get_ohlcv_all(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 300,
+        exchanges: Optional[List[str]] = None,
+        timeout: Optional[float] = None
+    ) -> Tuple[Dict[str, OHLCV], Dict[str, Exception]]:
+        exchanges = exchanges or list(self.clients)
+        timeout = timeout if timeout is not None else self.settings.CONSENSUS_TIMEOUT
+        
+        outcomes = await asyncio.gather(*(
+            asyncio.wait_for(self.get_ohlcv(symbol, timeframe, limit, exchange), timeout)
+            for exchange in exchanges
+        ), return_exceptions=True)
+        
+        data = {}
+        errors = {}
+        for exchange, outcome in zip(exchanges, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                outcome = ExchangeError(f"{exchange} did not respond within {timeout}s")
+            if isinstance(outcome, Exception):
+                logger.warning(f"Fan-out fetch for {symbol} on {exchange} failed: {str(outcome)}")
+                errors[exchange] = outcome
+            else:
+                data[exchange] = outcome
+        
+        return data, errors
+    
+    async def backfill(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_time: int,
+        end_time: Optional[int] = None,
+        exchange: str = "binance",
+        max_concurrency: Optional[int] = None,
+        progress: Optional[Callable[[BackfillProgress], None]] = None,
+        priority: int = RequestPriority.BACKGROUND
+    ) -> OHLCV:
+        symbol = symbol.upper().strip()
+        exchange = exchange.lower()
+        timeframe = normalize_timeframe(timeframe)
+        end_time = end_time if end_time is not None else int(time.time() * 1000)
+        
+        client = self.clients.get(exchange)
+        if client is None:
             raise InvalidSymbolError(f"Unsupported exchange: {exchange}")
         
-        self.cache_service.set(cache_key, data, ttl=60)
+        pages = Backfill.plan_pages(timeframe, start_time, end_time, client.PAGE_LIMIT)
+        semaphore = asyncio.Semaphore(max_concurrency or self.settings.BACKFILL_MAX_CONCURRENCY)
+        started = time.perf_counter()
+        done = 0
+        candles = 0
+        
+        logger.info(f"Backfilling {symbol} {timeframe} on {exchange} in {len(pages)} pages")
+        
+        async def fetch_page(page_start: int, page_end: int) -> OHLCV:
+            nonlocal done, candles
+            async with semaphore:
+                with request_priority(priority):
+                    data = await self._fetch_page(client, exchange, symbol, timeframe, page_start, page_end)
+            
+            done += 1
+            candles += len(data)
+            if progress is not None:
+                progress(BackfillProgress(symbol, timeframe, exchange, done, len(pages), candles, time.perf_counter() - started))
+            return data
+        
+        tasks = [asyncio.ensure_future(fetch_page(page_start, page_end)) for page_start, page_end in pages]
+        try:
+            results = await asyncio.gather(*tasks)
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            raise
+        data = Backfill.stitch(results, start_time, end_time)
+        
+        if len(data) == 0:
+            raise NoDataError(f"No {timeframe} candles for {symbol} on {exchange} in the requested range")
+        
+        gaps = Backfill.count_gaps(data, timeframe)
+        if gaps:
+            logger.warning(f"Backfill for {symbol} {timeframe} on {exchange} has {gaps} missing candles")
+        
+        logger.info(f"Backfilled {len(data)} candles for {symbol} {timeframe} in {time.perf_counter() - started:.2f}s")
         
         return data
+    
+    async def _fetch_page(self, client, exchange: str, symbol: str, timeframe: str, page_start: int, page_end: int) -> OHLCV:
+        for attempt in range(self.settings.BACKFILL_PAGE_RETRIES + 1):
+            try:
+                return await self._fetch_klines(client, exchange, symbol, timeframe, client.PAGE_LIMIT, start_time=page_start, end_time=page_end)
+            except NoDataError:
+                return OHLCV.empty()
+            except CircuitOpenError:
+                raise
+            except ExchangeError as e:
+                if attempt == self.settings.BACKFILL_PAGE_RETRIES:
+                    raise
+                logger.warning(f"Backfill page {page_start} for {symbol} on {exchange} failed, retrying: {str(e)}")
+                await asyncio.sleep(self.settings.BACKFILL_RETRY_DELAY * 2 ** attempt)
+    
+    async def _fetch_and_cache(
+        self,
+        client,
+        cache_key: str,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        limit: int
+    ) -> OHLCV:
+        buffer = await self._refresh_buffer(client, exchange, symbol, timeframe, limit)
+        data = buffer.to_ohlcv(limit)
+        
+        if self.settings.CACHE_ENABLED:
+            self.cache_service.set(cache_key, data, ttl=self.get_cache_ttl(timeframe))
+        
+        return data
+    
+    def get_cache_ttl(self, timeframe: str) -> float:
+        if not self.settings.CACHE_ALIGN_TO_CANDLE_CLOSE:
+            return self.settings.CACHE_TTL
+        
+        ttl = (
+            seconds_until_candle_close(timeframe) +
+            self.settings.CACHE_CANDLE_CLOSE_GRACE +
+            random.uniform(0, self.settings.CACHE_TTL_JITTER)
+        )
+        
+        if self.settings.CACHE_FORMING_CANDLE_TTL:
+            ttl = min(ttl, self.settings.CACHE_FORMING_CANDLE_TTL)
+        
+        return ttl
+    
+    async def _refresh_buffer(self, client, exchange: str, symbol: str, timeframe: str, limit: int) -> CandleBuffer:
+        if self.settings.RESAMPLE_ENABLED:
+            buffer = await self._derive_buffer(client, exchange, symbol, timeframe, limit)
+            if buffer is not None:
+                return buffer
+        
+        return await self._refresh_exchange_buffer(client, exchange, symbol, timeframe, limit)
+    
+    async def _derive_buffer(self, client, exchange: str, symbol: str, timeframe: str, limit: int) -> Optional[CandleBuffer]:
+        base_timeframe = self._find_base_timeframe(exchange, symbol, timeframe, limit)
+        if base_timeframe is None:
+            return None
+        
+        base_limit = (limit + 1) * Resampler.ratio(base_timeframe, timeframe)
+        base = self.candle_buffers.get(f"{exchange}:{symbol}:{base_timeframe}")
+        if not self._is_fresh(base, base_limit):
+            base = await self._refresh_exchange_buffer(client, exchange, symbol, base_timeframe, base_limit)
+        if len(base) < base_limit:
+            return None
+        
+        buffer_key = f"{exchange}:{symbol}:{timeframe}"
+        buffer = self.candle_buffers.get(buffer_key)
+        since = buffer.last_timestamp if buffer is not None and len(buffer) >= limit else None
+        
+        if since is None or since < base.first_timestamp:
+            buffer = CandleBuffer(max(limit, self.settings.CANDLE_BUFFER_CAPACITY))
+            since = None
+        
+        with PipelineMetrics.RESAMPLE.time():
+            timestamps, values = Resampler.aggregate(*base.arrays(since), timeframe)
+            buffer.upsert(timestamps, values)
+        buffer.fresh_until = base.fresh_until
+        self.candle_buffers.set(buffer_key, buffer, ttl=self.settings.CANDLE_BUFFER_TTL)
+        
+        logger.debug(f"Derived {symbol} {timeframe} from {base_timeframe} candles")
+        
+        return buffer
+    
+    def plan_derivation(self, base_timeframe: str, timeframes: List[str], limit: int, exchange: str) -> Tuple[int, List[str]]:
+        client = self.clients.get(exchange)
+        if not self.settings.RESAMPLE_ENABLED or client is None:
+            return limit, []
+        
+        max_base_candles = min(self.settings.RESAMPLE_MAX_BASE_CANDLES, client.PAGE_LIMIT)
+        derivable = [
+            timeframe for timeframe in timeframes
+            if Resampler.can_derive(base_timeframe, timeframe)
+            and (limit + 1) * Resampler.ratio(base_timeframe, timeframe) <= max_base_candles
+        ]
+        base_limit = max([limit, *((limit + 1) * Resampler.ratio(base_timeframe, timeframe) for timeframe in derivable)])
+        
+        return base_limit, derivable
+    
+    def _find_base_timeframe(self, exchange: str, symbol: str, timeframe: str, limit: int) -> Optional[str]:
+        candidates = sorted(
+            (base for base in VALID_TIMEFRAMES if Resampler.can_derive(base, timeframe)),
+            key=get_timeframe_minutes,
+            reverse=True
+        )
+        
+        for base_timeframe in candidates:
+            base = self.candle_buffers.peek(f"{exchange}:{symbol}:{base_timeframe}")
+            if base is not None and len(base) >= (limit + 1) * Resampler.ratio(base_timeframe, timeframe):
+                return base_timeframe
+        
+        base_timeframe = self.settings.RESAMPLE_BASE_TIMEFRAME
+        if base_timeframe in candidates:
+            if (limit + 1) * Resampler.ratio(base_timeframe, timeframe) <= self.settings.RESAMPLE_MAX_BASE_CANDLES:
+                return base_timeframe
+        
+        return None
+    
+    async def _refresh_exchange_buffer(self, client, exchange: str, symbol: str, timeframe: str, limit: int) -> CandleBuffer:
+        buffer_key = f"{exchange}:{symbol}:{timeframe}"
+        buffer = self.candle_buffers.get(buffer_key)
+        
+        if buffer is not None and len(buffer) >= limit:
+            if await self._append_new_candles(client, exchange, buffer, symbol, timeframe, limit):
+                buffer.fresh_until = time.time() + self.get_cache_ttl(timeframe)
+                return buffer
+        
+        data = await self._fetch_history(client, exchange, symbol, timeframe, limit)
+        
+        buffer = CandleBuffer(max(limit, self.settings.CANDLE_BUFFER_CAPACITY))
+        buffer.upsert_ohlcv(data)
+        buffer.fresh_until = time.time() + self.get_cache_ttl(timeframe)
+        self.candle_buffers.set(buffer_key, buffer, ttl=self.settings.CANDLE_BUFFER_TTL)
+        
+        return buffer
+    
+    def _is_fresh(self, buffer: Optional[CandleBuffer], limit: int) -> bool:
+        if buffer is None or not self.settings.CACHE_ENABLED:
+            return False
+        return len(buffer) >= limit and time.time() < buffer.fresh_until
+    
+    async def _fetch_history(self, client, exchange: str, symbol: str, timeframe: str, limit: int) -> OHLCV:
+        if limit <= client.PAGE_LIMIT:
+            return await self._fetch_klines(client, exchange, symbol, timeframe, limit)
+        
+        timeframe_ms = get_timeframe_minutes(timeframe) * 60 * 1000
+        end_time = int(time.time() * 1000)
+        start_time = (end_time // timeframe_ms - limit + 1) * timeframe_ms
+        return await self.backfill(symbol, timeframe, start_time, end_time, exchange, priority=get_request_priority())
+    
+    async def _fetch_klines(
+        self,
+        client,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None
+    ) -> OHLCV:
+        circuit_breaker = self.circuit_breakers[exchange]
+        circuit_breaker.before_call()
+        
+        PipelineMetrics.EXCHANGE_REQUESTS.labels(exchange=exchange).inc()
+        recorded = False
+        try:
+            with PipelineMetrics.EXCHANGE_FETCH.time():
+                data = await client.get_klines(to_exchange_symbol(symbol, exchange), timeframe, limit, start_time=start_time, end_time=end_time)
+            circuit_breaker.record_success()
+            recorded = True
+            return data
+        except Exception as e:
+            PipelineMetrics.EXCHANGE_ERRORS.labels(exchange=exchange, error=type(e).__name__).inc()
+            if self._is_exchange_failure(e, client.rate_governor.BAN_STATUS_CODES):
+                circuit_breaker.record_failure()
+                recorded = True
+            raise
+        finally:
+            if not recorded:
+                circuit_breaker.release()
+    
+    @staticmethod
+    def _is_exchange_failure(error: Exception, ban_status_codes: Tuple[int, ...]) -> bool:
+        cause = error.__cause__ or error.__context__
+        if isinstance(cause, httpx.HTTPStatusError):
+            status_code = cause.response.status_code
+            return status_code >= 500 or status_code in ban_status_codes
+        return isinstance(cause, httpx.TransportError)
+    
+    async def _append_new_candles(self, client, exchange: str, buffer: CandleBuffer, symbol: str, timeframe: str, limit: int) -> bool:
+        last_timestamp = buffer.last_timestamp
+        timeframe_ms = get_timeframe_minutes(timeframe) * 60 * 1000
+        missing = int((time.time() * 1000 - last_timestamp) // timeframe_ms) + 1
+        
+        if missing >= limit or missing + 1 > client.PAGE_LIMIT:
+            logger.info(f"Candle buffer for {symbol} {timeframe} is {missing} candles behind, reloading")
+            return False
+        
+        data = await self._fetch_klines(client, exchange, symbol, timeframe, missing + 1, start_time=last_timestamp)
+        
+        if len(data) == 0 or data.timestamp[0] > last_timestamp:
+            logger.info(f"Incremental refresh for {symbol} {timeframe} left a gap, reloading")
+            return False
+        
+        appended = buffer.upsert_ohlcv(data)
+        logger.debug(f"Appended {appended} new candles for {symbol} {timeframe}")
+        
+        return True
+    
+    def start(self) -> None:
+        self.cache_service.start_expiry_worker()
+        self.candle_buffers.start_expiry_worker()
+    
+    def get_cache_stats(self) -> dict:
+        return {
+            'ohlcv': self.cache_service.get_stats(),
+            'candle_buffers': self.candle_buffers.get_stats(),
+            'rate_limits': {exchange: get_rate_governor(exchange).get_stats() for exchange in self.clients},
+            'circuit_breakers': {exchange: breaker.get_stats() for exchange, breaker in self.circuit_breakers.items()}
+        }
+    
+    async def close(self) -> None:
+        await self.cache_service.stop_expiry_worker()
+        await self.candle_buffers.stop_expiry_worker()
+        for client in self.clients.values():
+            await client.close()
@@ -0,0 +1,188 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Mapping, Optional
+from market_signal_service.core.exceptions import ExchangeError
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+class RequestPriority:
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+_request_priority: ContextVar[int] = ContextVar('request_priority', default=RequestPriority.INTERACTIVE)
+
+def get_request_priority() -> int:
+    return _request_priority.get()
+
+@contextmanager
+def request_priority(priority: int):
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+class TokenBucket:
+    def __init__(self, capacity: float, window: float):
+        self.capacity = capacity
+        self.rate = capacity / window
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+    
+    def refill(self, now: Optional[float] = None) -> None:
+        now = now if now is not None else time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def time_until(self, weight: float) -> float:
+        now = time.monotonic()
+        self.refill(now)
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.tokens >= weight:
+            return 0.0
+        return (weight - self.tokens) / self.rate
+    
+    def consume(self, weight: float) -> None:
+        self.refill()
+        self.tokens -= weight
+    
+    def limit_remaining(self, remaining: float) -> None:
+        self.refill()
+        self.tokens = min(self.tokens, remaining)
+    
+    def pause(self, seconds: float) -> None:
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+        self.paused_until = max(self.paused_until, self.updated + seconds)
+
+class RateGovernor:
+    BAN_STATUS_CODES = (418, 429)
+    
+    def __init__(self, exchange: str, capacity: float, window: float):
+        settings = get_settings()
+        self.exchange = exchange
+        self.bucket = TokenBucket(capacity * settings.RATE_LIMIT_SAFETY_FACTOR, window)
+        self.max_wait = settings.RATE_LIMIT_MAX_WAIT
+        self.enabled = settings.RATE_LIMIT_ENABLED
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._dispatcher = None
+    
+    async def acquire(self, weight: float = 1, priority: Optional[int] = None) -> None:
+        if not self.enabled:
+            return
+        
+        weight = min(weight, self.bucket.capacity)
+        priority = priority if priority is not None else _request_priority.get()
+        
+        if not self._waiters and self.bucket.time_until(weight) == 0:
+            self.bucket.consume(weight)
+            return
+        
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), weight, future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        
+        try:
+            await asyncio.wait_for(future, self.max_wait)
+        except asyncio.TimeoutError:
+            raise ExchangeError(f"{self.exchange} request waited more than {self.max_wait}s for rate limit capacity")
+    
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            _, _, weight, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            
+            delay = self.bucket.time_until(weight)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            
+            heapq.heappop(self._waiters)
+            self.bucket.consume(weight)
+            future.set_result(None)
+    
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        remaining = self.remaining_from_headers(headers)
+        if remaining is not None:
+            self.bucket.limit_remaining(remaining * get_settings().RATE_LIMIT_SAFETY_FACTOR)
+        
+        if status_code in self.BAN_STATUS_CODES:
+            retry_after = self._float_header(headers, 'retry-after')
+            pause = retry_after if retry_after is not None else get_settings().RATE_LIMIT_BACKOFF
+            logger.warning(f"{self.exchange} rate limited the service (HTTP {status_code}), pausing requests for {pause}s")
+            self.bucket.pause(pause)
+    
+    def remaining_from_headers(self, headers: Mapping[str, str]) -> Optional[float]:
+        return None
+    
+    def queued(self) -> int:
+        return sum(1 for _, _, _, future in self._waiters if not future.done())
+    
+    def get_stats(self) -> dict:
+        self.bucket.refill()
+        return {
+            'tokens': round(self.bucket.tokens, 2),
+            'capacity': self.bucket.capacity,
+            'queued': self.queued()
+        }
+    
+    @staticmethod
+    def _float_header(headers: Mapping[str, str], name: str) -> Optional[float]:
+        value = headers.get(name)
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+class BinanceRateGovernor(RateGovernor):
+    LIMIT = 6000
+    
+    def __init__(self):
+        super().__init__('binance', self.LIMIT, 60)
+    
+    def remaining_from_headers(self, headers: Mapping[str, str]) -> Optional[float]:
+        used = self._float_header(headers, 'x-mbx-used-weight-1m')
+        return None if used is None else self.LIMIT - used
+
+class BybitRateGovernor(RateGovernor):
+    BAN_STATUS_CODES = (403, 429)
+    
+    def __init__(self):
+        super().__init__('bybit', 600, 5)
+    
+    def remaining_from_headers(self, headers: Mapping[str, str]) -> Optional[float]:
+        return self._float_header(headers, 'x-bapi-limit-status')
+
+class KuCoinRateGovernor(RateGovernor):
+    def __init__(self):
+        super().__init__('kucoin', 2000, 30)
+    
+    def remaining_from_headers(self, headers: Mapping[str, str]) -> Optional[float]:
+        return self._float_header(headers, 'gw-ratelimit-remaining')
+
+_governors: Dict[str, RateGovernor] = {}
+
+def get_rate_governor(exchange: str) -> RateGovernor:
+    governor = _governors.get(exchange)
+    if governor is None:
+        governor_class = {
+            'binance': BinanceRateGovernor,
+            'bybit': BybitRateGovernor,
+            'kucoin': KuCoinRateGovernor
+        }[exchange]
+        governor = _governors[exchange] = governor_class()
+    return governor
@@ -0,0 +1,44 @@
+from typing import Tuple
+import numpy as np
+from market_signal_service.core.timeframes import VALID_TIMEFRAMES, WEEK_OPEN_OFFSET_SECONDS, get_timeframe_minutes
+
+class Resampler:
+    @staticmethod
+    def can_derive(base_timeframe: str, timeframe: str) -> bool:
+        if base_timeframe == timeframe or '1M' in (base_timeframe, timeframe):
+            return False
+        if base_timeframe not in VALID_TIMEFRAMES or timeframe not in VALID_TIMEFRAMES:
+            return False
+        return get_timeframe_minutes(timeframe) % get_timeframe_minutes(base_timeframe) == 0
+    
+    @staticmethod
+    def ratio(base_timeframe: str, timeframe: str) -> int:
+        return get_timeframe_minutes(timeframe) // get_timeframe_minutes(base_timeframe)
+    
+    @staticmethod
+    def bucket_starts(timestamps: np.ndarray, timeframe: str) -> np.ndarray:
+        period = get_timeframe_minutes(timeframe) * 60 * 1000
+        offset = WEEK_OPEN_OFFSET_SECONDS * 1000 if timeframe == '1w' else 0
+        return (timestamps - offset) // period * period + offset
+    
+    @staticmethod
+    def aggregate(timestamps: np.ndarray, values: np.ndarray, timeframe: str) -> Tuple[np.ndarray, np.ndarray]:
+        if len(timestamps) == 0:
+            return timestamps, values
+        
+        buckets = Resampler.bucket_starts(timestamps, timeframe)
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(timestamps)] - 1
+        
+        aggregated = np.column_stack([
+            values[starts, 0],
+            np.maximum.reduceat(values[:, 1], starts),
+            np.minimum.reduceat(values[:, 2], starts),
+            values[ends, 3],
+            np.add.reduceat(values[:, 4], starts)
+        ])
+        bucket_timestamps = buckets[starts]
+        
+        if timestamps[0] != bucket_timestamps[0]:
+            return bucket_timestamps[1:], aggregated[1:]
+        return bucket_timestamps, aggregated
@@ -0,0 +1,163 @@
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+class Counter:
+    TYPE = 'counter'
+    
+    def __init__(self, name: str, description: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._children = {}
+    
+    def labels(self, **labels) -> "CounterChild":
+        key = tuple(str(labels[name]) for name in self.label_names)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = CounterChild()
+        return child
+    
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        self.labels(**labels).value += amount
+    
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        return [
+            (self.name, dict(zip(self.label_names, key)), child.value)
+            for key, child in sorted(self._children.items())
+        ]
+
+class CounterChild:
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = 0.0
+    
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+class Histogram:
+    TYPE = 'histogram'
+    DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self, name: str, description: str, label_names: Tuple[str, ...] = (), buckets: Optional[Tuple[float, ...]] = None):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets or self.DEFAULT_BUCKETS))
+        self._children = {}
+    
+    def labels(self, **labels) -> "HistogramChild":
+        key = tuple(str(labels[name]) for name in self.label_names)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = HistogramChild(self.buckets)
+        return child
+    
+    def observe(self, value: float, **labels) -> None:
+        self.labels(**labels).observe(value)
+    
+    def time(self, **labels) -> "Timer":
+        return Timer(self.labels(**labels))
+    
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        samples = []
+        for key, child in sorted(self._children.items()):
+            labels = dict(zip(self.label_names, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets, child.counts):
+                cumulative += count
+                samples.append((f"{self.name}_bucket", {**labels, 'le': MetricsRegistry.format_value(bound)}, cumulative))
+            samples.append((f"{self.name}_bucket", {**labels, 'le': '+Inf'}, child.count))
+            samples.append((f"{self.name}_sum", labels, child.sum))
+            samples.append((f"{self.name}_count", labels, child.count))
+        return samples
+
+class HistogramChild:
+    __slots__ = ('buckets', 'counts', 'count', 'sum')
+    
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value: float) -> None:
+        position = bisect_left(self.buckets, value)
+        if position < len(self.counts):
+            self.counts[position] += 1
+        self.count += 1
+        self.sum += value
+    
+    def time(self) -> "Timer":
+        return Timer(self)
+
+class Timer:
+    __slots__ = ('histogram', 'start')
+    
+    def __init__(self, histogram: HistogramChild):
+        self.histogram = histogram
+        self.start = 0.0
+    
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.histogram.observe(time.perf_counter() - self.start)
+
+class MetricsRegistry:
+    CONTENT_TYPE = "text/plain; version=0.0.4"
+    
+    def __init__(self):
+        self._metrics = {}
+    
+    def counter(self, name: str, description: str, label_names: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, description, label_names))
+    
+    def histogram(self, name: str, description: str, label_names: Tuple[str, ...] = (), buckets: Optional[Tuple[float, ...]] = None) -> Histogram:
+        return self._register(Histogram(name, description, label_names, buckets))
+    
+    def _register(self, metric):
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.label_names != metric.label_names:
+                raise ValueError(f"Metric {metric.name} already registered with a different type or labels")
+            return existing
+        
+        self._metrics[metric.name] = metric
+        return metric
+    
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{self.format_labels(labels)} {self.format_value(value)}")
+        return "\n".join(lines) + "\n"
+    
+    @staticmethod
+    def format_labels(labels: Dict[str, str]) -> str:
+        if not labels:
+            return ""
+        escaped = (f'{name}="{MetricsRegistry.escape_label(value)}"' for name, value in labels.items())
+        return "{" + ",".join(escaped) + "}"
+    
+    @staticmethod
+    def escape_label(value: str) -> str:
+        return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    
+    @staticmethod
+    def format_value(value: float) -> str:
+        if value == int(value):
+            return str(int(value))
+        return repr(float(value))
+
+_registry = None
+
+def get_metrics_registry() -> MetricsRegistry:
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
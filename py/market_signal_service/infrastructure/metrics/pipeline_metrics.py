@@ -0,0 +1,51 @@
+from market_signal_service.infrastructure.metrics.metrics_registry import get_metrics_registry
+
+registry = get_metrics_registry()
+
+class PipelineMetrics:
+    STAGE_SECONDS = registry.histogram(
+        'signal_pipeline_stage_seconds',
+        'Time spent in each stage of the signal pipeline',
+        ('stage',)
+    )
+    REQUESTS = registry.counter(
+        'signal_requests_total',
+        'Signal requests handled by the API',
+        ('endpoint', 'status')
+    )
+    CACHE_LOOKUPS = registry.counter(
+        'signal_cache_lookups_total',
+        'Cache lookups by cache and result',
+        ('cache', 'result')
+    )
+    EXCHANGE_REQUESTS = registry.counter(
+        'exchange_requests_total',
+        'Kline requests sent to each exchange',
+        ('exchange',)
+    )
+    EXCHANGE_ERRORS = registry.counter(
+        'exchange_errors_total',
+        'Failed kline requests by exchange and error type',
+        ('exchange', 'error')
+    )
+    EXCHANGE_FAILOVERS = registry.counter(
+        'exchange_failovers_total',
+        'Requests served by a fallback exchange while the primary circuit was open',
+        ('exchange', 'fallback')
+    )
+    
+    REQUEST = STAGE_SECONDS.labels(stage='request')
+    MARKET_DATA = STAGE_SECONDS.labels(stage='market_data')
+    CACHE_LOOKUP = STAGE_SECONDS.labels(stage='cache_lookup')
+    EXCHANGE_FETCH = STAGE_SECONDS.labels(stage='exchange_fetch')
+    RESAMPLE = STAGE_SECONDS.labels(stage='resample')
+    ANALYSIS = STAGE_SECONDS.labels(stage='analysis')
+    INDICATORS = STAGE_SECONDS.labels(stage='indicators')
+    SCORING = STAGE_SECONDS.labels(stage='scoring')
+    EXPLANATION = STAGE_SECONDS.labels(stage='explanation')
+    SERIALIZATION = STAGE_SECONDS.labels(stage='serialization')
+    ENCODING = STAGE_SECONDS.labels(stage='encoding')
+    
+    @staticmethod
+    def cache_lookup(cache: str, hit: bool) -> None:
+        PipelineMetrics.CACHE_LOOKUPS.labels(cache=cache, result='hit' if hit else 'miss').inc()
@@ -1,8 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from py.trading_bots.api.routes import signal_routes
 from market_signal_service.infrastructure.config.settings import Settings
 from market_signal_service.infrastructure.logging.logger import setup_logger
+from market_signal_service.infrastructure.metrics.metrics_registry import MetricsRegistry, get_metrics_registry
 
 settings = Settings()
 logger = setup_logger()
@@ -35,6 +37,10 @@ async def shutdown_event():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(get_metrics_registry().render(), media_type=MetricsRegistry.CONTENT_TYPE)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
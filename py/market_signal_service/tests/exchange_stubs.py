@@ -0,0 +1,45 @@
+import time
+import httpx
+from market_signal_service.core.timeframes import get_timeframe_minutes
+
+BINANCE_KLINES = [
+    [1704067200000, "100.0", "110.0", "90.0", "105.0", "12.5", 1704070799999, "0", 10, "0", "0", "0"],
+    [1704070800000, "105.0", "115.0", "95.0", "110.0", "13.5", 1704074399999, "0", 10, "0", "0", "0"]
+]
+
+BYBIT_KLINES = {
+    'retCode': 0,
+    'result': {'list': [
+        ["1704070800000", "105.0", "115.0", "95.0", "110.0", "13.5", "0"],
+        ["1704067200000", "100.0", "110.0", "90.0", "105.0", "12.5", "0"]
+    ]}
+}
+
+KUCOIN_KLINES = {
+    'code': '200000',
+    'data': [
+        ["1704070800", "105.0", "110.0", "115.0", "95.0", "13.5", "0"],
+        ["1704067200", "100.0", "105.0", "110.0", "90.0", "12.5", "0"]
+    ]
+}
+
+def mock_client(client, handler):
+    client.client = httpx.AsyncClient(base_url=client.BASE_URL, transport=httpx.MockTransport(handler))
+    return client
+
+def binance_interval_handler(calls):
+    async def handler(request):
+        params = request.url.params
+        step = get_timeframe_minutes(params['interval']) * 60 * 1000
+        limit = int(params['limit'])
+        end = int(params.get('endTime', time.time() * 1000))
+        start = int(params['startTime']) if 'startTime' in params else (end // step - limit + 1) * step
+        calls.append((params['interval'], limit))
+        
+        opens = range(-(-start // step) * step, end + 1, step)[:limit]
+        return httpx.Response(200, json=[
+            [open_time, "100.0", "110.0", "90.0", "105.0", "1.0", open_time + step - 1, "0", 1, "0", "0", "0"]
+            for open_time in opens
+        ])
+    
+    return handler
@@ -0,0 +1,44 @@
+import pytest
+from market_signal_service.domain.engine.decision.analysis_executor import AnalysisExecutor
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.models.ohlcv import OHLCV
+from market_signal_service.benchmarks.synthetic_data import SyntheticData
+from market_signal_service.infrastructure.metrics.pipeline_metrics import PipelineMetrics
+
+def test_ohlcv_round_trips_through_buffers():
+    data = SyntheticData.generate_ohlcv(50)
+    
+    restored = OHLCV.from_buffers(*data.to_buffers())
+    
+    assert restored.timestamp.tolist() == data.timestamp.tolist()
+    assert restored.values().tolist() == data.values().tolist()
+
+@pytest.mark.asyncio
+async def test_analysis_executor_matches_inline_analysis():
+    data = SyntheticData.generate(300)
+    executor = AnalysisExecutor(workers=1)
+    observed = {stage: (stage.count, stage.sum) for stage in (PipelineMetrics.INDICATORS, PipelineMetrics.SCORING, PipelineMetrics.EXPLANATION)}
+    
+    try:
+        remote = await executor.analyze(data, "BTCUSDT", "1h", "binance")
+    finally:
+        executor.close()
+    
+    for stage, (count, total) in observed.items():
+        assert stage.count == count + 1
+        assert stage.sum > total
+    
+    inline = DecisionEngine().analyze(data, "BTCUSDT", "1h", "binance")
+    
+    assert remote.signal == inline.signal
+    assert remote.score == inline.score
+    assert remote.indicators == inline.indicators
+
+@pytest.mark.asyncio
+async def test_analysis_executor_runs_inline_when_disabled():
+    executor = AnalysisExecutor(workers=0)
+    
+    result = await executor.analyze(SyntheticData.generate(300), "BTCUSDT", "1h", "binance")
+    
+    assert executor.enabled is False
+    assert result.symbol == "BTCUSDT"
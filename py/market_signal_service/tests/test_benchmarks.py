@@ -0,0 +1,45 @@
+import json
+import numpy as np
+from market_signal_service.benchmarks.benchmark_runner import BenchmarkRunner
+from market_signal_service.benchmarks.benchmark_suite import BenchmarkSuite
+from market_signal_service.benchmarks.synthetic_data import SyntheticData
+
+def test_synthetic_data_is_deterministic():
+    first = SyntheticData.generate_ohlcv(500, seed=7)
+    second = SyntheticData.generate_ohlcv(500, seed=7)
+    
+    assert len(first) == 500
+    assert np.array_equal(first.close, second.close)
+    assert np.all(first.high >= np.maximum(first.open, first.close))
+    assert np.all(first.low <= np.minimum(first.open, first.close))
+
+def test_every_benchmark_case_runs():
+    data = SyntheticData.generate_ohlcv(300)
+    
+    for name, case in BenchmarkSuite.cases().items():
+        assert case(data) is not None, name
+
+def test_run_selects_cases_by_prefix():
+    results = BenchmarkRunner.run(sizes=[300], selected=['indicator.rsi'], repeat=1, min_time=0.001)
+    
+    assert list(results) == ['indicator.rsi[300]']
+    assert results['indicator.rsi[300]']['min_ms'] > 0
+
+def test_compare_flags_regressions_past_tolerance():
+    baseline = {'a[300]': {'min_ms': 1.0}, 'b[300]': {'min_ms': 1.0}}
+    results = {'a[300]': {'min_ms': 1.2}, 'b[300]': {'min_ms': 1.6}, 'c[300]': {'min_ms': 9.0}}
+    
+    regressions = BenchmarkRunner.compare(results, baseline, tolerance=0.5)
+    
+    assert [regression['benchmark'] for regression in regressions] == ['b[300]']
+    assert regressions[0]['ratio'] == 1.6
+
+def test_baseline_round_trip(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    results = {'indicator.rsi[300]': {'median_ms': 0.2, 'min_ms': 0.1, 'loops': 10}}
+    
+    BenchmarkRunner.save_baseline(path, results)
+    
+    assert BenchmarkRunner.load_baseline(path) == results
+    with open(path) as f:
+        assert 'environment' in json.load(f)
@@ -0,0 +1,94 @@
+import asyncio
+import pytest
+import numpy as np
+from unittest.mock import patch
+from market_signal_service.infrastructure.cache.cache_service import CacheService
+from market_signal_service.domain.models.ohlcv import OHLCV
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = CacheService(max_entries=2, max_bytes=0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.get_stats()['evictions'] == 1
+
+def test_cache_respects_byte_budget():
+    cache = CacheService(max_entries=0, max_bytes=2500)
+    for key in ["a", "b", "c"]:
+        cache.set(key, np.zeros(100))
+    
+    stats = cache.get_stats()
+    assert stats['entries'] == 3
+    
+    cache.set("d", np.zeros(100))
+    
+    stats = cache.get_stats()
+    assert stats['bytes'] <= 2500
+    assert stats['evictions'] == 1
+    assert cache.get("a") is None
+
+def test_cache_sizes_ohlcv_by_its_arrays():
+    data = OHLCV.from_arrays(np.arange(1000), np.zeros((1000, 5)))
+    cache = CacheService(max_entries=0, max_bytes=100000)
+    
+    cache.set("a", data)
+    cache.set("b", data)
+    cache.set("c", data)
+    
+    assert data.nbytes == 48000
+    assert cache.get_stats()['bytes'] == 96000
+    assert cache.get("a") is None
+
+def test_cache_skips_values_larger_than_budget():
+    cache = CacheService(max_entries=0, max_bytes=100)
+    cache.set("big", np.zeros(1000))
+    
+    assert cache.get("big") is None
+    assert cache.get_stats()['bytes'] == 0
+
+def test_cache_purges_expired_entries_without_reads():
+    cache = CacheService(max_entries=0, max_bytes=0)
+    with patch("market_signal_service.infrastructure.cache.cache_service.time.time", return_value=1000.0):
+        cache.set("short", 1, ttl=10)
+        cache.set("long", 2, ttl=100)
+    
+    assert cache.purge_expired(now=1050.0) == 1
+    
+    stats = cache.get_stats()
+    assert stats['entries'] == 1
+    assert stats['expirations'] == 1
+
+def test_cache_purge_ignores_superseded_expiry():
+    cache = CacheService(max_entries=0, max_bytes=0)
+    with patch("market_signal_service.infrastructure.cache.cache_service.time.time", return_value=1000.0):
+        cache.set("key", 1, ttl=10)
+        cache.set("key", 2, ttl=100)
+    
+    assert cache.purge_expired(now=1050.0) == 0
+    assert cache.get_stats()['entries'] == 1
+
+def test_cache_counts_hits_and_misses():
+    cache = CacheService()
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("missing")
+    
+    stats = cache.get_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+@pytest.mark.asyncio
+async def test_cache_expiry_worker_purges_in_background():
+    cache = CacheService()
+    cache.set("a", 1, ttl=0.01)
+    cache.start_expiry_worker(interval=0.02)
+    
+    await asyncio.sleep(0.1)
+    await cache.stop_expiry_worker()
+    
+    assert cache.get_stats()['entries'] == 0
@@ -0,0 +1,110 @@
+import asyncio
+import time
+import pytest
+import httpx
+from unittest.mock import patch
+from market_signal_service.infrastructure.market_data.circuit_breaker import CircuitBreaker
+from market_signal_service.infrastructure.market_data.market_data_service import MarketDataService
+from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.core.exceptions import CircuitOpenError, ExchangeError
+from market_signal_service.tests.exchange_stubs import BINANCE_KLINES, BYBIT_KLINES, mock_client
+
+def test_circuit_breaker_opens_after_threshold_and_probes_once():
+    breaker = CircuitBreaker("binance", failure_threshold=3, reset_timeout=0.05)
+    
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+    
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    
+    time.sleep(0.06)
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+def test_circuit_breaker_reopens_when_probe_fails():
+    breaker = CircuitBreaker("binance", failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_failure()
+    
+    assert breaker.is_open()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_releases_half_open_circuit():
+    async def handler(request):
+        await asyncio.sleep(1)
+        return httpx.Response(200, json=BINANCE_KLINES)
+    
+    service = MarketDataService()
+    mock_client(service.binance_client, handler)
+    breaker = service.circuit_breakers['binance']
+    breaker.failure_threshold = 1
+    breaker.reset_timeout = 0.01
+    breaker.record_failure()
+    await asyncio.sleep(0.02)
+    
+    start = 1704067200000
+    backfill = asyncio.ensure_future(service.backfill("BTCUSDT", "1h", start, start + 99 * 3600000))
+    await asyncio.sleep(0.05)
+    assert breaker.probing
+    backfill.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await backfill
+    
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.probing
+    breaker.before_call()
+
+@pytest.mark.asyncio
+async def test_market_data_service_fails_fast_on_server_errors_but_not_client_errors():
+    calls = []
+    statuses = [400, 400, 503, 503]
+    
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(statuses[len(calls) - 1])
+    
+    service = MarketDataService()
+    mock_client(service.binance_client, handler)
+    
+    with patch.object(service.circuit_breakers['binance'], 'failure_threshold', 2):
+        for symbol in ["AUSDT", "BUSDT", "CUSDT", "DUSDT"]:
+            with pytest.raises(ExchangeError):
+                await service.get_ohlcv(symbol, "1h", 2, "binance")
+        
+        with pytest.raises(CircuitOpenError):
+            await service.get_ohlcv("EUSDT", "1h", 2, "binance")
+    
+    assert len(calls) == 4
+    assert service.get_cache_stats()['circuit_breakers']['binance']['state'] == CircuitBreaker.OPEN
+
+@pytest.mark.asyncio
+async def test_signal_service_fails_over_and_reports_serving_exchange():
+    service = SignalService()
+    market_data_service = service.market_data_service
+    mock_client(market_data_service.binance_client, lambda request: httpx.Response(200, json=BINANCE_KLINES))
+    mock_client(market_data_service.bybit_client, lambda request: httpx.Response(200, json=BYBIT_KLINES))
+    binance = market_data_service.circuit_breakers['binance']
+    binance.failures = binance.failure_threshold - 1
+    binance.record_failure()
+    
+    with patch.object(service.settings, 'CIRCUIT_FAILOVER_ENABLED', True):
+        result = await service.get_market_signal("BTCUSDT", "1h", "binance")
+    
+    assert result.exchange == "bybit"
+    assert market_data_service.select_exchange("binance") == "binance"
+    with pytest.raises(CircuitOpenError):
+        await market_data_service.get_ohlcv("ETHUSDT", "1h", 2, "binance")
@@ -1,7 +1,12 @@
 import pytest
 import pandas as pd
 import numpy as np
+from unittest.mock import patch
 from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.engine.indicators.adx_indicator import ADXIndicator
+from market_signal_service.domain.engine.indicators.market_structure_indicator import MarketStructureIndicator
+from market_signal_service.domain.engine.indicators.rsi_indicator import RSIIndicator
+from market_signal_service.domain.models.ohlcv import OHLCV
 
 @pytest.fixture
 def sample_data():
@@ -52,3 +57,57 @@ def test_decision_engine_sell_signal():
     
     if result.signal == "SELL":
         assert result.score < 0
+
+def test_decision_engine_computes_each_indicator_once(sample_data):
+    with patch.object(RSIIndicator, 'calculate', wraps=RSIIndicator.calculate) as rsi, \
+         patch.object(ADXIndicator, 'calculate', wraps=ADXIndicator.calculate) as adx, \
+         patch.object(MarketStructureIndicator, 'find_swing_indices', wraps=MarketStructureIndicator.find_swing_indices) as swings:
+        DecisionEngine().analyze(sample_data, "BTCUSDT", "1h", "binance")
+    
+    assert rsi.call_count == 1
+    assert adx.call_count == 1
+    assert swings.call_count == 1
+
+def test_analyze_history_matches_analyze_per_bar():
+    rng = np.random.default_rng(11)
+    close = 40000 + np.cumsum(rng.normal(0, 200, 260))
+    data = pd.DataFrame({
+        'timestamp': pd.date_range(start='2024-01-01', periods=260, freq='1h'),
+        'open': close + rng.normal(0, 50, 260),
+        'high': close + np.abs(rng.normal(0, 150, 260)),
+        'low': close - np.abs(rng.normal(0, 150, 260)),
+        'close': close,
+        'volume': rng.uniform(100, 1000, 260)
+    })
+    
+    engine = DecisionEngine()
+    history = engine.analyze_history(data)
+    
+    assert len(history) == len(data)
+    for i in range(0, len(data), 3):
+        result = engine.analyze(data.iloc[:i + 1], "BTCUSDT", "1h", "binance")
+        assert history.signal[i] == result.signal
+        assert history.score[i] == result.score
+        assert history.strength_percent[i] == result.strength_percent
+        assert history.trend[i] == result.trend
+        assert history.momentum[i] == result.momentum
+        assert history.strength[i] == result.strength
+        assert history.structure[i] == result.structure
+
+def test_analyze_history_to_dataframe(sample_data):
+    frame = DecisionEngine().analyze_history(sample_data).to_dataframe()
+    
+    assert list(frame.columns) == ['timestamp', 'signal', 'score', 'strength_percent', 'trend', 'momentum', 'strength', 'structure']
+    assert frame['signal'].isin(["BUY", "SELL", "HOLD"]).all()
+
+def test_decision_engine_accepts_ohlcv_arrays(sample_data):
+    engine = DecisionEngine()
+    from_frame = engine.analyze(sample_data, "BTCUSDT", "1h", "binance")
+    from_arrays = engine.analyze(OHLCV.from_dataframe(sample_data), "BTCUSDT", "1h", "binance")
+    
+    assert from_arrays.signal == from_frame.signal
+    assert from_arrays.score == from_frame.score
+    assert from_arrays.indicators['score_breakdown'] == from_frame.indicators['score_breakdown']
+    
+    history = engine.analyze_history(OHLCV.from_dataframe(sample_data))
+    assert (history.timestamp == sample_data['timestamp'].to_numpy()).all()
@@ -7,6 +7,9 @@ from market_signal_service.domain.engine.indicators.rsi_indicator import RSIIndi
 from market_signal_service.domain.engine.indicators.macd_indicator import MACDIndicator
 from market_signal_service.domain.engine.indicators.stochastic_indicator import StochasticIndicator
 from market_signal_service.domain.engine.indicators.adx_indicator import ADXIndicator
+from market_signal_service.domain.engine.indicators.market_structure_indicator import MarketStructureIndicator
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
+from market_signal_service.domain.models.ohlcv import OHLCV
 
 @pytest.fixture
 def sample_data():
@@ -53,3 +56,75 @@ def test_adx_indicator(sample_data):
     assert 'adx' in adx
     assert 'plus_di' in adx
     assert 'minus_di' in adx
+
+def test_indicator_context_memoizes(sample_data):
+    context = IndicatorContext(sample_data)
+    calls = []
+    
+    def compute(data, period):
+        calls.append(period)
+        return MAIndicator.calculate(data, period)
+    
+    first = context.get('ma', compute, period=50)
+    second = context.get('ma', compute, period=50)
+    context.get('ma', compute, period=200)
+    
+    assert first is second
+    assert calls == [50, 200]
+
+def test_indicator_context_matches_indicators(sample_data):
+    context = IndicatorContext(sample_data)
+    
+    assert context.current_rsi() == RSIIndicator.get_current_rsi(sample_data)
+    assert context.current_macd() == MACDIndicator.get_current_macd(sample_data)
+    assert context.all_emas() == EMAIndicator.get_all_emas(sample_data)
+    assert context.all_mas() == MAIndicator.get_all_mas(sample_data)
+
+def find_swing_points_loop(data, lookback=5):
+    highs = data['high']
+    lows = data['low']
+    
+    swing_highs = []
+    swing_lows = []
+    
+    for i in range(lookback, len(data) - lookback):
+        is_swing_high = all(highs.iloc[i] > highs.iloc[i-j] for j in range(1, lookback+1)) and \
+                       all(highs.iloc[i] > highs.iloc[i+j] for j in range(1, lookback+1))
+        
+        is_swing_low = all(lows.iloc[i] < lows.iloc[i-j] for j in range(1, lookback+1)) and \
+                      all(lows.iloc[i] < lows.iloc[i+j] for j in range(1, lookback+1))
+        
+        if is_swing_high:
+            swing_highs.append({'index': i, 'value': highs.iloc[i]})
+        if is_swing_low:
+            swing_lows.append({'index': i, 'value': lows.iloc[i]})
+    
+    return {
+        'swing_highs': swing_highs,
+        'swing_lows': swing_lows
+    }
+
+@pytest.mark.parametrize("lookback", [1, 3, 5])
+def test_find_swing_points_matches_loop(sample_data, lookback):
+    rounded = sample_data.copy()
+    rounded['high'] = (rounded['high'] / 500).round() * 500
+    rounded.loc[10, 'low'] = np.nan
+    
+    for data in (sample_data, rounded, sample_data.head(2 * lookback)):
+        assert MarketStructureIndicator.find_swing_points(data, lookback) == find_swing_points_loop(data, lookback)
+
+def test_indicators_accept_ohlcv_arrays(sample_data):
+    ohlcv = OHLCV.from_dataframe(sample_data)
+    close = sample_data['close']
+    delta = close.diff()
+    rsi = 100 - (100 / (1 + delta.where(delta > 0, 0).rolling(14).mean() / (-delta.where(delta < 0, 0)).rolling(14).mean()))
+    
+    np.testing.assert_allclose(MAIndicator.calculate(ohlcv, 50), close.rolling(50).mean())
+    np.testing.assert_array_equal(EMAIndicator.calculate(ohlcv, 20), close.ewm(span=20, adjust=False).mean())
+    np.testing.assert_allclose(RSIIndicator.calculate(ohlcv), rsi)
+    
+    for name, values in ADXIndicator.calculate(ohlcv).items():
+        assert isinstance(values, np.ndarray)
+        np.testing.assert_allclose(values, ADXIndicator.calculate(sample_data)[name])
+    
+    assert ohlcv.to_frame().equals(sample_data)
@@ -0,0 +1,378 @@
+import asyncio
+import time
+import pytest
+import httpx
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+from market_signal_service.infrastructure.market_data.binance_client import BinanceClient
+from market_signal_service.infrastructure.market_data.bybit_client import BybitClient
+from market_signal_service.infrastructure.market_data.kucoin_client import KuCoinClient
+from market_signal_service.infrastructure.market_data.market_data_service import MarketDataService
+from market_signal_service.infrastructure.market_data.candle_buffer import CandleBuffer
+from market_signal_service.infrastructure.market_data.resampler import Resampler
+from market_signal_service.infrastructure.market_data.kline_parser import KlineParser
+from market_signal_service.infrastructure.market_data.composite_series import CompositeSeries
+from market_signal_service.infrastructure.market_data.backfill import Backfill
+from market_signal_service.domain.models.ohlcv import OHLCV
+from market_signal_service.core.symbols import to_exchange_symbol
+from market_signal_service.core.exceptions import CircuitOpenError, ExchangeError
+from market_signal_service.tests.exchange_stubs import BINANCE_KLINES, BYBIT_KLINES, KUCOIN_KLINES, binance_interval_handler, mock_client
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("client_class,payload", [
+    (BinanceClient, BINANCE_KLINES),
+    (BybitClient, BYBIT_KLINES),
+    (KuCoinClient, KUCOIN_KLINES)
+])
+async def test_client_parses_klines(client_class, payload):
+    client = mock_client(client_class(), lambda request: httpx.Response(200, json=payload))
+    
+    ohlcv = await client.get_klines("BTCUSDT", "1h", 2)
+    
+    assert ohlcv.timestamp.tolist() == [1704067200000, 1704070800000]
+    assert ohlcv.close.tolist() == [105.0, 110.0]
+    assert ohlcv.high.tolist() == [110.0, 115.0]
+    assert ohlcv.close.dtype == np.float64 and ohlcv.close.flags['C_CONTIGUOUS']
+
+@pytest.mark.asyncio
+async def test_client_wraps_http_errors():
+    client = mock_client(BinanceClient(), lambda request: httpx.Response(500))
+    
+    with pytest.raises(ExchangeError):
+        await client.get_klines("BTCUSDT", "1h", 2)
+
+@pytest.mark.asyncio
+async def test_market_data_service_overlaps_exchange_requests():
+    async def slow_handler(request):
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json=BINANCE_KLINES)
+    
+    service = MarketDataService()
+    mock_client(service.binance_client, slow_handler)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(service.get_ohlcv(symbol, "1h", 2, "binance") for symbol in ["BTCUSDT", "ETHUSDT", "SOLUSDT"]))
+    
+    assert time.perf_counter() - started < 0.5
+
+@pytest.mark.asyncio
+async def test_market_data_service_coalesces_concurrent_misses():
+    calls = []
+    
+    async def handler(request):
+        calls.append(request.url)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=BINANCE_KLINES)
+    
+    service = MarketDataService()
+    mock_client(service.binance_client, handler)
+    
+    results = await asyncio.gather(*(service.get_ohlcv("BTCUSDT", "1h", 2, "binance") for _ in range(10)))
+    
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert service.single_flight.in_flight() == 0
+
+@pytest.mark.asyncio
+async def test_market_data_service_shares_fetch_failures_without_caching_them():
+    responses = [httpx.Response(500), httpx.Response(200, json=BINANCE_KLINES)]
+    
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return responses.pop(0)
+    
+    service = MarketDataService()
+    mock_client(service.binance_client, handler)
+    
+    results = await asyncio.gather(
+        *(service.get_ohlcv("BTCUSDT", "1h", 2, "binance") for _ in range(3)),
+        return_exceptions=True
+    )
+    
+    assert all(isinstance(result, ExchangeError) for result in results)
+    assert len(await service.get_ohlcv("BTCUSDT", "1h", 2, "binance")) == 2
+
+def recent_binance_klines(count, end_offset=0):
+    hour = 3600 * 1000
+    last_open = (int(time.time() * 1000) // hour - end_offset) * hour
+    return [
+        [last_open - (count - 1 - i) * hour, "100.0", "110.0", "90.0", str(100.0 + i), "1.0", 0, "0", 1, "0", "0", "0"]
+        for i in range(count)
+    ]
+
+@pytest.mark.asyncio
+async def test_market_data_service_refreshes_incrementally():
+    initial = recent_binance_klines(60, end_offset=2)
+    latest = recent_binance_klines(3)
+    requests = []
+    
+    async def handler(request):
+        requests.append(dict(request.url.params))
+        return httpx.Response(200, json=initial if len(requests) == 1 else latest)
+    
+    service = MarketDataService()
+    mock_client(service.binance_client, handler)
+    
+    first = (await service.get_ohlcv("BTCUSDT", "1h", 50, "binance")).to_frame()
+    service.cache_service.clear()
+    second = (await service.get_ohlcv("BTCUSDT", "1h", 50, "binance")).to_frame()
+    
+    assert 'startTime' not in requests[0]
+    assert int(requests[1]['startTime']) == initial[-1][0]
+    assert int(requests[1]['limit']) <= 5
+    assert len(second) == 50
+    assert second['timestamp'].iloc[-1] == pd.Timestamp(latest[-1][0], unit='ms')
+    assert second['timestamp'].is_monotonic_increasing
+    assert second['timestamp'].iloc[:-2].tolist() == first['timestamp'].iloc[2:].tolist()
+
+@pytest.mark.asyncio
+async def test_market_data_service_reloads_when_incremental_refresh_leaves_gap():
+    initial = recent_binance_klines(60, end_offset=2)
+    requests = []
+    
+    async def handler(request):
+        requests.append(dict(request.url.params))
+        if len(requests) == 2:
+            return httpx.Response(200, json=recent_binance_klines(1))
+        return httpx.Response(200, json=recent_binance_klines(60) if len(requests) == 3 else initial)
+    
+    service = MarketDataService()
+    mock_client(service.binance_client, handler)
+    
+    await service.get_ohlcv("BTCUSDT", "1h", 50, "binance")
+    service.cache_service.clear()
+    data = (await service.get_ohlcv("BTCUSDT", "1h", 50, "binance")).to_frame()
+    
+    assert len(requests) == 3
+    assert 'startTime' not in requests[2]
+    assert data['timestamp'].diff().iloc[1:].eq(pd.Timedelta(hours=1)).all()
+
+def test_candle_buffer_replaces_forming_candle_and_wraps():
+    buffer = CandleBuffer(capacity=3)
+    values = np.array([[1.0, 2.0, 0.5, 1.5, 10.0]] * 3)
+    buffer.upsert(np.array([1, 2, 3]), values)
+    
+    updated = np.array([[1.0, 2.0, 0.5, 9.0, 10.0], [1.0, 2.0, 0.5, 4.0, 10.0]])
+    appended = buffer.upsert(np.array([3, 4]), updated)
+    frame = buffer.to_frame()
+    
+    assert appended == 1
+    assert len(buffer) == 3
+    assert buffer.last_timestamp == 4
+    assert frame['close'].tolist() == [1.5, 9.0, 4.0]
+    assert len(buffer.to_frame(limit=2)) == 2
+
+def test_resampler_matches_pandas_resample():
+    timestamps = pd.date_range(start='2024-01-01 01:00', periods=200, freq='1h')
+    rng = np.random.default_rng(3)
+    values = rng.uniform(90, 110, size=(200, 5))
+    
+    buckets, aggregated = Resampler.aggregate(timestamps.to_numpy().astype('datetime64[ms]').astype(np.int64), values, '4h')
+    
+    frame = pd.DataFrame(values, columns=list(CandleBuffer.COLUMNS), index=timestamps)
+    expected = frame.resample('4h').agg({'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}).iloc[1:]
+    
+    assert (pd.to_datetime(buckets, unit='ms') == expected.index).all()
+    np.testing.assert_allclose(aggregated, expected.to_numpy())
+
+@pytest.mark.asyncio
+async def test_market_data_service_derives_coarser_timeframe_from_base_buffer():
+    klines = recent_binance_klines(60)
+    requests = []
+    
+    async def handler(request):
+        requests.append(dict(request.url.params))
+        return httpx.Response(200, json=klines if len(requests) == 1 else klines[-1:])
+    
+    service = MarketDataService()
+    mock_client(service.binance_client, handler)
+    
+    hourly = (await service.get_ohlcv("BTCUSDT", "1h", 60, "binance")).to_frame()
+    data = (await service.get_ohlcv("BTCUSDT", "4h", 10, "binance")).to_frame()
+    
+    assert [params['interval'] for params in requests] == ['1h']
+    assert len(data) == 10
+    
+    expected = hourly.set_index('timestamp').resample('4h').agg({'high': 'max', 'close': 'last', 'volume': 'sum'}).tail(10)
+    assert data['timestamp'].tolist() == expected.index.tolist()
+    np.testing.assert_allclose(data[['high', 'close', 'volume']].to_numpy(), expected.to_numpy())
+
+@pytest.mark.asyncio
+async def test_market_data_service_derives_from_paged_base_timeframe():
+    calls = []
+    service = MarketDataService()
+    mock_client(service.binance_client, binance_interval_handler(calls))
+    
+    with patch.object(service.settings, 'RESAMPLE_BASE_TIMEFRAME', '15m'):
+        hourly = await service.get_ohlcv("BTCUSDT", "1h", 300, "binance")
+        base_calls = list(calls)
+        four_hourly = await service.get_ohlcv("BTCUSDT", "4h", 50, "binance")
+    
+    assert base_calls == [('15m', 1000), ('15m', 1000)]
+    assert calls == base_calls
+    assert len(hourly) == 300 and np.all(np.diff(hourly.timestamp) == 3600000)
+    assert len(four_hourly) == 50 and np.all(np.diff(four_hourly.timestamp) == 4 * 3600000)
+
+def test_kline_parser_reorders_columns_and_sorts():
+    kucoin = KlineParser.parse(KUCOIN_KLINES['data'], KlineParser.KUCOIN_COLUMNS, descending=True, timestamp_scale=1000)
+    shuffled = KlineParser.parse([BINANCE_KLINES[1], BINANCE_KLINES[0]], KlineParser.BINANCE_COLUMNS)
+    
+    assert kucoin.timestamp.tolist() == [1704067200000, 1704070800000]
+    assert kucoin.values().tolist() == [[100.0, 110.0, 90.0, 105.0, 12.5], [105.0, 115.0, 95.0, 110.0, 13.5]]
+    assert shuffled.timestamp.tolist() == [1704067200000, 1704070800000]
+    assert shuffled.close.tolist() == [105.0, 110.0]
+
+@pytest.mark.asyncio
+async def test_market_data_service_fans_out_to_all_exchanges():
+    symbols = {}
+    
+    def handler(payload, exchange):
+        async def respond(request):
+            symbols[exchange] = request.url.params['symbol']
+            if exchange == 'bybit':
+                await asyncio.sleep(1)
+            return httpx.Response(200, json=payload)
+        return respond
+    
+    service = MarketDataService()
+    mock_client(service.binance_client, handler(BINANCE_KLINES, 'binance'))
+    mock_client(service.bybit_client, handler(BYBIT_KLINES, 'bybit'))
+    mock_client(service.kucoin_client, handler(KUCOIN_KLINES, 'kucoin'))
+    
+    data, errors = await service.get_ohlcv_all("BTCUSDT", "1h", 2, timeout=0.3)
+    
+    assert set(data) == {'binance', 'kucoin'}
+    assert isinstance(errors['bybit'], ExchangeError)
+    assert symbols == {'binance': 'BTCUSDT', 'bybit': 'BTCUSDT', 'kucoin': 'BTC-USDT'}
+
+def test_composite_series_volume_weights_aligned_candles():
+    first = OHLCV.from_arrays(np.array([0, 1, 2]), np.array([
+        [10.0, 11.0, 9.0, 10.0, 1.0],
+        [10.0, 12.0, 9.0, 11.0, 1.0],
+        [11.0, 13.0, 10.0, 12.0, 1.0]
+    ]))
+    second = OHLCV.from_arrays(np.array([1, 2, 3]), np.array([
+        [20.0, 22.0, 19.0, 21.0, 3.0],
+        [21.0, 23.0, 20.0, 22.0, 0.0],
+        [22.0, 24.0, 21.0, 23.0, 3.0]
+    ]))
+    
+    composite = CompositeSeries.volume_weighted({'binance': first, 'bybit': second})
+    
+    assert composite.timestamp.tolist() == [1, 2]
+    assert composite.close.tolist() == [18.5, 12.0]
+    assert composite.volume.tolist() == [4.0, 1.0]
+
+def test_to_exchange_symbol():
+    assert to_exchange_symbol("btcusdt", "kucoin") == "BTC-USDT"
+    assert to_exchange_symbol("BTC-USDT", "binance") == "BTCUSDT"
+    assert to_exchange_symbol("ETHBTC", "bybit") == "ETHBTC"
+    assert to_exchange_symbol("XYZ", "kucoin") == "XYZ"
+
+def binance_range_handler(calls, failures=None, delay=0.01):
+    failures = failures if failures is not None else []
+    active = {'now': 0, 'peak': 0}
+    
+    async def handler(request):
+        start = int(request.url.params['startTime'])
+        end = int(request.url.params['endTime'])
+        limit = int(request.url.params['limit'])
+        calls.append((start, end))
+        
+        if failures:
+            failures.pop()
+            return httpx.Response(500)
+        
+        active['now'] += 1
+        active['peak'] = max(active['peak'], active['now'])
+        await asyncio.sleep(delay)
+        active['now'] -= 1
+        
+        opens = range(start, end + 1, 3600000)
+        return httpx.Response(200, json=[
+            [open_time, "100.0", "110.0", "90.0", "105.0", "1.0", open_time + 3599999, "0", 1, "0", "0", "0"]
+            for open_time in list(opens)[:limit]
+        ])
+    
+    return handler, active
+
+@pytest.mark.asyncio
+async def test_market_data_service_backfills_pages_concurrently():
+    calls = []
+    handler, active = binance_range_handler(calls)
+    service = MarketDataService()
+    mock_client(service.binance_client, handler)
+    progress = []
+    
+    start = 1704067200000
+    end = start + 2499 * 3600000
+    data = await service.backfill("BTCUSDT", "1h", start, end, max_concurrency=2, progress=progress.append)
+    
+    assert len(data) == 2500
+    assert np.all(np.diff(data.timestamp) == 3600000)
+    assert data.timestamp[0] == start and data.timestamp[-1] == end
+    assert len(calls) == 3
+    assert active['peak'] <= 2
+    assert [update.pages_done for update in progress] == [1, 2, 3]
+    assert progress[-1].candles == 2500 and progress[-1].percent == 100.0
+
+@pytest.mark.asyncio
+async def test_market_data_service_backfill_retries_failed_pages():
+    calls = []
+    handler, _ = binance_range_handler(calls, failures=[True])
+    service = MarketDataService()
+    mock_client(service.binance_client, handler)
+    
+    with patch.object(service.settings, 'BACKFILL_RETRY_DELAY', 0):
+        data = await service.backfill("BTCUSDT", "1h", 1704067200000, 1704067200000 + 99 * 3600000)
+    
+    assert len(data) == 100
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_market_data_service_backfill_cancels_pages_after_failure():
+    start = 1704067200000
+    active = []
+    
+    async def handler(request):
+        if int(request.url.params['startTime']) == start:
+            return httpx.Response(500)
+        active.append(request)
+        try:
+            await asyncio.sleep(1)
+        finally:
+            active.remove(request)
+        return httpx.Response(200, json=[])
+    
+    service = MarketDataService()
+    mock_client(service.binance_client, handler)
+    
+    with patch.object(service.settings, 'BACKFILL_PAGE_RETRIES', 0):
+        with pytest.raises(ExchangeError):
+            await service.backfill("BTCUSDT", "1h", start, start + 3999 * 3600000, max_concurrency=4)
+    await asyncio.sleep(0)
+    
+    assert active == []
+
+@pytest.mark.asyncio
+async def test_market_data_service_backfill_does_not_retry_open_circuit():
+    service = MarketDataService()
+    service.circuit_breakers['binance'].failures = service.circuit_breakers['binance'].failure_threshold - 1
+    service.circuit_breakers['binance'].record_failure()
+    
+    started = time.perf_counter()
+    with pytest.raises(CircuitOpenError):
+        await service.backfill("BTCUSDT", "1h", 1704067200000, 1704067200000 + 2999 * 3600000)
+    
+    assert time.perf_counter() - started < 0.5
+
+def test_backfill_stitch_deduplicates_overlapping_pages():
+    first = OHLCV.from_arrays(np.array([0, 1, 2]), np.full((3, 5), 1.0))
+    second = OHLCV.from_arrays(np.array([2, 3, 4]), np.full((3, 5), 2.0))
+    
+    data = Backfill.stitch([first, OHLCV.empty(), second], start_time=1, end_time=3)
+    
+    assert data.timestamp.tolist() == [1, 2, 3]
+    assert data.close.tolist() == [1.0, 2.0, 2.0]
+    assert Backfill.plan_pages("1h", 1704067200500, 1704067200000 + 2500 * 3600000, 1000)[0][0] == 1704067200000
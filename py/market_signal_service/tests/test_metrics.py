@@ -0,0 +1,68 @@
+import pytest
+from unittest.mock import AsyncMock
+from market_signal_service.infrastructure.metrics.metrics_registry import MetricsRegistry
+from market_signal_service.infrastructure.metrics.pipeline_metrics import PipelineMetrics
+from market_signal_service.infrastructure.market_data.market_data_service import MarketDataService
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.benchmarks.synthetic_data import SyntheticData
+from market_signal_service.core.exceptions import ExchangeError
+
+def test_counter_renders_prometheus_text():
+    registry = MetricsRegistry()
+    requests = registry.counter('requests_total', 'Requests', ('status',))
+    
+    requests.labels(status=200).inc()
+    requests.labels(status=200).inc()
+    requests.inc(status='a"b')
+    
+    output = registry.render()
+    
+    assert "# TYPE requests_total counter" in output
+    assert 'requests_total{status="200"} 2' in output
+    assert 'requests_total{status="a\\"b"} 1' in output
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    latency = registry.histogram('latency_seconds', 'Latency', ('stage',), buckets=(0.1, 1.0))
+    
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value, stage='fetch')
+    
+    output = registry.render()
+    
+    assert 'latency_seconds_bucket{stage="fetch",le="0.1"} 1' in output
+    assert 'latency_seconds_bucket{stage="fetch",le="1"} 2' in output
+    assert 'latency_seconds_bucket{stage="fetch",le="+Inf"} 3' in output
+    assert 'latency_seconds_sum{stage="fetch"} 5.55' in output
+    assert 'latency_seconds_count{stage="fetch"} 3' in output
+
+def test_registry_returns_existing_metric_and_rejects_conflicts():
+    registry = MetricsRegistry()
+    counter = registry.counter('hits_total', 'Hits', ('cache',))
+    
+    assert registry.counter('hits_total', 'Hits', ('cache',)) is counter
+    with pytest.raises(ValueError):
+        registry.histogram('hits_total', 'Hits', ('cache',))
+
+def test_decision_engine_records_stage_latency():
+    before = PipelineMetrics.INDICATORS.count
+    
+    DecisionEngine().analyze(SyntheticData.generate_ohlcv(300), 'BTCUSDT', '1h', 'binance')
+    
+    assert PipelineMetrics.INDICATORS.count == before + 1
+    assert PipelineMetrics.ANALYSIS.sum >= PipelineMetrics.INDICATORS.sum
+
+@pytest.mark.asyncio
+async def test_market_data_service_counts_exchange_errors():
+    service = MarketDataService()
+    service.binance_client.get_klines = AsyncMock(side_effect=ExchangeError("down"))
+    errors = PipelineMetrics.EXCHANGE_ERRORS.labels(exchange='binance', error='ExchangeError')
+    before = errors.value
+    
+    try:
+        with pytest.raises(ExchangeError):
+            await service.get_ohlcv("METRICSUSDT", "1h", 10, "binance")
+    finally:
+        await service.close()
+    
+    assert errors.value == before + 1
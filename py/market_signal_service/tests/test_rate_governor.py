@@ -0,0 +1,88 @@
+import asyncio
+import time
+import pytest
+import httpx
+from market_signal_service.infrastructure.market_data.rate_governor import RateGovernor, BinanceRateGovernor, BybitRateGovernor, RequestPriority, request_priority, get_request_priority
+from market_signal_service.infrastructure.market_data.market_data_service import MarketDataService
+from market_signal_service.tests.exchange_stubs import BINANCE_KLINES, mock_client
+
+@pytest.mark.asyncio
+async def test_rate_governor_queues_requests_past_capacity():
+    governor = RateGovernor('test', 10, 1)
+    capacity = governor.bucket.capacity
+    
+    started = time.perf_counter()
+    for _ in range(int(capacity)):
+        await governor.acquire(1)
+    burst = time.perf_counter() - started
+    await governor.acquire(2)
+    
+    assert burst < 0.05
+    assert time.perf_counter() - started >= 2 / governor.bucket.rate * 0.9
+
+@pytest.mark.asyncio
+async def test_rate_governor_serves_interactive_requests_first():
+    governor = RateGovernor('test', 10, 1)
+    await governor.acquire(governor.bucket.capacity)
+    order = []
+    
+    async def request(name, priority):
+        await governor.acquire(2, priority)
+        order.append(name)
+    
+    async def background():
+        with request_priority(RequestPriority.BACKGROUND):
+            await request('background', None)
+    
+    background_task = asyncio.ensure_future(background())
+    await asyncio.sleep(0)
+    await asyncio.gather(request('interactive', RequestPriority.INTERACTIVE), background_task)
+    
+    assert order == ['interactive', 'background']
+
+@pytest.mark.asyncio
+async def test_rate_governor_follows_exchange_headers():
+    governor = BinanceRateGovernor()
+    
+    governor.observe(200, {'x-mbx-used-weight-1m': str(governor.LIMIT - 100)})
+    assert governor.bucket.tokens <= 100
+    
+    governor.observe(429, {'retry-after': '0.2'})
+    started = time.perf_counter()
+    await governor.acquire(1)
+    
+    assert time.perf_counter() - started >= 0.15
+
+def test_bybit_governor_pauses_on_ip_ban():
+    bybit = BybitRateGovernor()
+    binance = BinanceRateGovernor()
+    
+    bybit.observe(403, {})
+    binance.observe(403, {})
+    
+    assert bybit.bucket.time_until(1) > 0
+    assert binance.bucket.time_until(1) == 0
+
+@pytest.mark.asyncio
+async def test_interactive_request_does_not_join_background_fetch():
+    priorities = []
+    
+    async def handler(request):
+        priorities.append(get_request_priority())
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=BINANCE_KLINES)
+    
+    service = MarketDataService()
+    mock_client(service.binance_client, handler)
+    
+    async def background():
+        with request_priority(RequestPriority.BACKGROUND):
+            return await service.get_ohlcv("BTCUSDT", "1h", 2, "binance")
+    
+    background_task = asyncio.ensure_future(background())
+    await asyncio.sleep(0.01)
+    interactive = await service.get_ohlcv("BTCUSDT", "1h", 2, "binance")
+    await background_task
+    
+    assert priorities == [RequestPriority.BACKGROUND, RequestPriority.INTERACTIVE]
+    assert len(interactive) == 2
@@ -0,0 +1,43 @@
+import json
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from market_signal_service.core.serialization import json_dumps
+from market_signal_service.api.responses.fast_json_response import FastJSONResponse
+from market_signal_service.api.schemas.signal_response import SignalResponse
+from market_signal_service.domain.models.signal_result import SignalResult
+
+def test_json_dumps_converts_numpy_and_nan():
+    content = {
+        'price': np.float64(42.5),
+        'count': np.int64(3),
+        'flag': np.bool_(True),
+        'missing': np.float64('nan'),
+        'unbounded': float('inf'),
+        'series': np.array([1.0, np.nan]),
+        'at': pd.Timestamp('2024-01-01 12:00'),
+        1: 'non-string key'
+    }
+    
+    assert json.loads(json_dumps(content)) == {
+        'price': 42.5,
+        'count': 3,
+        'flag': True,
+        'missing': None,
+        'unbounded': None,
+        'series': [1.0, None],
+        'at': '2024-01-01T12:00:00',
+        '1': 'non-string key'
+    }
+
+def test_fast_json_response_matches_signal_response_schema():
+    result = SignalResult(
+        signal="BUY", score=0.5, strength_percent=50, trend="UPTREND", momentum="BULLISH",
+        strength="STRONG", structure="CHOPPY", symbol="BTCUSDT", timeframe="1h", exchange="binance",
+        timestamp=datetime(2024, 1, 1), indicators={'trend_details': {'ma50': np.float64(1.5), 'ma200': np.float64('nan')}}
+    )
+    
+    body = json.loads(FastJSONResponse(SignalResponse.payload(result)).body)
+    
+    assert body == json.loads(SignalResponse.from_signal_result(result).json().replace('NaN', 'null'))
+    assert body['details']['indicators']['trend_details'] == {'ma50': 1.5, 'ma200': None}
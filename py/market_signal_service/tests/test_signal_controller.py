@@ -0,0 +1,80 @@
+import json
+import pytest
+from fastapi import HTTPException
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+from market_signal_service.api.controllers.signal_controller import SignalController
+from market_signal_service.api.schemas.signal_request import BatchSignalItem
+from market_signal_service.core.exceptions import ExchangeError
+
+@pytest.fixture
+def mock_market_data():
+    dates = pd.date_range(start='2024-01-01', periods=300, freq='1h')
+    return pd.DataFrame({
+        'timestamp': dates,
+        'open': np.linspace(40000, 50000, 300),
+        'high': np.linspace(40500, 50500, 300),
+        'low': np.linspace(39500, 49500, 300),
+        'close': np.linspace(40000, 50000, 300),
+        'volume': np.random.uniform(100, 1000, 300)
+    })
+
+@pytest.mark.asyncio
+async def test_get_signals_batch_returns_per_item_errors(mock_market_data):
+    controller = SignalController()
+    
+    async def get_ohlcv(symbol, timeframe, limit, exchange):
+        if exchange == "kucoin":
+            raise ExchangeError("KuCoin unavailable")
+        return mock_market_data
+    
+    with patch.object(controller.signal_service.market_data_service, 'get_ohlcv', side_effect=get_ohlcv):
+        response = await controller.get_signals_batch([
+            BatchSignalItem(symbol="btcusdt"),
+            BatchSignalItem(symbol="ETHUSDT", timeframe="invalid"),
+            BatchSignalItem(symbol="SOL-USDT", exchange="kucoin")
+        ])
+    
+    assert response['count'] == 3
+    assert response['errors'] == 2
+    assert [result['status'] for result in response['results']] == [200, 400, 503]
+    assert response['results'][0]['symbol'] == "BTCUSDT"
+    assert response['results'][0]['result']['signal'] in ["BUY", "SELL", "HOLD"]
+
+@pytest.mark.asyncio
+async def test_get_multi_timeframe_signal_rejects_invalid_timeframes():
+    controller = SignalController()
+    
+    with pytest.raises(HTTPException) as error:
+        await controller.get_multi_timeframe_signal("BTCUSDT", "1h,2d", "binance")
+    
+    assert error.value.status_code == 400
+
+@pytest.mark.asyncio
+async def test_get_multi_timeframe_signal_returns_per_timeframe_results(mock_market_data):
+    controller = SignalController()
+    
+    with patch.object(controller.signal_service.market_data_service, 'get_ohlcv', return_value=mock_market_data):
+        response = await controller.get_multi_timeframe_signal("btcusdt", "1h, 4h", "binance")
+    
+    assert response['symbol'] == "BTCUSDT"
+    assert list(response['results']) == ["1h", "4h"]
+    assert response['results']['4h']['timeframe'] == "4h"
+
+@pytest.mark.asyncio
+async def test_open_signal_stream_validates_and_formats_events(mock_market_data):
+    controller = SignalController()
+    
+    with pytest.raises(HTTPException) as error:
+        controller.open_signal_stream("BTCUSDT:2d")
+    assert error.value.status_code == 400
+    
+    with patch.object(controller.signal_service.market_data_service, 'get_ohlcv', return_value=mock_market_data):
+        events = controller.open_signal_stream("btcusdt:4h, BTCUSDT:4h:binance")
+        event = await events.__anext__()
+        await events.aclose()
+    
+    assert event.startswith(b"event: signal\ndata: {") and event.endswith(b"\n\n")
+    assert json.loads(event.split(b"data: ", 1)[1])['timeframe'] == "4h"
+    await controller.close()
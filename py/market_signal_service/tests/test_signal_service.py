@@ -1,8 +1,12 @@
+import asyncio
+import time
 import pytest
 from unittest.mock import Mock, patch
 import pandas as pd
 import numpy as np
 from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.core.exceptions import NoDataError
+from market_signal_service.tests.exchange_stubs import binance_interval_handler, mock_client
 
 @pytest.fixture
 def mock_market_data():
@@ -39,3 +43,124 @@ async def test_signal_service_different_exchanges(mock_market_data):
         with patch.object(service.market_data_service, 'get_ohlcv', return_value=mock_market_data):
             result = await service.get_market_signal("BTCUSDT", "1h", exchange)
             assert result.exchange == exchange
+
+@pytest.mark.asyncio
+async def test_signal_service_get_market_signals_reports_failures(mock_market_data):
+    service = SignalService()
+    
+    async def get_ohlcv(symbol, timeframe, limit, exchange):
+        if symbol == "MISSINGUSDT":
+            raise NoDataError("No data")
+        return mock_market_data
+    
+    with patch.object(service.market_data_service, 'get_ohlcv', side_effect=get_ohlcv):
+        results = await service.get_market_signals([
+            {'symbol': "BTCUSDT", 'timeframe': "1h", 'exchange': "binance"},
+            {'symbol': "MISSINGUSDT", 'timeframe': "1h", 'exchange': "binance"},
+            {'symbol': "ETHUSDT", 'timeframe': "4h", 'exchange': "bybit"}
+        ], max_concurrency=2)
+    
+    assert results[0].symbol == "BTCUSDT"
+    assert isinstance(results[1], NoDataError)
+    assert results[2].timeframe == "4h"
+
+@pytest.mark.asyncio
+async def test_signal_service_reuses_result_until_new_candle_closes(mock_market_data):
+    service = SignalService()
+    
+    with patch.object(service.market_data_service, 'get_ohlcv', return_value=mock_market_data), \
+         patch.object(service.decision_engine, 'analyze', wraps=service.decision_engine.analyze) as analyze:
+        first = await service.get_market_signal("BTCUSDT", "1h", "binance")
+        second = await service.get_market_signal("BTCUSDT", "1h", "binance")
+        
+        assert second is first
+        assert analyze.call_count == 1
+        
+        next_candle = mock_market_data.tail(1).assign(timestamp=mock_market_data['timestamp'].iloc[-1] + pd.Timedelta(hours=1))
+        service.market_data_service.get_ohlcv.return_value = pd.concat([mock_market_data.iloc[1:], next_candle], ignore_index=True)
+        await service.get_market_signal("BTCUSDT", "1h", "binance")
+        
+        assert analyze.call_count == 2
+    
+    assert service.get_cache_stats()['signals']['hits'] == 1
+
+@pytest.mark.asyncio
+async def test_signal_service_ignores_forming_candle_updates(mock_market_data):
+    service = SignalService()
+    now = pd.Timestamp.utcnow().floor('1h').tz_localize(None)
+    data = mock_market_data.assign(timestamp=pd.date_range(end=now, periods=300, freq='1h'))
+    forming = data.copy()
+    forming.loc[forming.index[-1], 'close'] += 100
+    
+    with patch.object(service.market_data_service, 'get_ohlcv', side_effect=[data, forming]), \
+         patch.object(service.decision_engine, 'analyze', wraps=service.decision_engine.analyze) as analyze:
+        await service.get_market_signal("BTCUSDT", "1h", "binance")
+        await service.get_market_signal("BTCUSDT", "1h", "binance")
+    
+    assert analyze.call_count == 1
+
+@pytest.mark.asyncio
+async def test_signal_service_get_multi_timeframe_signal(mock_market_data):
+    service = SignalService()
+    requested = []
+    
+    async def get_ohlcv(symbol, timeframe, limit, exchange):
+        requested.append(timeframe)
+        return mock_market_data
+    
+    with patch.object(service.market_data_service, 'get_ohlcv', side_effect=get_ohlcv):
+        result = await service.get_multi_timeframe_signal("BTCUSDT", ["1d", "15m", "4h", "1h"], "binance")
+    
+    assert requested[0] == "15m"
+    assert result.timeframes == ["15m", "1h", "4h", "1d"]
+    assert set(result.results) == set(result.timeframes)
+    assert sum(result.weights.values()) == pytest.approx(1.0)
+    assert result.weights["1d"] > result.weights["4h"] > result.weights["1h"] > result.weights["15m"]
+    expected = sum(result.results[timeframe].score * weight for timeframe, weight in result.weights.items())
+    assert result.score == pytest.approx(expected, abs=1e-3)
+    assert result.signal in ["BUY", "SELL", "HOLD"]
+
+@pytest.mark.asyncio
+async def test_signal_service_multi_timeframe_derives_within_one_base_page():
+    service = SignalService()
+    calls = []
+    mock_client(service.market_data_service.binance_client, binance_interval_handler(calls))
+    
+    result = await service.get_multi_timeframe_signal("BTCUSDT", ["4h", "15m", "1h"], "binance", limit=200)
+    
+    assert sorted(calls) == [('15m', 804), ('4h', 200)]
+    assert result.timeframes == ["15m", "1h", "4h"]
+    assert all(result.results[timeframe].timeframe == timeframe for timeframe in result.timeframes)
+
+@pytest.mark.asyncio
+async def test_signal_service_consensus_survives_slow_exchange(mock_market_data):
+    service = SignalService()
+    
+    async def get_ohlcv(symbol, timeframe, limit, exchange):
+        if exchange == "kucoin":
+            await asyncio.sleep(5)
+        return mock_market_data
+    
+    started = time.perf_counter()
+    with patch.object(service.market_data_service, 'get_ohlcv', side_effect=get_ohlcv), \
+            patch.object(service.settings, 'CONSENSUS_TIMEOUT', 0.2):
+        result = await service.get_consensus_signal("BTCUSDT", "1h", ["binance", "bybit", "kucoin"])
+    
+    assert time.perf_counter() - started < 1
+    assert result.exchanges == ["binance", "bybit"]
+    assert "kucoin" in result.errors
+    assert result.agreement == 1.0
+    assert result.weights == {"binance": 0.5, "bybit": 0.5}
+    assert result.score == result.results["binance"].score
+
+@pytest.mark.asyncio
+async def test_signal_service_consensus_composite_mode(mock_market_data):
+    service = SignalService()
+    
+    with patch.object(service.market_data_service, 'get_ohlcv', return_value=mock_market_data):
+        result = await service.get_consensus_signal("BTCUSDT", "1h", ["binance", "bybit"], mode="composite")
+    
+    assert list(result.results) == ["composite"]
+    assert result.results["composite"].exchange == "composite"
+    assert result.agreement is None
+    assert result.signal == result.results["composite"].signal
@@ -0,0 +1,76 @@
+import asyncio
+import itertools
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.domain.services.signal_stream_service import SignalStreamService
+from market_signal_service.domain.models.signal_result import SignalResult
+
+def make_result(symbol: str, score: float) -> SignalResult:
+    return SignalResult(
+        signal="BUY" if score >= 0.3 else "HOLD", score=score, strength_percent=int(score * 100),
+        trend="UPTREND", momentum="BULLISH", strength="STRONG", structure="CHOPPY",
+        symbol=symbol, timeframe="1h", exchange="binance", timestamp=datetime.utcnow()
+    )
+
+async def next_event(stream):
+    return await asyncio.wait_for(stream.__anext__(), timeout=1)
+
+@pytest.mark.asyncio
+async def test_stream_shares_one_refresh_per_key_and_pushes_only_changes(monkeypatch):
+    service = SignalService()
+    streams = SignalStreamService(service)
+    monkeypatch.setattr(streams.settings, 'STREAM_RETRY_INTERVAL', 0)
+    scores = itertools.chain([0.5, 0.5], itertools.repeat(0.1))
+    calls = []
+    
+    async def get_market_signal(symbol, timeframe, exchange, limit):
+        calls.append(symbol)
+        await asyncio.sleep(0)
+        return make_result(symbol, next(scores))
+    
+    key = ("binance", "BTCUSDT", "1h", 300)
+    
+    with patch.object(service, 'get_market_signal', side_effect=get_market_signal), \
+         patch("market_signal_service.domain.services.signal_stream_service.seconds_until_candle_close", return_value=-10):
+        first = streams.stream([key])
+        second = streams.stream([key])
+        
+        first_event = await next_event(first)
+        second_event = await next_event(second)
+        assert first_event[1].score == second_event[1].score == 0.5
+        
+        changed = await next_event(first)
+        assert changed[1].score == 0.1
+        assert (await next_event(second))[1].score == 0.1
+        assert streams.subscriber_count(key) == 2
+        
+        await first.aclose()
+        await second.aclose()
+    
+    assert streams.subscriber_count(key) == 0
+    assert key not in streams._tasks
+    assert calls.count("BTCUSDT") >= 3
+
+@pytest.mark.asyncio
+async def test_stream_emits_heartbeats_and_replays_latest_result():
+    service = SignalService()
+    streams = SignalStreamService(service)
+    key = ("binance", "ETHUSDT", "1h", 300)
+    
+    async def get_market_signal(symbol, timeframe, exchange, limit):
+        return make_result(symbol, 0.5)
+    
+    with patch.object(service, 'get_market_signal', side_effect=get_market_signal):
+        first = streams.stream([key], heartbeat=0.01)
+        assert (await next_event(first))[1].symbol == "ETHUSDT"
+        assert await next_event(first) is None
+        
+        late = streams.stream([key])
+        assert (await next_event(late))[1].symbol == "ETHUSDT"
+        
+        await first.aclose()
+        await late.aclose()
+    
+    await streams.close()
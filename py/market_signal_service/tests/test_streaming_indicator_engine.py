@@ -0,0 +1,54 @@
+import pytest
+import pandas as pd
+import numpy as np
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
+from market_signal_service.domain.engine.streaming.streaming_indicator_engine import StreamingIndicatorEngine
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(7)
+    close = 40000 + np.cumsum(rng.normal(0, 200, 500))
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start='2024-01-01', periods=500, freq='1h'),
+        'open': close + rng.normal(0, 50, 500),
+        'high': close + np.abs(rng.normal(0, 150, 500)),
+        'low': close - np.abs(rng.normal(0, 150, 500)),
+        'close': close,
+        'volume': rng.uniform(100, 1000, 500)
+    })
+
+def test_streaming_engine_matches_batch_indicators(sample_data):
+    engine = StreamingIndicatorEngine.from_dataframe(sample_data.head(400))
+    
+    for i in range(400, 500):
+        row = sample_data.iloc[i]
+        engine.append(row['timestamp'], row['open'], row['high'], row['low'], row['close'], row['volume'])
+        context = IndicatorContext(sample_data.iloc[i + 1 - 300:i + 1].reset_index(drop=True))
+        
+        assert engine.current_rsi() == pytest.approx(context.current_rsi())
+        assert engine.all_mas() == pytest.approx(context.all_mas())
+        assert engine.current_stoch() == pytest.approx(context.current_stoch())
+        assert engine.current_adx() == pytest.approx(context.current_adx())
+        assert engine.current_macd() == pytest.approx(context.current_macd(), rel=1e-4)
+        assert engine.swing_points() == context.swing_points()
+
+def test_streaming_engine_warmup_returns_nan():
+    engine = StreamingIndicatorEngine()
+    engine.append(None, 100, 101, 99, 100, 10)
+    
+    assert engine.all_mas() == {'ma50': None, 'ma200': None}
+    assert np.isnan(engine.current_adx()['adx'])
+    assert engine.swing_points() == {'swing_highs': [], 'swing_lows': []}
+
+def test_decision_engine_analyzes_streaming_state(sample_data):
+    engine = StreamingIndicatorEngine.from_dataframe(sample_data)
+    decision_engine = DecisionEngine()
+    
+    streamed = decision_engine.analyze(engine, "BTCUSDT", "1h", "binance")
+    batch = decision_engine.analyze(sample_data.tail(300).reset_index(drop=True), "BTCUSDT", "1h", "binance")
+    
+    assert streamed.signal == batch.signal
+    assert streamed.score == batch.score
+    assert streamed.trend == batch.trend
+    assert streamed.structure == batch.structure
@@ -0,0 +1,46 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import patch
+from market_signal_service.core.timeframes import get_candle_open_time, get_next_candle_open_time, seconds_until_candle_close
+from market_signal_service.infrastructure.market_data.market_data_service import MarketDataService
+
+def utc(*args) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+@pytest.mark.parametrize("timeframe,now,expected_open,expected_next", [
+    ('1m', utc(2024, 3, 5, 10, 7, 30), utc(2024, 3, 5, 10, 7), utc(2024, 3, 5, 10, 8)),
+    ('15m', utc(2024, 3, 5, 10, 7, 30), utc(2024, 3, 5, 10, 0), utc(2024, 3, 5, 10, 15)),
+    ('4h', utc(2024, 3, 5, 10, 7, 30), utc(2024, 3, 5, 8), utc(2024, 3, 5, 12)),
+    ('1d', utc(2024, 3, 5, 10, 7, 30), utc(2024, 3, 5), utc(2024, 3, 6)),
+    ('1w', utc(2024, 3, 7, 10), utc(2024, 3, 4), utc(2024, 3, 11)),
+    ('1M', utc(2024, 12, 15), utc(2024, 12, 1), utc(2025, 1, 1))
+])
+def test_candle_boundaries(timeframe, now, expected_open, expected_next):
+    assert get_candle_open_time(timeframe, now) == expected_open
+    assert get_next_candle_open_time(timeframe, now) == expected_next
+    assert seconds_until_candle_close(timeframe, now) == expected_next - now
+
+def test_cache_ttl_expires_at_candle_close():
+    service = MarketDataService()
+    now = utc(2024, 3, 5, 10, 7, 30)
+    
+    with patch("market_signal_service.core.timeframes.time.time", return_value=now):
+        ttl_1h = service.get_cache_ttl('1h')
+        ttl_1d = service.get_cache_ttl('1d')
+    
+    grace = service.settings.CACHE_CANDLE_CLOSE_GRACE
+    jitter = service.settings.CACHE_TTL_JITTER
+    assert 52.5 * 60 + grace <= ttl_1h <= 52.5 * 60 + grace + jitter
+    assert ttl_1d > 13 * 3600
+
+def test_cache_ttl_caps_forming_candle(monkeypatch):
+    service = MarketDataService()
+    monkeypatch.setattr(service.settings, 'CACHE_FORMING_CANDLE_TTL', 5)
+    
+    assert service.get_cache_ttl('1d') == 5
+
+def test_cache_ttl_uses_flat_ttl_when_alignment_disabled(monkeypatch):
+    service = MarketDataService()
+    monkeypatch.setattr(service.settings, 'CACHE_ALIGN_TO_CANDLE_CLOSE', False)
+    
+    assert service.get_cache_ttl('1d') == service.settings.CACHE_TTL
@@ -0,0 +1,84 @@
+import itertools
+import json
+import pytest
+import pandas as pd
+import numpy as np
+from market_signal_service.domain.engine.scoring.scoring_engine import ScoringEngine
+from market_signal_service.domain.engine.scoring.weight_calibrator import WeightCalibrator
+
+@pytest.fixture
+def restore_scoring_engine():
+    weights = ScoringEngine.WEIGHTS
+    thresholds = (ScoringEngine.BUY_THRESHOLD, ScoringEngine.SELL_THRESHOLD)
+    yield
+    ScoringEngine.WEIGHTS = weights
+    ScoringEngine.BUY_THRESHOLD, ScoringEngine.SELL_THRESHOLD = thresholds
+
+def sample_history(seed: int, rows: int = 600) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=rows, freq='1h'),
+        'open': close,
+        'high': close * 1.005,
+        'low': close * 0.995,
+        'close': close,
+        'volume': rng.uniform(100, 1000, rows)
+    })
+
+def test_state_scores_match_scoring_engine(restore_scoring_engine):
+    weights = np.array([[0.35, 0.30, 0.20, 0.15], [0.1, 0.5, 0.3, 0.1]])
+    scores = WeightCalibrator.state_scores_for_weights(weights)
+    states = list(itertools.product(*(list(scores_map) for _, scores_map in WeightCalibrator.COMPONENTS)))
+    
+    assert scores.shape == (2, WeightCalibrator.state_count())
+    
+    for row, weight_set in enumerate(weights):
+        ScoringEngine.WEIGHTS = dict(zip(('trend', 'momentum', 'strength', 'structure'), weight_set))
+        expected = [ScoringEngine.calculate_score(*state) for state in states]
+        assert np.allclose(scores[row], expected, atol=1e-3)
+
+def test_weight_grid_sums_to_one():
+    grid = WeightCalibrator.weight_grid(0.25)
+    
+    assert len(grid) == 35
+    assert np.allclose(grid.sum(axis=1), 1.0)
+
+def test_calibrate_returns_valid_profile():
+    profile = WeightCalibrator.calibrate(
+        [sample_history(1), sample_history(2)],
+        weight_step=0.25,
+        objective='return',
+        min_trade_ratio=0.01,
+        workers=1
+    )
+    
+    assert set(profile['weights']) == set(ScoringEngine.WEIGHTS)
+    assert sum(profile['weights'].values()) == pytest.approx(1.0)
+    assert profile['sell_threshold'] < profile['buy_threshold']
+    assert profile['metrics']['trade_ratio'] >= 0.01
+
+def test_calibrate_rejects_unknown_objective():
+    with pytest.raises(ValueError):
+        WeightCalibrator.calibrate([sample_history(1)], objective='profit')
+
+def test_load_profile_applies_weights_and_thresholds(tmp_path, restore_scoring_engine):
+    path = tmp_path / "profile.json"
+    path.write_text(json.dumps({
+        'weights': {'trend': 0.5, 'momentum': 0.2, 'strength': 0.2, 'structure': 0.1},
+        'buy_threshold': 0.4,
+        'sell_threshold': -0.3
+    }))
+    
+    ScoringEngine.load_profile(str(path))
+    
+    assert ScoringEngine.WEIGHTS['trend'] == 0.5
+    assert ScoringEngine.BUY_THRESHOLD == 0.4
+    assert ScoringEngine.SELL_THRESHOLD == -0.3
+
+def test_apply_profile_rejects_invalid_profile(restore_scoring_engine):
+    with pytest.raises(ValueError):
+        ScoringEngine.apply_profile({'weights': {'volume': 0.5}})
+    
+    with pytest.raises(ValueError):
+        ScoringEngine.apply_profile({'buy_threshold': -0.2, 'sell_threshold': 0.2})
@@ -1,14 +1,58 @@
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from market_signal_service.api.controllers.signal_controller import SignalController
+from market_signal_service.api.schemas.signal_request import BatchSignalRequest
+from market_signal_service.api.responses.fast_json_response import FastJSONResponse
 router = APIRouter(tags=["signals"])
 
 signal_controller = SignalController()
 
-@router.get("/signals")
+@router.on_event("startup")
+async def start_signal_controller():
+    signal_controller.start()
+
+@router.on_event("shutdown")
+async def close_signal_controller():
+    await signal_controller.close()
+
+@router.get("/signals", response_class=FastJSONResponse)
 async def get_signal(
     symbol: str,
     timeframe: str = "1h",
     exchange: str = "binance"
 ):
-    return await signal_controller.get_signal(symbol, timeframe, exchange)
+    return FastJSONResponse(await signal_controller.get_signal(symbol, timeframe, exchange))
+
+@router.post("/signals/batch", response_class=FastJSONResponse)
+async def get_signals_batch(request: BatchSignalRequest):
+    return FastJSONResponse(await signal_controller.get_signals_batch(request.items))
+
+@router.get("/signals/mtf", response_class=FastJSONResponse)
+async def get_multi_timeframe_signal(
+    symbol: str,
+    timeframes: str = "15m,1h,4h,1d",
+    exchange: str = "binance"
+):
+    return FastJSONResponse(await signal_controller.get_multi_timeframe_signal(symbol, timeframes, exchange))
+
+@router.get("/signals/consensus", response_class=FastJSONResponse)
+async def get_consensus_signal(
+    symbol: str,
+    timeframe: str = "1h",
+    exchanges: str = "binance,bybit,kucoin",
+    mode: str = "exchanges"
+):
+    return FastJSONResponse(await signal_controller.get_consensus_signal(symbol, timeframe, exchanges, mode))
+
+@router.get("/signals/stream")
+async def stream_signals(subscriptions: str):
+    events = signal_controller.open_signal_stream(subscriptions)
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
+@router.get("/signals/cache/stats")
+async def get_cache_stats():
+    return signal_controller.get_cache_stats()